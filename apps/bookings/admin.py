@@ -1,6 +1,9 @@
 from django.urls import path
 from django.http import HttpResponse, JsonResponse
+from django.core.exceptions import PermissionDenied
+from django.template.response import TemplateResponse
 from django.contrib import admin, messages
+from django.contrib.admin.views.main import ChangeList, ORDER_VAR, PAGE_VAR
 from django.forms import SplitDateTimeWidget
 from django.db import models
 from django.db.models import Q
@@ -14,12 +17,102 @@ admin.site.index_title = "MindSettler Dashboard"
 
 from .models import Booking
 from apps.bookings.services import approve_booking, reject_booking
+from apps.bookings.services.facets import (
+    UNCOUNTED_STATUSES,
+    get_facet_counts,
+    visible_booking_count,
+)
+from apps.bookings.services.exports import export_response
+from apps.bookings.services.rollups import build_dashboard
+from apps.bookings.services.search import search_bookings
+from apps.bookings.utils.pagination import EstimatedCountPaginator
 from apps.bookings.email import (
     send_booking_approved_email,
     send_booking_rejected_email,
 )
 
 
+class BookingChangeList(ChangeList):
+    """
+    Loads only the columns the list page renders.
+    Action querysets (cl.get_queryset) stay fully loaded.
+    """
+
+    def get_results(self, request):
+        self.queryset = self.queryset.only(*self.model_admin.list_only_fields)
+        super().get_results(request)
+
+
+# ─────────────────────────
+# FACET LIST FILTERS
+# ─────────────────────────
+def request_facet_counts(request):
+    # One query per request, shared by every facet filter and the
+    # changelist paginator
+    if not hasattr(request, "_booking_facet_counts"):
+        request._booking_facet_counts = get_facet_counts()
+    return request._booking_facet_counts
+
+
+class FacetCountFilter(admin.SimpleListFilter):
+    """
+    List filter whose options and counts come from BookingFacetCount.
+    Counts cover all admin-visible bookings, not the current filter.
+    Keeps the `<field>__exact` query parameter of the stock filter.
+    """
+
+    field = None
+
+    def __init__(self, request, params, model, model_admin):
+        self.parameter_name = f"{self.field}__exact"
+        super().__init__(request, params, model, model_admin)
+
+    def facet_counts(self, request):
+        return request_facet_counts(request).get(self.field, {})
+
+    def lookups(self, request, model_admin):
+        counts = self.facet_counts(request)
+        choices = Booking._meta.get_field(self.field).choices
+        return [
+            (value, f"{label} ({counts.get(value, 0)})")
+            for value, label in choices
+            if value not in UNCOUNTED_STATUSES
+        ]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(**{self.field: self.value()})
+        return queryset
+
+
+class StatusFacetFilter(FacetCountFilter):
+    title = "status"
+    field = "status"
+
+
+class ModeFacetFilter(FacetCountFilter):
+    title = "mode"
+    field = "mode"
+
+
+class PeriodFacetFilter(FacetCountFilter):
+    title = "preferred period"
+    field = "preferred_period"
+
+
+class CityFacetFilter(FacetCountFilter):
+    title = "city"
+    field = "city"
+
+    def lookups(self, request, model_admin):
+        counts = self.facet_counts(request)
+        return [
+            (city, f"{city} ({counts[city]})")
+            for city in sorted(counts)
+            if city
+        ]
+
+
 @admin.register(Booking)
 class BookingAdmin(admin.ModelAdmin):
 
@@ -41,9 +134,41 @@ class BookingAdmin(admin.ModelAdmin):
                 self.admin_site.admin_view(self.calendar_list_view),
                 name="booking-calendar-list",
             ),
+            path(
+                "dashboard/",
+                self.admin_site.admin_view(self.dashboard_view),
+                name="booking-dashboard",
+            ),
         ]
         return custom_urls + urls
 
+    # ─────────────────────────
+    # OPERATIONS DASHBOARD
+    # ─────────────────────────
+    DASHBOARD_WINDOWS = (7, 30, 90)
+
+    def dashboard_view(self, request):
+        if not self.has_view_permission(request):
+            raise PermissionDenied
+
+        try:
+            days = int(request.GET.get("days", 30))
+        except ValueError:
+            days = 30
+        if days not in self.DASHBOARD_WINDOWS:
+            days = 30
+
+        context = {
+            **self.admin_site.each_context(request),
+            "title": "Operations Dashboard",
+            "opts": self.model._meta,
+            "windows": self.DASHBOARD_WINDOWS,
+            **build_dashboard(days=days),
+        }
+        return TemplateResponse(
+            request, "admin/bookings/booking/dashboard.html", context
+        )
+
     def calendar_view(self, request):
         return HttpResponse("""
 <!DOCTYPE html>
@@ -399,6 +524,30 @@ class BookingAdmin(admin.ModelAdmin):
         # Hide unverified drafts
         return qs.exclude(status="DRAFT")
 
+    def get_search_results(self, request, queryset, search_term):
+        # search_fields only drives the search box; matching runs on
+        # the indexed search_text column instead of per-field icontains
+        return search_bookings(queryset, search_term), False
+
+    def get_changelist(self, request, **kwargs):
+        return BookingChangeList
+
+    def get_paginator(self, request, queryset, per_page, orphans=0,
+                      allow_empty_first_page=True):
+        # The status counters cover exactly the unfiltered list (drafts
+        # excluded); any filter/search parameter means a real COUNT(*)
+        unfiltered = set(request.GET) <= {PAGE_VAR, ORDER_VAR}
+        return EstimatedCountPaginator(
+            queryset,
+            per_page,
+            orphans=orphans,
+            allow_empty_first_page=allow_empty_first_page,
+            estimate=(
+                (lambda: visible_booking_count(request_facet_counts(request)))
+                if unfiltered else None
+            ),
+        )
+
     # ─────────────────────────
     # LIST VIEW
     # ─────────────────────────
@@ -416,12 +565,16 @@ class BookingAdmin(admin.ModelAdmin):
     )
 
     list_filter = (
-        "status",
-        "mode",
-        "preferred_period",
-        "city",
+        StatusFacetFilter,
+        ModeFacetFilter,
+        PeriodFacetFilter,
+        CityFacetFilter,
     )
 
+    # Counts come from the facet filters; the built-in facets would
+    # run one aggregate over the bookings table per filter
+    show_facets = admin.ShowFacets.NEVER
+
     search_fields = (
         "acknowledgement_id",
         "full_name",
@@ -430,8 +583,40 @@ class BookingAdmin(admin.ModelAdmin):
         "city",
     )
 
+    list_select_related = ("user", "psychologist", "corporate")
+
+    # Forms render only the selected object instead of a <select> of
+    # every user; options come from the prefix-search autocomplete
+    autocomplete_fields = ("user", "psychologist", "corporate")
+
+    # Columns loaded for list_display (plus related display fields)
+    list_only_fields = (
+        "id",
+        "acknowledgement_id",
+        "full_name",
+        "user__email",
+        "phone_number",
+        "city",
+        "status",
+        "preferred_date",
+        "preferred_period",
+        "mode",
+        "created_at",
+        "psychologist__full_name",
+        "psychologist__specialization",
+        "corporate__name",
+    )
+
+    # Skip the second, unfiltered COUNT(*) on every changelist page
+    show_full_result_count = False
+
     ordering = ("-created_at",)
-    actions = ["approve_bookings", "reject_bookings"]
+    actions = [
+        "approve_bookings",
+        "reject_bookings",
+        "export_csv",
+        "export_ndjson",
+    ]
 
     # ─────────────────────────
     # READ ONLY
@@ -653,6 +838,20 @@ class BookingAdmin(admin.ModelAdmin):
                     request,
                     f"{booking.acknowledgement_id}: {str(e)}"
                 )
+
+    # ─────────────────────────
+    # EXPORTS
+    # ─────────────────────────
+    # "Select all N" passes the whole filtered queryset; rows are
+    # streamed, never loaded at once.
+    @admin.action(description="Export selected bookings (CSV)")
+    def export_csv(self, request, queryset):
+        return export_response(queryset, output="csv")
+
+    @admin.action(description="Export selected bookings (NDJSON)")
+    def export_ndjson(self, request, queryset):
+        return export_response(queryset, output="ndjson")
+
     formfield_overrides = {
         models.DateTimeField: {
             "widget": SplitDateTimeWidget(
@@ -1,6 +1,30 @@
 from django.apps import AppConfig
+from django.db.models.signals import (
+    post_delete,
+    post_migrate,
+    post_save,
+    pre_delete,
+    pre_save,
+)
 
 
 class BookingsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
-    name = "apps.bookings"
\ No newline at end of file
+    name = "apps.bookings"
+
+    def ready(self):
+        from . import signals
+        from apps.users.models import AppUser
+
+        from .models import Booking
+
+        post_migrate.connect(signals.ensure_search_index, sender=self)
+
+        pre_save.connect(signals.capture_stored_values, sender=Booking)
+        post_save.connect(signals.booking_saved, sender=Booking)
+        post_save.connect(signals.remember_lookup_keys, sender=Booking)
+        pre_delete.connect(signals.capture_deleted_values, sender=Booking)
+        post_delete.connect(signals.booking_deleted, sender=Booking)
+
+        pre_save.connect(signals.capture_stored_email, sender=AppUser)
+        post_save.connect(signals.refresh_search_text, sender=AppUser)
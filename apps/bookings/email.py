@@ -1,12 +1,37 @@
-import uuid
+import base64
 from django.conf import settings
 from django.utils import timezone
 from datetime import timezone as dt_timezone
 from rest_framework.exceptions import ValidationError
 
-from sendgrid import SendGridAPIClient
-from sendgrid.helpers.mail import Mail
-from python_http_client.exceptions import ForbiddenError, UnauthorizedError
+from apps.bookings.utils.calendar import booking_ics
+from apps.bookings.utils.tokens import CANCEL, VERIFY_EMAIL, make_booking_token
+
+# sendgrid and python_http_client are imported on first use: most
+# requests never send mail, and workers boot without them.
+
+
+def _mail(**kwargs):
+    from sendgrid.helpers.mail import Mail
+
+    return Mail(**kwargs)
+
+
+def _attach_ics(message, content, filename):
+    from sendgrid.helpers.mail import (
+        Attachment,
+        Disposition,
+        FileContent,
+        FileName,
+        FileType,
+    )
+
+    message.add_attachment(Attachment(
+        FileContent(base64.b64encode(content.encode()).decode()),
+        FileName(filename),
+        FileType("text/calendar; method=PUBLISH"),
+        Disposition("attachment"),
+    ))
 
 
 def _send_email(message):
@@ -22,6 +47,9 @@ def _send_email(message):
         print("Email service misconfigured: SENDGRID_API_KEY missing")
         return False
 
+    from sendgrid import SendGridAPIClient
+    from python_http_client.exceptions import ForbiddenError, UnauthorizedError
+
     try:
         sg = SendGridAPIClient(api_key)
         sg.send(message)
@@ -36,13 +64,13 @@ def _send_email(message):
         return False
 
 
-def send_booking_verification_email(booking):
+def build_booking_verification_email(booking):
     verification_url = (
         f"{settings.FRONTEND_URL}/verify-email"
-        f"?token={booking.email_verification_token}"
+        f"?token={make_booking_token(booking.id, VERIFY_EMAIL)}"
     )
 
-    message = Mail(
+    message = _mail(
         from_email="MindSettler Support <{}>".format(settings.DEFAULT_FROM_EMAIL),
         to_emails=booking.user.email,
         subject="Verify your email for MindSettler",
@@ -96,25 +124,36 @@ support@mindsettler.in
 """,
     )
 
-    _send_email(message)
+    return message
+
+
+def send_booking_verification_email(booking):
+    _send_email(build_booking_verification_email(booking))
 
     booking.last_verification_email_sent_at = timezone.now()
     booking.save(update_fields=["last_verification_email_sent_at"])
 
+
+def send_booking_verification_emails(bookings):
+    """
+    Sends one verification email per booking (bulk imports). Returns
+    the ids delivered; the caller records them.
+    """
+    return [
+        booking.id for booking in bookings
+        if _send_email(build_booking_verification_email(booking))
+    ]
+
 def send_cancellation_verification_email(booking):
-    booking.cancellation_token = uuid.uuid4()
     booking.cancellation_requested_at = timezone.now()
-    booking.save(update_fields=[
-        "cancellation_token",
-        "cancellation_requested_at",
-    ])
+    booking.save(update_fields=["cancellation_requested_at"])
 
     cancel_url = (
         f"{settings.FRONTEND_URL}/verify-cancellation"
-        f"?token={booking.cancellation_token}"
+        f"?token={make_booking_token(booking.id, CANCEL)}"
     )
 
-    message = Mail(
+    message = _mail(
         from_email="MindSettler Support <{}>".format(settings.DEFAULT_FROM_EMAIL),
         to_emails=booking.user.email,
         subject="Confirm cancellation request – MindSettler",
@@ -189,7 +228,7 @@ def send_booking_approved_email(booking):
     if booking.approval_email_sent:
         return
 
-    message = Mail(
+    message = _mail(
         from_email="MindSettler Support <{}>".format(settings.DEFAULT_FROM_EMAIL),
         to_emails=booking.user.email,
         subject="Your MindSettler session has been approved",
@@ -234,11 +273,8 @@ def send_booking_approved_email(booking):
 def send_booking_confirmed_email(booking):
     """
     Sends confirmation email after successful payment.
-    Must be sent exactly once.
+    Sent once, after commit: see payments._announce_confirmation.
     """
-    if getattr(booking, "confirmation_email_sent", False):
-        return
-
     appointment_date = booking.approved_slot_start.strftime("%A, %d %B %Y")
     appointment_time = (
         f"{booking.approved_slot_start.strftime('%I:%M %p')} – "
@@ -255,7 +291,7 @@ def send_booking_confirmed_email(booking):
         f"&details=MindSettler+session+({booking.mode})"
     )
 
-    message = Mail(
+    message = _mail(
         from_email="MindSettler Support <{}>".format(settings.DEFAULT_FROM_EMAIL),
         to_emails=booking.user.email,
         subject="Your MindSettler session is confirmed 🌿",
@@ -317,11 +353,69 @@ def send_booking_confirmed_email(booking):
         </div>
         """,
     )
+    # Any calendar app, not just Google, can import the session
+    _attach_ics(
+        message, booking_ics(booking), f"{booking.acknowledgement_id}.ics"
+    )
 
     _send_email(message)
 
-    booking.confirmation_email_sent = True
-    booking.save(update_fields=["confirmation_email_sent"])
+
+def build_session_reminder_email(booking):
+    start = timezone.localtime(booking.approved_slot_start)
+    end = timezone.localtime(booking.approved_slot_end)
+    appointment_date = start.strftime("%A, %d %B %Y")
+    appointment_time = (
+        f"{start.strftime('%I:%M %p')} – {end.strftime('%I:%M %p')}"
+    )
+
+    return _mail(
+        from_email="MindSettler Support <{}>".format(settings.DEFAULT_FROM_EMAIL),
+        to_emails=booking.user.email,
+        subject=f"Reminder: your MindSettler session on {start.strftime('%d %B')}",
+        html_content=f"""
+        <div style="font-family:Arial,sans-serif;max-width:600px;margin:auto;color:#333;line-height:1.6;">
+            <h2 style="color:#453859;">Your session is coming up 🌿</h2>
+
+            <p>Hello,</p>
+
+            <p>This is a reminder of your upcoming MindSettler session.</p>
+
+            <table style="border-collapse:collapse;">
+                <tr><td><strong>Booking ID</strong></td><td>{booking.acknowledgement_id}</td></tr>
+                <tr><td><strong>Date</strong></td><td>{appointment_date}</td></tr>
+                <tr><td><strong>Time</strong></td><td>{appointment_time}</td></tr>
+                <tr><td><strong>Mode</strong></td><td>{booking.mode}</td></tr>
+            </table>
+
+            <p style="margin-top:24px;">
+                If you can no longer attend, please reach out to us at
+                <a href="mailto:support@mindsettler.in">support@mindsettler.in</a>.
+            </p>
+
+            <br />
+            <p>
+                Warm regards,<br />
+                <strong>MindSettler Team</strong>
+            </p>
+
+            <p style="font-size:12px;color:#777;">
+              This is a transactional email related to your MindSettler booking.
+            </p>
+        </div>
+        """,
+    )
+
+
+def send_session_reminder_emails(bookings):
+    """
+    Sends one reminder per booking. Returns the ids delivered; the
+    caller decides what to do with the rest.
+    """
+    return [
+        booking.id for booking in bookings
+        if _send_email(build_session_reminder_email(booking))
+    ]
 
 
 def send_booking_rejected_email(booking):
@@ -331,7 +425,7 @@ def send_booking_rejected_email(booking):
     if booking.rejection_email_sent:
         return
 
-    message = Mail(
+    message = _mail(
         from_email="MindSettler Support <{}>".format(settings.DEFAULT_FROM_EMAIL),
         to_emails=booking.user.email,
         subject="Update on your MindSettler booking",
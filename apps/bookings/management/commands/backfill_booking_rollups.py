@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from apps.bookings.services.rollups import rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the dashboard's daily rollups and psychologist loads "
+        "from booking timestamps. Needed once after deploying, and after "
+        "bulk writes that bypass model signals."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, **options):
+        days = rebuild_rollups(using=options["database"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt booking rollups for {days} days."
+        ))
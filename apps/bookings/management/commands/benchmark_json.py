@@ -0,0 +1,120 @@
+import io
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from apps.bookings.serializers.fast import FastBookingPublicSerializer
+from apps.bookings.utils.samples import build_sample_bookings
+from apps.core.parsers import FastJSONParser
+from apps.core.renderers import FastJSONRenderer, orjson
+
+# Raw model values, so the encoders see Decimal / UUID / datetime / date
+# / time themselves
+NATIVE_FIELDS = (
+    "id",
+    "acknowledgement_id",
+    "status",
+    "full_name",
+    "city",
+    "preferred_date",
+    "preferred_time_start",
+    "approved_slot_start",
+    "approved_slot_end",
+    "amount",
+    "email_verification_token",
+    "created_at",
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare DRF's JSON renderer/parser with apps.core's fast ones on "
+        "booking payloads: checks the bytes match and reports timings. "
+        "Works on in-memory bookings; the database is not touched."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=2000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=7)
+
+    def payloads(self, bookings):
+        serializer = FastBookingPublicSerializer()
+        statuses = []
+        for booking in bookings:
+            data = serializer.to_representation(
+                tuple(getattr(booking, c) for c in serializer.columns)
+            )
+            data["timeline"] = ["DRAFT", "PENDING"]
+            data["amount"] = str(booking.amount) if booking.amount else None
+            statuses.append(data)
+
+        return {
+            "status payloads": {"results": statuses},
+            "native values": [
+                {field: getattr(booking, field) for field in NATIVE_FIELDS}
+                for booking in bookings
+            ],
+        }
+
+    def best_of(self, repeat, func):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = func()
+            timings.append(time.perf_counter() - started)
+        return min(timings), result
+
+    def compare(self, label, repeat, baseline, fast):
+        base_time, base_result = self.best_of(repeat, baseline)
+        fast_time, fast_result = self.best_of(repeat, fast)
+
+        if base_result != fast_result:
+            raise CommandError(f"{label}: fast output differs from DRF")
+
+        self.stdout.write(
+            f"  {label:<28} DRF {base_time * 1000:8.1f} ms   "
+            f"fast {fast_time * 1000:8.1f} ms   "
+            f"{base_time / fast_time:5.1f}x"
+        )
+
+    def handle(self, *args, **options):
+        if options["rows"] < 1:
+            raise CommandError("--rows must be at least 1")
+
+        if orjson is None:
+            self.stdout.write(self.style.WARNING(
+                "orjson is not installed: the fast classes fall back to "
+                "stdlib json, so expect no speedup."
+            ))
+
+        rng = random.Random(options["seed"])
+        bookings = build_sample_bookings(options["rows"], rng)
+        repeat = options["repeat"]
+
+        drf_renderer, fast_renderer = JSONRenderer(), FastJSONRenderer()
+        drf_parser, fast_parser = JSONParser(), FastJSONParser()
+
+        self.stdout.write(f"{options['rows']} rows, best of {repeat}")
+        for name, data in self.payloads(bookings).items():
+            self.compare(
+                f"render {name}",
+                repeat,
+                lambda: drf_renderer.render(data),
+                lambda: fast_renderer.render(data),
+            )
+
+            body = drf_renderer.render(data)
+            self.compare(
+                f"parse {name}",
+                repeat,
+                lambda: drf_parser.parse(io.BytesIO(body)),
+                lambda: fast_parser.parse(io.BytesIO(body)),
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            "Rendered bytes and parsed data identical."
+        ))
@@ -0,0 +1,68 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from apps.bookings.serializers.fast import FastBookingPublicSerializer
+from apps.bookings.serializers.public import BookingPublicSerializer
+from apps.bookings.utils.samples import build_sample_bookings
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare BookingPublicSerializer with the values()-based fast path: "
+        "checks the rendered JSON is byte-identical and reports the speedup. "
+        "Works on in-memory bookings; the database is not touched."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=2000)
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument("--seed", type=int, default=7)
+
+    def best_of(self, repeat, func):
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = func()
+            timings.append(time.perf_counter() - started)
+        return min(timings), result
+
+    def handle(self, *args, **options):
+        rows_count = options["rows"]
+        if rows_count < 1:
+            raise CommandError("--rows must be at least 1")
+
+        rng = random.Random(options["seed"])
+        bookings = build_sample_bookings(rows_count, rng)
+        columns = FastBookingPublicSerializer.columns
+        # What values_list(*columns) would return for the same bookings
+        rows = [
+            tuple(getattr(booking, column) for column in columns)
+            for booking in bookings
+        ]
+        renderer = JSONRenderer()
+
+        drf_time, drf_data = self.best_of(
+            options["repeat"],
+            lambda: BookingPublicSerializer(bookings, many=True).data,
+        )
+        fast_time, fast_data = self.best_of(
+            options["repeat"],
+            lambda: FastBookingPublicSerializer().serialize(rows),
+        )
+
+        if renderer.render(drf_data) != renderer.render(fast_data):
+            raise CommandError("Fast serializer output differs from DRF")
+
+        self.stdout.write(
+            f"{rows_count} rows, best of {options['repeat']}\n"
+            f"  BookingPublicSerializer      {drf_time * 1000:8.1f} ms"
+            f"  ({drf_time / rows_count * 1e6:.1f} µs/row)\n"
+            f"  FastBookingPublicSerializer  {fast_time * 1000:8.1f} ms"
+            f"  ({fast_time / rows_count * 1e6:.1f} µs/row)"
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Output byte-identical; {drf_time / fast_time:.1f}x faster."
+        ))
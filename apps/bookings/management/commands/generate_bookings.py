@@ -0,0 +1,439 @@
+import random
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, time as dt_time, timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.bookings.models import Booking
+from apps.bookings.services.facets import rebuild_facet_counts
+from apps.bookings.services.lookup_filter import rebuild_lookup_filter
+from apps.bookings.services.rollups import rebuild_rollups
+from apps.users.models import AppUser
+from apps.psychologists.models import Psychologist
+from apps.corporates.models import Corporate
+from apps.corporates.services.usage import rebuild_usage
+from apps.bookings.utils.search import normalize_search_text
+
+
+# ─────────────────────────
+# CONFIG
+# ─────────────────────────
+SYNTHETIC_DOMAIN = "synthetic.mindsettler.in"
+
+# Generated history ends here unless --now says otherwise, so the same
+# seed gives the same rows whenever the command runs
+DEFAULT_NOW = "2026-01-01T00:00:00+00:00"
+
+# Rough production mix — most history ends up COMPLETED
+STATUS_WEIGHTS = {
+    "DRAFT": 8,
+    "PENDING": 10,
+    "APPROVED": 6,
+    "PAYMENT_PENDING": 4,
+    "CONFIRMED": 12,
+    "COMPLETED": 40,
+    "REJECTED": 6,
+    "CANCELLED": 12,
+    "PAYMENT_FAILED": 2,
+}
+
+# Statuses that went through admin approval (slot + psychologist assigned)
+APPROVED_STATUSES = {
+    "APPROVED",
+    "PAYMENT_PENDING",
+    "CONFIRMED",
+    "COMPLETED",
+    "PAYMENT_FAILED",
+}
+
+CITIES = (
+    "Surat", "Ahmedabad", "Mumbai", "Pune", "Bengaluru", "Delhi",
+    "Hyderabad", "Chennai", "Kolkata", "Jaipur", "Vadodara", "Indore",
+)
+FIRST_NAMES = (
+    "Aarav", "Diya", "Ishaan", "Ananya", "Kabir", "Meera", "Rohan",
+    "Saanvi", "Vivaan", "Priya", "Arjun", "Kavya", "Neel", "Riya",
+)
+LAST_NAMES = (
+    "Shah", "Patel", "Mehta", "Iyer", "Reddy", "Sharma", "Gupta",
+    "Desai", "Nair", "Joshi", "Bhatia", "Kapoor",
+)
+SESSION_HOURS = (9, 10, 11, 12, 14, 15, 16, 17, 18, 19, 20)
+AMOUNTS = (Decimal("999.00"), Decimal("1499.00"), Decimal("1999.00"))
+
+# Acknowledgement IDs walk a full-period permutation of the 6-char
+# base36 space, so they are unique without a per-row existence check.
+ACK_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+ACK_SPACE = 36 ** 6
+ACK_STEP = 1_000_003  # prime, coprime with 36**6
+
+
+def _ack_code(index):
+    chars = []
+    for _ in range(6):
+        index, rem = divmod(index, 36)
+        chars.append(ACK_ALPHABET[rem])
+    return "MS-" + "".join(reversed(chars))
+
+
+# Lifecycle timestamps; the latest one becomes updated_at
+BOOKING_EVENTS = (
+    "created_at",
+    "email_verified_at",
+    "submitted_at",
+    "rejected_at",
+    "approved_at",
+    "payment_requested_at",
+    "confirmed_at",
+    "cancelled_at",
+)
+
+
+def _last_change(booking):
+    return max(
+        value for value in (getattr(booking, name) for name in BOOKING_EVENTS)
+        if value is not None
+    )
+
+
+@contextmanager
+def _preserve_timestamps(*models):
+    """
+    bulk_create() runs pre_save(), which overwrites created_at and
+    updated_at with the clock. Disable auto_now / auto_now_add so
+    generated rows keep the dates set here.
+    """
+    fields = [
+        field
+        for model in models
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False)
+        or getattr(field, "auto_now_add", False)
+    ]
+    saved = [(field, field.auto_now, field.auto_now_add) for field in fields]
+    for field in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now = auto_now
+            field.auto_now_add = auto_now_add
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a deterministic synthetic booking dataset "
+        "(users, psychologists, corporates, bookings) from a seed"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--bookings", type=int, default=100_000)
+        parser.add_argument(
+            "--users",
+            type=int,
+            default=None,
+            help="Defaults to one user per three bookings",
+        )
+        parser.add_argument("--psychologists", type=int, default=25)
+        parser.add_argument("--corporates", type=int, default=40)
+        parser.add_argument("--days", type=int, default=365)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--now",
+            default=DEFAULT_NOW,
+            help="ISO datetime the generated history ends at",
+        )
+        parser.add_argument("--chunk-size", type=int, default=5_000)
+        parser.add_argument(
+            "--flush",
+            action="store_true",
+            help="Delete previously generated synthetic data first",
+        )
+
+    def parse_now(self, value):
+        try:
+            now = parse_datetime(value)
+        except ValueError:
+            now = None
+        if now is None:
+            raise CommandError(f"Invalid --now: {value}")
+        if timezone.is_naive(now):
+            now = timezone.make_aware(now)
+        return now
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options["seed"])
+        self.chunk_size = options["chunk_size"]
+        self.now = self.parse_now(options["now"])
+
+        total = options["bookings"]
+        users = options["users"] or max(1, total // 3)
+
+        if options["flush"]:
+            self.flush()
+        elif AppUser.objects.filter(
+            email__endswith=f"@{SYNTHETIC_DOMAIN}"
+        ).exists():
+            raise CommandError(
+                "Synthetic data already exists. Re-run with --flush."
+            )
+
+        started = time.perf_counter()
+
+        # Reference data predates the oldest generated booking
+        self.history_start = self.now - timedelta(days=options["days"])
+
+        with _preserve_timestamps(AppUser, Psychologist, Corporate, Booking):
+            user_rows = self.create_users(users)
+            psychologist_ids = self.create_psychologists(
+                options["psychologists"]
+            )
+            corporate_ids = self.create_corporates(options["corporates"])
+            created = self.create_bookings(
+                total,
+                user_rows=user_rows,
+                psychologist_ids=psychologist_ids,
+                corporate_ids=corporate_ids,
+                days=options["days"],
+            )
+
+        # bulk_create bypasses the signals that keep derived tables current
+        rebuild_facet_counts()
+        rebuild_rollups()
+        rebuild_usage()
+        rebuild_lookup_filter()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated {created} bookings for {len(user_rows)} users in "
+            f"{time.perf_counter() - started:.1f}s"
+        ))
+
+    # ─────────────────────────
+    # CLEANUP
+    # ─────────────────────────
+    def flush(self):
+        domain = f"@{SYNTHETIC_DOMAIN}"
+        Booking.objects.filter(user__email__endswith=domain).delete()
+        AppUser.objects.filter(email__endswith=domain).delete()
+        Psychologist.objects.filter(email__endswith=domain).delete()
+        Corporate.objects.filter(contact_email__endswith=domain).delete()
+        self.stdout.write("Flushed previous synthetic data.")
+
+    # ─────────────────────────
+    # REFERENCE DATA
+    # ─────────────────────────
+    def _name(self):
+        return f"{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}"
+
+    def _phone(self):
+        return str(self.rng.randrange(6_000_000_000, 9_999_999_999))
+
+    def create_users(self, count):
+        for start in range(0, count, self.chunk_size):
+            AppUser.objects.bulk_create([
+                AppUser(
+                    full_name=self._name(),
+                    email=f"user{i:07d}@{SYNTHETIC_DOMAIN}",
+                    phone=self._phone(),
+                    is_verified=self.rng.random() < 0.8,
+                    created_at=self.history_start,
+                    updated_at=self.history_start,
+                )
+                for i in range(start, min(start + self.chunk_size, count))
+            ])
+
+        return list(
+            AppUser.objects.filter(email__endswith=f"@{SYNTHETIC_DOMAIN}")
+            .order_by("id")
+            .values_list("id", "email")
+        )
+
+    def create_psychologists(self, count):
+        specializations = [c[0] for c in Psychologist.SPECIALIZATION_CHOICES]
+        Psychologist.objects.bulk_create([
+            Psychologist(
+                full_name=f"Dr. {self._name()}",
+                email=f"psy{i:04d}@{SYNTHETIC_DOMAIN}",
+                specialization=self.rng.choice(specializations),
+                experience_years=self.rng.randint(2, 25),
+                created_at=self.history_start,
+            )
+            for i in range(count)
+        ])
+        return list(
+            Psychologist.objects.filter(email__endswith=f"@{SYNTHETIC_DOMAIN}")
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+    def create_corporates(self, count):
+        Corporate.objects.bulk_create([
+            Corporate(
+                name=f"Synthetic Corp {i:03d}",
+                contact_person=self._name(),
+                contact_email=f"hr{i:03d}@{SYNTHETIC_DOMAIN}",
+                contact_phone=self._phone(),
+                created_at=self.history_start,
+            )
+            for i in range(count)
+        ])
+        return list(
+            Corporate.objects.filter(
+                contact_email__endswith=f"@{SYNTHETIC_DOMAIN}"
+            )
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+    # ─────────────────────────
+    # BOOKINGS
+    # ─────────────────────────
+    def create_bookings(self, total, user_rows, psychologist_ids,
+                        corporate_ids, days):
+        existing_acks = set(
+            Booking.objects.exclude(acknowledgement_id__isnull=True)
+            .values_list("acknowledgement_id", flat=True)
+        )
+        ack_cursor = self.rng.randrange(ACK_SPACE)
+
+        statuses = list(STATUS_WEIGHTS)
+        weights = list(STATUS_WEIGHTS.values())
+
+        created = 0
+        while created < total:
+            size = min(self.chunk_size, total - created)
+            chunk = []
+
+            for status in self.rng.choices(statuses, weights, k=size):
+                ack = _ack_code(ack_cursor)
+                ack_cursor = (ack_cursor + ACK_STEP) % ACK_SPACE
+                while ack in existing_acks:
+                    ack = _ack_code(ack_cursor)
+                    ack_cursor = (ack_cursor + ACK_STEP) % ACK_SPACE
+
+                booking = self.build_booking(
+                    status=status,
+                    acknowledgement_id=ack,
+                    user_row=self.rng.choice(user_rows),
+                    psychologist_ids=psychologist_ids,
+                    corporate_ids=corporate_ids,
+                    days=days,
+                )
+                booking.updated_at = _last_change(booking)
+                chunk.append(booking)
+
+            with transaction.atomic():
+                Booking.objects.bulk_create(chunk)
+
+            created += size
+            self.stdout.write(f"  {created}/{total} bookings")
+
+        return created
+
+    def build_booking(self, status, acknowledgement_id, user_row,
+                      psychologist_ids, corporate_ids, days):
+        rng = self.rng
+
+        # Recent history is denser than old history
+        age = timedelta(minutes=int(days * 24 * 60 * rng.random() ** 1.5))
+        created_at = self.now - age
+
+        mode = "ONLINE" if rng.random() < 0.7 else "OFFLINE"
+        period = rng.choice(("MORNING", "EVENING", "CUSTOM"))
+        preferred_date = (created_at + timedelta(days=rng.randint(1, 14))).date()
+
+        user_id, email = user_row
+        full_name = self._name()
+        phone_number = self._phone()
+        city = rng.choice(CITIES)
+
+        booking = Booking(
+            user_id=user_id,
+            full_name=full_name,
+            phone_number=phone_number,
+            city=city,
+            state="Gujarat",
+            age=rng.randint(18, 65),
+            gender=rng.choice(("MALE", "FEMALE", "OTHER", "PREFER_NOT_TO_SAY")),
+            status=status,
+            preferred_date=preferred_date,
+            preferred_period=period,
+            mode=mode,
+            payment_mode="ONLINE" if mode == "ONLINE" else rng.choice(
+                ("ONLINE", "OFFLINE")
+            ),
+            consent_given=True,
+            consent_given_at=created_at,
+            email_verification_token=uuid.UUID(
+                int=rng.getrandbits(128), version=4
+            ),
+            acknowledgement_id=acknowledgement_id,
+            created_at=created_at,
+            # bulk_create skips save(), so fill the search column here
+            search_text=normalize_search_text(
+                acknowledgement_id, full_name, email, phone_number, city
+            ),
+        )
+
+        if status == "DRAFT":
+            return booking
+
+        booking.email_verified = True
+        booking.email_verified_at = created_at + timedelta(minutes=5)
+        booking.submitted_at = booking.email_verified_at
+
+        if status == "REJECTED":
+            booking.rejection_reason = "No matching slot available"
+            booking.rejected_at = booking.submitted_at + timedelta(hours=6)
+            return booking
+
+        was_approved = status in APPROVED_STATUSES or (
+            status == "CANCELLED" and rng.random() < 0.6
+        )
+
+        if was_approved:
+            slot_start = timezone.make_aware(datetime.combine(
+                preferred_date, dt_time(rng.choice(SESSION_HOURS))
+            ))
+            booking.approved_slot_start = slot_start
+            booking.approved_slot_end = slot_start + timedelta(hours=1)
+            booking.approved_at = booking.submitted_at + timedelta(
+                hours=rng.randint(1, 48)
+            )
+            booking.amount = rng.choice(AMOUNTS)
+            booking.psychologist_id = rng.choice(psychologist_ids)
+            booking.approval_email_sent = True
+
+            if corporate_ids and rng.random() < 0.2:
+                booking.corporate_id = rng.choice(corporate_ids)
+
+            if status in {"PAYMENT_PENDING", "CONFIRMED", "COMPLETED",
+                          "PAYMENT_FAILED"}:
+                booking.payment_reference = f"PAY-{rng.getrandbits(48):012X}"
+                booking.payment_requested_at = booking.approved_at + timedelta(
+                    minutes=rng.randint(5, 600)
+                )
+
+            if status in {"CONFIRMED", "COMPLETED"}:
+                booking.confirmed_at = booking.payment_requested_at + timedelta(
+                    minutes=rng.randint(1, 30)
+                )
+                booking.confirmation_email_sent = True
+
+        if status == "CANCELLED":
+            booking.cancelled_at = (
+                booking.approved_at or booking.submitted_at
+            ) + timedelta(hours=rng.randint(1, 72))
+            booking.cancelled_by = rng.choice(("USER", "ADMIN"))
+            booking.cancellation_reason = "Cancelled by user"
+            booking.payment_reference = None
+            booking.payment_requested_at = None
+
+        return booking
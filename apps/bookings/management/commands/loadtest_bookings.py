@@ -0,0 +1,396 @@
+import json
+import math
+import platform
+import subprocess
+import time
+import uuid
+from contextlib import nullcontext
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+from urllib.error import HTTPError
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+
+import django
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import (
+    CaptureQueriesContext,
+    setup_test_environment,
+    teardown_test_environment,
+)
+from django.utils import timezone
+
+from apps.bookings.models import Booking
+from apps.bookings.utils.tokens import CANCEL, VERIFY_EMAIL, make_booking_token
+
+
+# ─────────────────────────
+# LIFECYCLE STEPS (in order)
+# ─────────────────────────
+STEPS = (
+    ("draft", "POST", "/api/bookings/draft/"),
+    ("verify_email", "GET", "/api/bookings/verify-email/"),
+    ("check_status", "GET", "/api/bookings/check-status/"),
+    ("admin_approve", "POST", "/api/bookings/admin/bookings/{id}/approve/"),
+    ("initiate_payment", "POST", "/api/bookings/initiate-payment/"),
+    ("complete_payment", "POST", "/api/bookings/complete-payment/"),
+    ("request_cancellation", "POST", "/api/bookings/request-cancellation/"),
+    ("verify_cancellation", "GET", "/api/bookings/verify-cancellation/"),
+)
+
+ADMIN_USERNAME = "loadtest-admin"
+ADMIN_PASSWORD = "loadtest-password"
+
+
+def _percentile(sorted_values, pct):
+    """
+    Nearest-rank percentile over an already sorted list.
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class _HttpResponse:
+
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.content = body
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class HttpClient:
+    """
+    The subset of django.test.Client the driver uses, over real HTTP.
+    WSGI-style extra headers (HTTP_AUTHORIZATION) become request headers.
+    """
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip("/")
+
+    def _send(self, request, extra):
+        for key, value in extra.items():
+            if key.startswith("HTTP_"):
+                name = key[5:].replace("_", "-").title()
+                request.add_header(name, value)
+        try:
+            with urlopen(request) as response:
+                return _HttpResponse(response.status, response.read())
+        except HTTPError as exc:
+            return _HttpResponse(exc.code, exc.read())
+
+    def get(self, path, data=None, **extra):
+        url = self.base_url + path
+        if data:
+            url += "?" + urlencode(data)
+        return self._send(Request(url), extra)
+
+    def post(self, path, data=None, content_type="application/json", **extra):
+        request = Request(
+            self.base_url + path,
+            data=json.dumps(data or {}).encode(),
+            headers={"Content-Type": content_type},
+            method="POST",
+        )
+        return self._send(request, extra)
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=settings.BASE_DIR,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive the full booking lifecycle against an isolated test database "
+        "(in process), or over HTTP against a running local server with "
+        "--base-url, and report latency, throughput and queries per endpoint"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument("--warmup", type=int, default=3)
+        parser.add_argument(
+            "--output",
+            default="loadtest.json",
+            help="Path of the JSON results file",
+        )
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Reuse the test database between runs",
+        )
+        parser.add_argument(
+            "--base-url",
+            help=(
+                "Send real HTTP requests to this server (e.g. "
+                "http://127.0.0.1:8000) instead of running in process. "
+                "The server must use this project's settings and database: "
+                "email tokens are signed and bookings looked up locally."
+            ),
+        )
+        parser.add_argument(
+            "--admin-username",
+            help="Existing staff account for the approve step (--base-url)",
+        )
+        parser.add_argument("--admin-password")
+
+    def handle(self, *args, **options):
+        if options["base_url"]:
+            if not (options["admin_username"] and options["admin_password"]):
+                raise CommandError(
+                    "--base-url needs --admin-username and --admin-password"
+                )
+            report = self.run_lifecycle(
+                iterations=options["iterations"],
+                warmup=options["warmup"],
+                client=HttpClient(options["base_url"]),
+                admin=(options["admin_username"], options["admin_password"]),
+            )
+            self.finish(report, options["output"])
+            return
+
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(
+            verbosity=0,
+            autoclobber=True,
+            keepdb=options["keepdb"],
+            serialize=False,
+        )
+
+        try:
+            # Stubbed transport: every send_* helper still renders its
+            # message, only the SendGrid round-trip is skipped.
+            with mock.patch(
+                "apps.bookings.email._send_email", return_value=True
+            ):
+                report = self.run_lifecycle(
+                    iterations=options["iterations"],
+                    warmup=options["warmup"],
+                )
+        finally:
+            connection.creation.destroy_test_db(
+                old_name, verbosity=0, keepdb=options["keepdb"]
+            )
+            teardown_test_environment()
+
+        self.finish(report, options["output"])
+
+    def finish(self, report, output):
+        output = Path(output)
+        output.write_text(json.dumps(report, indent=2))
+
+        self.print_report(report)
+        self.stdout.write(f"Results written to {output}")
+
+    # ─────────────────────────
+    # DRIVER
+    # ─────────────────────────
+    def run_lifecycle(self, iterations, warmup, client=None, admin=None):
+        # In process: a fresh staff user in the test database. Over
+        # HTTP: an existing account, and this process's queries are
+        # not the server's, so none are counted
+        self.count_queries = client is None
+        if client is None:
+            get_user_model().objects.create_user(
+                username=ADMIN_USERNAME,
+                password=ADMIN_PASSWORD,
+                is_staff=True,
+            )
+            client = Client(raise_request_exception=False)
+            admin = (ADMIN_USERNAME, ADMIN_PASSWORD)
+
+        response = client.post(
+            "/api/token/",
+            {"username": admin[0], "password": admin[1]},
+            content_type="application/json",
+        )
+        if response.status_code != 200:
+            raise CommandError("Could not obtain an admin token")
+        token = response.json()["access"]
+        admin_headers = {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+
+        samples = {name: [] for name, _, _ in STEPS}
+        run_id = uuid.uuid4().hex[:8]
+
+        for i in range(warmup):
+            self.run_iteration(client, admin_headers, f"{run_id}-w{i}", None)
+
+        started = time.perf_counter()
+        for i in range(iterations):
+            self.run_iteration(client, admin_headers, f"{run_id}-{i}", samples)
+        elapsed = time.perf_counter() - started
+
+        endpoints = {}
+        for name, method, path in STEPS:
+            endpoints[name] = self.summarise(method, path, samples[name])
+
+        return {
+            "meta": {
+                "commit": _git_commit(),
+                "timestamp": timezone.now().isoformat(),
+                "database": connection.vendor,
+                "target": getattr(client, "base_url", "in-process"),
+                "iterations": iterations,
+                "warmup": warmup,
+                "python": platform.python_version(),
+                "django": django.get_version(),
+            },
+            "lifecycle": {
+                "total_seconds": round(elapsed, 4),
+                "lifecycles_per_second": (
+                    round(iterations / elapsed, 2) if elapsed else None
+                ),
+            },
+            "endpoints": endpoints,
+        }
+
+    def run_iteration(self, client, admin_headers, suffix, samples):
+        def call(step, method, path, data=None, **extra):
+            capture = (
+                CaptureQueriesContext(connection)
+                if self.count_queries else nullcontext()
+            )
+            with capture as ctx:
+                started = time.perf_counter()
+                if method == "GET":
+                    response = client.get(path, data, **extra)
+                else:
+                    response = client.post(
+                        path, data, content_type="application/json", **extra
+                    )
+                latency = time.perf_counter() - started
+
+            if samples is not None:
+                samples[step].append({
+                    "latency": latency,
+                    "queries": len(ctx.captured_queries) if ctx else None,
+                    "ok": response.status_code < 400,
+                })
+            return response
+
+        email = f"loadtest+{suffix}@example.com"
+        slot_start = timezone.now() + timedelta(days=7)
+
+        call("draft", "POST", "/api/bookings/draft/", {
+            "email": email,
+            "consent_given": True,
+            "full_name": "Load Test",
+            "phone_number": "9999999999",
+            "city": "Surat",
+            "mode": "ONLINE",
+            "payment_mode": "ONLINE",
+            "preferred_date": slot_start.date().isoformat(),
+            "preferred_period": "MORNING",
+        })
+
+        # Tokens normally arrive by email; sign them here instead.
+        booking = Booking.objects.get(user__email=email)
+
+        call("verify_email", "GET", "/api/bookings/verify-email/", {
+            "token": make_booking_token(booking.id, VERIFY_EMAIL),
+        })
+        booking.refresh_from_db(fields=["acknowledgement_id"])
+
+        call("check_status", "GET", "/api/bookings/check-status/", {
+            "acknowledgement_id": booking.acknowledgement_id,
+        })
+
+        call(
+            "admin_approve",
+            "POST",
+            f"/api/bookings/admin/bookings/{booking.id}/approve/",
+            {
+                "start": slot_start.isoformat(),
+                "end": (slot_start + timedelta(hours=1)).isoformat(),
+                "amount": "1500.00",
+            },
+            **admin_headers,
+        )
+
+        call("initiate_payment", "POST", "/api/bookings/initiate-payment/", {
+            "acknowledgement_id": booking.acknowledgement_id,
+        })
+        booking.refresh_from_db(fields=["payment_reference"])
+
+        call("complete_payment", "POST", "/api/bookings/complete-payment/", {
+            "payment_reference": booking.payment_reference,
+        })
+
+        call(
+            "request_cancellation",
+            "POST",
+            "/api/bookings/request-cancellation/",
+            {"acknowledgement_id": booking.acknowledgement_id},
+        )
+
+        call("verify_cancellation", "GET", "/api/bookings/verify-cancellation/", {
+            "token": make_booking_token(booking.id, CANCEL),
+        })
+
+    # ─────────────────────────
+    # REPORTING
+    # ─────────────────────────
+    def summarise(self, method, path, samples):
+        latencies = sorted(s["latency"] * 1000 for s in samples)
+        queries = [s["queries"] for s in samples if s["queries"] is not None]
+        total_seconds = sum(latencies) / 1000
+
+        def ms(value):
+            return round(value, 3) if value is not None else None
+
+        return {
+            "method": method,
+            "path": path,
+            "requests": len(samples),
+            "errors": sum(1 for s in samples if not s["ok"]),
+            "p50_ms": ms(_percentile(latencies, 50)),
+            "p95_ms": ms(_percentile(latencies, 95)),
+            "p99_ms": ms(_percentile(latencies, 99)),
+            "mean_ms": ms(sum(latencies) / len(latencies)) if latencies else None,
+            "throughput_rps": (
+                round(len(samples) / total_seconds, 2) if total_seconds else None
+            ),
+            "queries_mean": (
+                round(sum(queries) / len(queries), 2) if queries else None
+            ),
+            "queries_max": max(queries) if queries else None,
+        }
+
+    def print_report(self, report):
+        header = (
+            f"{'endpoint':<22}{'req':>6}{'err':>5}{'p50':>9}{'p95':>9}"
+            f"{'p99':>9}{'rps':>9}{'queries':>9}"
+        )
+        self.stdout.write(header)
+        self.stdout.write("─" * len(header))
+
+        for name, row in report["endpoints"].items():
+            self.stdout.write(
+                f"{name:<22}{row['requests']:>6}{row['errors']:>5}"
+                f"{row['p50_ms']:>9}{row['p95_ms']:>9}{row['p99_ms']:>9}"
+                f"{row['throughput_rps']:>9}{row['queries_mean'] or '-':>9}"
+            )
+
+        lifecycle = report["lifecycle"]
+        self.stdout.write(
+            f"\n{report['meta']['iterations']} lifecycles in "
+            f"{lifecycle['total_seconds']}s "
+            f"({lifecycle['lifecycles_per_second']}/s) on "
+            f"{report['meta']['database']}"
+        )
@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.bookings.services.webhooks import (
+    EVENT_BATCH_SIZE,
+    process_payment_events,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Apply stored payment webhook events to their bookings. "
+        "Run from cron, or with --loop as a long-lived worker."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=EVENT_BATCH_SIZE)
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling for new events instead of exiting",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=1.0,
+            help="Seconds to wait when the queue is empty (with --loop)",
+        )
+
+    def handle(self, *args, **options):
+        processed = 0
+
+        while True:
+            handled = process_payment_events(options["batch_size"])
+            processed += handled
+            if handled:
+                self.stdout.write(f"  {processed} events processed")
+                continue
+            if not options["loop"]:
+                break
+            time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Processed {processed} payment events."
+        ))
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from apps.bookings.services.facets import rebuild_facet_counts
+
+
+class Command(BaseCommand):
+    help = (
+        "Recount admin filter facets from the bookings table. Run after "
+        "bulk writes that bypass model signals (bulk_create, update(), "
+        "loaddata)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, **options):
+        rows = rebuild_facet_counts(using=options["database"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {rows} booking facet counts."
+        ))
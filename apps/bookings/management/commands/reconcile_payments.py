@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.bookings.services.reconciliation import (
+    RECONCILE_CHUNK_SIZE,
+    reconcile_payments,
+)
+from apps.bookings.services.webhooks import PAYMENT_PROVIDERS
+
+
+class Command(BaseCommand):
+    help = (
+        "Confirm or fail PAYMENT_PENDING bookings by asking the payment "
+        "provider what became of them. Meant to run nightly from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--provider",
+            default=settings.PAYMENT_PROVIDER,
+            choices=sorted(PAYMENT_PROVIDERS),
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=RECONCILE_CHUNK_SIZE
+        )
+        parser.add_argument(
+            "--max-minutes",
+            type=float,
+            default=30.0,
+            help="Stop starting new chunks after this long",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Stop after checking this many bookings",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be positive")
+
+        report = reconcile_payments(
+            PAYMENT_PROVIDERS[options["provider"]],
+            chunk_size=options["chunk_size"],
+            max_seconds=options["max_minutes"] * 60,
+            limit=options["limit"],
+        )
+
+        for key in ("checked", "confirmed", "failed", "open", "unknown", "errors"):
+            self.stdout.write(f"  {key:<10} {report[key]}")
+
+        summary = (
+            f"Reconciled {report['checked']} pending payments "
+            f"in {report['seconds']}s."
+        )
+        if report["complete"]:
+            self.stdout.write(self.style.SUCCESS(summary))
+        else:
+            self.stdout.write(self.style.WARNING(
+                f"{summary} Stopped early; the rest is checked next run."
+            ))
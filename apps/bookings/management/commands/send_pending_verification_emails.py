@@ -0,0 +1,99 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.bookings.models import Booking
+from apps.bookings.email import send_booking_verification_emails
+
+
+def _claim(booking, claimed_at):
+    """
+    Marks the draft as emailed only if no other run has since it was
+    read. One conditional UPDATE.
+    """
+    return Booking.objects.filter(
+        pk=booking.pk, last_verification_email_sent_at__isnull=True
+    ).update(last_verification_email_sent_at=claimed_at) == 1
+
+
+class Command(BaseCommand):
+    help = (
+        "Send verification emails queued by corporate bulk imports "
+        "(corporate DRAFT bookings never emailed). Each draft is claimed "
+        "before it is emailed, so overlapping runs are safe."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=200)
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Stop after this many emails",
+        )
+        parser.add_argument(
+            "--delay",
+            type=float,
+            default=0.0,
+            help="Seconds to sleep between batches (provider rate limits)",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        limit = options["limit"]
+        sent = failed = skipped = 0
+        last_id = 0
+
+        while limit is None or sent + failed < limit:
+            size = batch_size if limit is None else min(
+                batch_size, limit - sent - failed
+            )
+            # Served by the partial booking_pending_email_idx. Only
+            # imported drafts carry a corporate; self-serve drafts are
+            # emailed (and re-sent on request) by the draft view
+            batch = list(
+                Booking.objects.filter(
+                    status="DRAFT",
+                    corporate__isnull=False,
+                    last_verification_email_sent_at__isnull=True,
+                    id__gt=last_id,
+                )
+                .select_related("user")
+                .order_by("id")[:size]
+            )
+            if not batch:
+                break
+            last_id = batch[-1].id
+
+            claimed_at = timezone.now()
+            claimed = []
+            for booking in batch:
+                if _claim(booking, claimed_at):
+                    claimed.append(booking)
+                else:
+                    skipped += 1
+
+            delivered = set(send_booking_verification_emails(claimed))
+            undelivered = [
+                booking.id for booking in claimed
+                if booking.id not in delivered
+            ]
+            sent += len(delivered)
+            failed += len(undelivered)
+
+            # Hand failures back for the next run, in one UPDATE
+            Booking.objects.filter(
+                id__in=undelivered, last_verification_email_sent_at=claimed_at
+            ).update(last_verification_email_sent_at=None)
+
+            self.stdout.write(
+                f"  {sent} sent, {failed} failed, {skipped} skipped"
+            )
+            if options["delay"]:
+                time.sleep(options["delay"])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Sent {sent} verification emails "
+            f"({failed} failed, {skipped} claimed by another run)."
+        ))
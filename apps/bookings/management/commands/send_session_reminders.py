@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from apps.bookings.services.reminders import (
+    REMINDER_BATCH_SIZE,
+    send_due_reminders,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Send session reminder emails that are due "
+        "(settings.SESSION_REMINDER_OFFSETS). Run every few minutes "
+        "from cron; several runners can overlap safely."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=REMINDER_BATCH_SIZE
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Stop after this many emails",
+        )
+
+    def handle(self, *args, **options):
+        report = send_due_reminders(
+            batch_size=options["batch_size"], limit=options["limit"]
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Sent {report['sent']} session reminders "
+            f"({report['failed']} failed, {report['skipped']} claimed "
+            f"by another runner)."
+        ))
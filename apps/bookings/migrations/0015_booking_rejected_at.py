@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-19 16:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0014_booking_confirmation_email_sent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='rejected_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 6.0 on 2026-10-19 16:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0015_booking_rejected_at'),
+        ('corporates', '0001_initial'),
+        ('psychologists', '0001_initial'),
+        ('users', '0002_appuser_last_admin_activity'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['created_at'], name='booking_created_at_idx'),
+        ),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 6.0 on 2026-10-19 16:20
+
+from django.db import migrations, models
+
+from apps.bookings.utils.search import normalize_search_text
+
+
+BACKFILL_CHUNK = 2000
+
+
+def backfill_search_text(apps, schema_editor):
+    Booking = apps.get_model("bookings", "Booking")
+    db_alias = schema_editor.connection.alias
+
+    rows = (
+        Booking.objects.using(db_alias)
+        .values_list(
+            "id",
+            "acknowledgement_id",
+            "full_name",
+            "user__email",
+            "phone_number",
+            "city",
+        )
+        .order_by("id")
+        .iterator(chunk_size=BACKFILL_CHUNK)
+    )
+
+    batch = []
+    for pk, ack, name, email, phone, city in rows:
+        batch.append(Booking(
+            id=pk,
+            search_text=normalize_search_text(ack, name, email, phone, city),
+        ))
+        if len(batch) >= BACKFILL_CHUNK:
+            Booking.objects.using(db_alias).bulk_update(batch, ["search_text"])
+            batch = []
+
+    if batch:
+        Booking.objects.using(db_alias).bulk_update(batch, ["search_text"])
+
+
+def create_search_index(apps, schema_editor):
+    # pg_trgm GIN index on PostgreSQL, FTS5 trigram table on SQLite
+    from apps.bookings.services.search import install_search_index
+
+    install_search_index(schema_editor.connection)
+
+
+def drop_search_index(apps, schema_editor):
+    from apps.bookings.services.search import FTS_TABLE, SQLITE_FTS_TRIGGERS
+
+    connection = schema_editor.connection
+
+    if connection.vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS booking_search_trgm_idx")
+    elif connection.vendor == "sqlite":
+        for trigger in SQLITE_FTS_TRIGGERS:
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0016_booking_created_at_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='search_text',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(
+            backfill_search_text,
+            migrations.RunPython.noop,
+        ),
+        migrations.RunPython(
+            create_search_index,
+            drop_search_index,
+        ),
+    ]
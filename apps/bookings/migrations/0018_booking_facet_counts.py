@@ -0,0 +1,52 @@
+# Generated by Django 6.0 on 2026-10-19 16:24
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+FACET_FIELDS = ("status", "mode", "preferred_period", "city")
+
+
+def count_facets(apps, schema_editor):
+    Booking = apps.get_model("bookings", "Booking")
+    BookingFacetCount = apps.get_model("bookings", "BookingFacetCount")
+    db_alias = schema_editor.connection.alias
+
+    visible = Booking.objects.using(db_alias).exclude(status="DRAFT")
+
+    rows = []
+    for field in FACET_FIELDS:
+        for value, count in (
+            visible.order_by().values_list(field).annotate(total=Count("id"))
+        ):
+            rows.append(BookingFacetCount(
+                dimension=field, value=value or "", count=count
+            ))
+
+    BookingFacetCount.objects.using(db_alias).bulk_create(rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0017_booking_search_text'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookingFacetCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(max_length=30)),
+                ('value', models.CharField(blank=True, max_length=50)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('dimension', 'value'), name='booking_facet_unique')],
+            },
+        ),
+        migrations.RunPython(
+            count_facets,
+            migrations.RunPython.noop,
+        ),
+    ]
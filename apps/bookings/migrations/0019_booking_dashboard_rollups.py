@@ -0,0 +1,64 @@
+# Generated by Django 6.0 on 2026-10-19 16:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0018_booking_facet_counts'),
+        ('corporates', '0001_initial'),
+        ('psychologists', '0001_initial'),
+        ('users', '0002_appuser_last_admin_activity'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookingDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(unique=True)),
+                ('created', models.PositiveIntegerField(default=0)),
+                ('submitted', models.PositiveIntegerField(default=0)),
+                ('approved', models.PositiveIntegerField(default=0)),
+                ('rejected', models.PositiveIntegerField(default=0)),
+                ('payment_requested', models.PositiveIntegerField(default=0)),
+                ('confirmed', models.PositiveIntegerField(default=0)),
+                ('completed', models.PositiveIntegerField(default=0)),
+                ('cancelled', models.PositiveIntegerField(default=0)),
+                ('payment_failed', models.PositiveIntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('refunded', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+            ],
+            options={
+                'ordering': ['-date'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PsychologistDailyLoad',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('sessions', models.IntegerField(default=0)),
+                ('minutes', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['status', 'submitted_at'], name='booking_status_submitted_idx'),
+        ),
+        migrations.AddField(
+            model_name='psychologistdailyload',
+            name='psychologist',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_loads', to='psychologists.psychologist'),
+        ),
+        migrations.AddIndex(
+            model_name='psychologistdailyload',
+            index=models.Index(fields=['date'], name='psychologist_load_date_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='psychologistdailyload',
+            constraint=models.UniqueConstraint(fields=('psychologist', 'date'), name='psychologist_daily_load_unique'),
+        ),
+    ]
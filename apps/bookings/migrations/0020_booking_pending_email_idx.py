@@ -0,0 +1,20 @@
+# Generated by Django 6.0 on 2026-10-19 16:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0019_booking_dashboard_rollups'),
+        ('corporates', '0001_initial'),
+        ('psychologists', '0001_initial'),
+        ('users', '0002_appuser_last_admin_activity'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(condition=models.Q(('last_verification_email_sent_at__isnull', True), ('status', 'DRAFT')), fields=['id'], name='booking_pending_email_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 6.0 on 2026-10-19 16:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0020_booking_pending_email_idx'),
+        ('corporates', '0002_corporate_monthly_usage'),
+        ('psychologists', '0001_initial'),
+        ('users', '0002_appuser_last_admin_activity'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='booking_user_history_idx'),
+        ),
+    ]
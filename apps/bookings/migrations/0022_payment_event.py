@@ -0,0 +1,34 @@
+# Generated by Django 6.0 on 2026-10-19 17:16
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0021_booking_user_history_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PaymentEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('provider', models.CharField(max_length=30)),
+                ('event_id', models.CharField(max_length=255)),
+                ('event_type', models.CharField(max_length=100)),
+                ('payment_reference', models.CharField(blank=True, max_length=100)),
+                ('payload', models.TextField()),
+                ('received_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('outcome', models.CharField(blank=True, choices=[('APPLIED', 'Applied'), ('IGNORED', 'Ignored'), ('FAILED', 'Failed')], max_length=10)),
+                ('error', models.TextField(blank=True)),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('processed_at__isnull', True)), fields=['id'], name='payment_event_pending_idx')],
+                'constraints': [models.UniqueConstraint(fields=('provider', 'event_id'), name='payment_event_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 6.0 on 2026-10-19 17:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0022_payment_event'),
+        ('corporates', '0002_corporate_monthly_usage'),
+        ('psychologists', '0001_initial'),
+        ('users', '0003_appuser_email_ci_unique'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(condition=models.Q(('status', 'PAYMENT_PENDING')), fields=['id'], name='booking_payment_pending_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 6.0 on 2026-10-19 17:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0023_booking_payment_pending_idx'),
+        ('corporates', '0002_corporate_monthly_usage'),
+        ('psychologists', '0001_initial'),
+        ('users', '0003_appuser_email_ci_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='reminder_stage',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(condition=models.Q(('status', 'CONFIRMED')), fields=['approved_slot_start', 'reminder_stage'], name='booking_reminder_due_idx'),
+        ),
+    ]
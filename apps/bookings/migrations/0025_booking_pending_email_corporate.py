@@ -0,0 +1,24 @@
+# Generated by Django 6.0 on 2026-10-19 17:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0024_booking_reminder_stage'),
+        ('corporates', '0002_corporate_monthly_usage'),
+        ('psychologists', '0001_initial'),
+        ('users', '0003_appuser_email_ci_unique'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='booking',
+            name='booking_pending_email_idx',
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(condition=models.Q(('corporate__isnull', False), ('last_verification_email_sent_at__isnull', True), ('status', 'DRAFT')), fields=['id'], name='booking_pending_email_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-19 17:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0025_booking_pending_email_corporate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='paymentevent',
+            name='claimed_until',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
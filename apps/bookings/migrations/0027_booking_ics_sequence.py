@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-19 17:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0026_payment_event_claimed_until'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='ics_sequence',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, router, transaction
 from django.utils import timezone
 from django.core.exceptions import ValidationError
 import uuid
@@ -8,6 +8,7 @@ import random
 from apps.users.models import AppUser
 from apps.psychologists.models import Psychologist
 from apps.corporates.models import Corporate
+from apps.bookings.utils.search import normalize_search_text
 
 
 class Booking(models.Model):
@@ -126,6 +127,7 @@ class Booking(models.Model):
 
     rejection_reason = models.TextField(blank=True)
     alternate_slots = models.TextField(blank=True)
+    rejected_at = models.DateTimeField(null=True, blank=True)
 
     # ───────── CONSENT ─────────
     consent_given = models.BooleanField(default=False)
@@ -194,6 +196,41 @@ class Booking(models.Model):
     approval_email_sent = models.BooleanField(default=False)
     rejection_email_sent = models.BooleanField(default=False)
     confirmation_email_sent = models.BooleanField(default=False)
+    # Session reminders sent so far (settings.SESSION_REMINDER_OFFSETS);
+    # back to 0 when the slot moves
+    reminder_stage = models.PositiveSmallIntegerField(default=0)
+    # iCalendar SEQUENCE: raised when a published session moves or
+    # leaves the calendar, so calendar apps replace their copy
+    ics_sequence = models.PositiveIntegerField(default=0, editable=False)
+
+    # ───────── SEARCH (DENORMALISED) ─────────
+    # Indexed per database in migration 0017 (pg_trgm / FTS5)
+    search_text = models.TextField(blank=True, default="", editable=False)
+
+    SEARCH_SOURCE_FIELDS = {
+        "acknowledgement_id",
+        "full_name",
+        "phone_number",
+        "city",
+        "user",
+    }
+
+    # ───────── DERIVED COUNTERS ─────────
+    # Counted per value in BookingFacetCount (services/facets.py)
+    FACET_FIELDS = ("status", "mode", "preferred_period", "city")
+
+    # Everything derived tables (facets, rollups, corporate usage)
+    # depend on; saves touching none of these skip them entirely
+    TRACKED_FIELDS = FACET_FIELDS + (
+        "corporate_id",
+        "psychologist_id",
+        "approved_slot_start",
+        "approved_slot_end",
+        "amount",
+    )
+
+    def tracked_values(self):
+        return {field: getattr(self, field) for field in self.TRACKED_FIELDS}
 
     # ───────── VALIDATION ─────────
     def clean(self):
@@ -209,18 +246,71 @@ class Booking(models.Model):
             })
 
     # ───────── DOMAIN HELPERS ─────────
+    @staticmethod
+    def _random_acknowledgement_id():
+        return "MS-" + "".join(
+            random.choices(string.ascii_uppercase + string.digits, k=6)
+        )
+
     def generate_acknowledgement_id(self):
         while True:
-            code = "MS-" + "".join(
-                random.choices(string.ascii_uppercase + string.digits, k=6)
-            )
+            code = self._random_acknowledgement_id()
             if not Booking.objects.filter(acknowledgement_id=code).exists():
                 return code
 
+    @classmethod
+    def generate_acknowledgement_ids(cls, count):
+        """
+        `count` unused acknowledgement IDs, checked against the table
+        in one query per round instead of one per ID.
+        """
+        codes = set()
+        while len(codes) < count:
+            candidates = {
+                cls._random_acknowledgement_id()
+                for _ in range(count - len(codes))
+            } - codes
+            taken = set(
+                cls.objects.filter(acknowledgement_id__in=candidates)
+                .values_list("acknowledgement_id", flat=True)
+            )
+            codes |= candidates - taken
+        return list(codes)
+
+    def build_search_text(self):
+        return normalize_search_text(
+            self.acknowledgement_id,
+            self.full_name,
+            self.user.email if self.user_id else "",
+            self.phone_number,
+            self.city,
+        )
+
     def save(self, *args, **kwargs):
         if not self.acknowledgement_id:
             self.acknowledgement_id = self.generate_acknowledgement_id()
-        super().save(*args, **kwargs)
+
+        # Keep search column in sync, but only when a source field is written
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or self.SEARCH_SOURCE_FIELDS.intersection(
+            update_fields
+        ):
+            self.search_text = self.build_search_text()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "search_text"}
+
+        # auto_now only applies to the fields written; partial saves still
+        # count as a change (updated_at is the .ics LAST-MODIFIED)
+        if kwargs.get("update_fields"):
+            kwargs["update_fields"] = {*kwargs["update_fields"], "updated_at"}
+
+        # pre_save locks the row to read the values being replaced; the
+        # lock must last until the row is written (signals.py)
+        using = kwargs.get("using") or router.db_for_write(
+            type(self), instance=self
+        )
+        with transaction.atomic(using=using, savepoint=False):
+            super().save(*args, **kwargs)
 
     def verify_email(self):
         self.email_verified = True
@@ -231,4 +321,173 @@ class Booking(models.Model):
         return self.acknowledgement_id or f"Booking-{self.id}"
 
     class Meta:
-        ordering = ["-created_at"]
\ No newline at end of file
+        ordering = ["-created_at"]
+        indexes = [
+            # Default ordering for the admin changelist and history
+            models.Index(fields=["created_at"], name="booking_created_at_idx"),
+            # Pending-approval queue on the admin dashboard
+            models.Index(
+                fields=["status", "submitted_at"],
+                name="booking_status_submitted_idx",
+            ),
+            # Verification emails still to send (bulk imports)
+            models.Index(
+                fields=["id"],
+                condition=models.Q(
+                    status="DRAFT",
+                    corporate__isnull=False,
+                    last_verification_email_sent_at__isnull=True,
+                ),
+                name="booking_pending_email_idx",
+            ),
+            # A user's booking history, keyset-paginated newest first
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="booking_user_history_idx",
+            ),
+            # Payments awaiting reconciliation with the provider
+            models.Index(
+                fields=["id"],
+                condition=models.Q(status="PAYMENT_PENDING"),
+                name="booking_payment_pending_idx",
+            ),
+            # Session reminders: range scan over upcoming confirmed slots
+            models.Index(
+                fields=["approved_slot_start", "reminder_stage"],
+                condition=models.Q(status="CONFIRMED"),
+                name="booking_reminder_due_idx",
+            ),
+        ]
+
+
+class BookingFacetCount(models.Model):
+    """
+    Running count of admin-visible (non-draft) bookings per facet
+    value, so list filters never scan the bookings table.
+    """
+
+    dimension = models.CharField(max_length=30)
+    value = models.CharField(max_length=50, blank=True)
+    count = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.dimension}={self.value}: {self.count}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dimension", "value"],
+                name="booking_facet_unique",
+            ),
+        ]
+
+
+class BookingDailyRollup(models.Model):
+    """
+    Per-day transition counters for the admin dashboard.
+    A booking is counted on the day it entered each status.
+    """
+
+    date = models.DateField(unique=True)
+
+    created = models.PositiveIntegerField(default=0)
+    submitted = models.PositiveIntegerField(default=0)
+    approved = models.PositiveIntegerField(default=0)
+    rejected = models.PositiveIntegerField(default=0)
+    payment_requested = models.PositiveIntegerField(default=0)
+    confirmed = models.PositiveIntegerField(default=0)
+    completed = models.PositiveIntegerField(default=0)
+    cancelled = models.PositiveIntegerField(default=0)
+    payment_failed = models.PositiveIntegerField(default=0)
+
+    # Amount of bookings confirmed that day / cancelled after confirming
+    revenue = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    refunded = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+
+    def __str__(self):
+        return f"Rollup {self.date}"
+
+    class Meta:
+        ordering = ["-date"]
+
+
+class PsychologistDailyLoad(models.Model):
+    """
+    Confirmed (or completed) sessions per psychologist per session day.
+    """
+
+    psychologist = models.ForeignKey(
+        Psychologist,
+        on_delete=models.CASCADE,
+        related_name="daily_loads",
+    )
+    date = models.DateField()
+
+    sessions = models.IntegerField(default=0)
+    minutes = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.psychologist} {self.date}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["psychologist", "date"],
+                name="psychologist_daily_load_unique",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["date"], name="psychologist_load_date_idx"),
+        ]
+
+
+class PaymentEvent(models.Model):
+    """
+    A payment provider webhook event, stored as received. The webhook
+    only ever inserts rows; process_payment_events fills in the outcome.
+    """
+
+    OUTCOME_CHOICES = [
+        ("APPLIED", "Applied"),
+        ("IGNORED", "Ignored"),
+        ("FAILED", "Failed"),
+    ]
+
+    provider = models.CharField(max_length=30)
+    event_id = models.CharField(max_length=255)
+    event_type = models.CharField(max_length=100)
+    payment_reference = models.CharField(max_length=100, blank=True)
+
+    # Raw request body, exactly as signed by the provider
+    payload = models.TextField()
+    received_at = models.DateTimeField(default=timezone.now)
+
+    processed_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    # Set while a worker holds the event; a worker that dies leaves it
+    # to be claimed again once this has passed
+    claimed_until = models.DateTimeField(null=True, blank=True)
+    outcome = models.CharField(
+        max_length=10, choices=OUTCOME_CHOICES, blank=True
+    )
+    error = models.TextField(blank=True)
+
+    def __str__(self):
+        return f"{self.provider}:{self.event_id}"
+
+    class Meta:
+        constraints = [
+            # Providers redeliver; the second copy is dropped on insert
+            models.UniqueConstraint(
+                fields=["provider", "event_id"],
+                name="payment_event_unique",
+            ),
+        ]
+        indexes = [
+            # Worker queue: events not processed yet, oldest first
+            models.Index(
+                fields=["id"],
+                condition=models.Q(processed_at__isnull=True),
+                name="payment_event_pending_idx",
+            ),
+        ]
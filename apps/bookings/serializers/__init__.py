@@ -1,4 +1,6 @@
 # apps/bookings/serializers/__init__.py
 from .draft import BookingDraftSerializer
 from .admin import BookingAdminSerializer
-from .public import BookingPublicSerializer
\ No newline at end of file
+from .public import BookingPublicSerializer
+from .imports import CorporateImportRowSerializer
+from .history import BookingHistorySerializer
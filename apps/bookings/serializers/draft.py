@@ -32,6 +32,7 @@ class BookingDraftSerializer(BookingBaseSerializer):
             "psychologist",
             "corporate",
             "rejection_reason",
+            "rejected_at",
             "alternate_slots",
 
             # ───────── Payment / Confirmation ─────────
@@ -47,6 +48,9 @@ class BookingDraftSerializer(BookingBaseSerializer):
             "cancelled_at",
             "cancelled_by",
 
+            # ───────── Reminders ─────────
+            "reminder_stage",
+
             # ───────── Timestamps ─────────
             "submitted_at",
             "created_at",
@@ -0,0 +1,43 @@
+from rest_framework import serializers
+
+from apps.bookings.models import Booking
+from apps.bookings.services.exports import DATE_FIELDS, EXPORT_FORMATS
+
+
+class BookingExportFilterSerializer(serializers.Serializer):
+    """
+    Query parameters of the booking export API.
+    `status` takes a comma-separated list.
+    """
+
+    output = serializers.ChoiceField(
+        choices=list(EXPORT_FORMATS), default="csv"
+    )
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+    date_field = serializers.ChoiceField(
+        choices=list(DATE_FIELDS), default="created"
+    )
+    corporate = serializers.IntegerField(required=False, min_value=1)
+    psychologist = serializers.IntegerField(required=False, min_value=1)
+    status = serializers.CharField(required=False)
+
+    def validate_status(self, value):
+        valid = {choice for choice, _ in Booking.STATUS_CHOICES}
+        statuses = [s.strip().upper() for s in value.split(",") if s.strip()]
+
+        unknown = set(statuses) - valid
+        if unknown:
+            raise serializers.ValidationError(
+                f"Unknown status: {', '.join(sorted(unknown))}"
+            )
+        return statuses
+
+    def validate(self, attrs):
+        date_from = attrs.get("date_from")
+        date_to = attrs.get("date_to")
+        if date_from and date_to and date_from > date_to:
+            raise serializers.ValidationError(
+                "date_from must be on or before date_to"
+            )
+        return attrs
@@ -0,0 +1,100 @@
+from django.db import models
+from django.utils import timezone
+
+from apps.bookings.models import Booking
+from apps.bookings.serializers.public import BookingPublicSerializer
+from apps.bookings.utils.calendar import build_google_calendar_link
+
+
+def _datetime_converter(tz):
+    # Same as DRF's DateTimeField with USE_TZ: current timezone, ISO 8601,
+    # "+00:00" shortened to "Z"
+    def convert(value):
+        value = value.astimezone(tz).isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return convert
+
+
+def _isoformat(value):
+    return value.isoformat()
+
+
+def _same(value):
+    return value
+
+
+def _converter(field, tz):
+    if isinstance(field, models.DateTimeField):
+        return _datetime_converter(tz)
+    if isinstance(field, (models.DateField, models.TimeField)):
+        return _isoformat
+    if field.choices:
+        # ChoiceField hands back the stored value
+        return _same
+    return str
+
+
+class FastBookingPublicSerializer:
+    """
+    BookingPublicSerializer output built from values_list(*columns) rows.
+
+    Converters are chosen once per instance from the model fields, so a
+    row costs a few function calls instead of DRF's per-field dispatch
+    and attribute lookups. Output is identical, key order included;
+    benchmark_public_serializer checks that.
+    """
+
+    fields = BookingPublicSerializer.Meta.fields
+    columns = tuple(field for field in fields if field != "add_to_calendar_url")
+
+    def __init__(self):
+        tz = timezone.get_current_timezone()
+        # (name, column index, converter) in declared field order; the
+        # calendar link has no column of its own
+        self._plan = [
+            (name, None, None)
+            if name == "add_to_calendar_url"
+            else (
+                name,
+                self.columns.index(name),
+                _converter(Booking._meta.get_field(name), tz),
+            )
+            for name in self.fields
+        ]
+        self._calendar = tuple(
+            self.columns.index(name)
+            for name in (
+                "acknowledgement_id",
+                "mode",
+                "approved_slot_start",
+                "approved_slot_end",
+            )
+        )
+        self._status = self.columns.index("status")
+
+    def to_representation(self, row):
+        """
+        One payload from a row; extra trailing values are ignored.
+        """
+        data = {}
+        for name, index, convert in self._plan:
+            if index is None:
+                data[name] = self._calendar_url(row)
+                continue
+            value = row[index]
+            data[name] = None if value is None else convert(value)
+        return data
+
+    def _calendar_url(self, row):
+        # Only confirmed bookings expose a calendar link
+        if row[self._status] != "CONFIRMED":
+            return None
+        return build_google_calendar_link(
+            *(row[index] for index in self._calendar)
+        )
+
+    def serialize(self, rows):
+        return [self.to_representation(row) for row in rows]
@@ -0,0 +1,30 @@
+from rest_framework import serializers
+from apps.bookings.models import Booking
+
+
+class BookingHistoryQuerySerializer(serializers.Serializer):
+    token = serializers.CharField(max_length=200)
+    cursor = serializers.CharField(required=False)
+    limit = serializers.IntegerField(
+        required=False, default=20, min_value=1, max_value=50
+    )
+
+
+class BookingHistorySerializer(serializers.ModelSerializer):
+    """
+    One line of a user's booking history.
+    Deliberately slim: the full record is behind check-status.
+    """
+
+    class Meta:
+        model = Booking
+        fields = (
+            "acknowledgement_id",
+            "status",
+            "mode",
+            "preferred_date",
+            "approved_slot_start",
+            "approved_slot_end",
+            "created_at",
+        )
+        read_only_fields = fields
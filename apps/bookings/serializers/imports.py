@@ -0,0 +1,23 @@
+from rest_framework import serializers
+
+from .draft import BookingDraftSerializer
+
+
+class CorporateImportRowSerializer(BookingDraftSerializer):
+    """
+    One employee row of a corporate bulk import.
+    Draft rules plus the email and consent the draft view checks.
+    """
+
+    email = serializers.EmailField(write_only=True)
+    consent_given = serializers.BooleanField()
+
+    def validate_email(self, value):
+        return value.strip().lower()
+
+    def validate_consent_given(self, value):
+        if value is not True:
+            raise serializers.ValidationError(
+                "Privacy policy consent required"
+            )
+        return value
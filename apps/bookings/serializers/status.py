@@ -0,0 +1,11 @@
+from rest_framework import serializers
+
+from apps.bookings.services.status import MAX_BATCH_STATUS_IDS
+
+
+class BookingBatchStatusSerializer(serializers.Serializer):
+    acknowledgement_ids = serializers.ListField(
+        child=serializers.CharField(max_length=20),
+        min_length=1,
+        max_length=MAX_BATCH_STATUS_IDS,
+    )
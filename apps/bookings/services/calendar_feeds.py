@@ -0,0 +1,133 @@
+# apps/bookings/services/calendar_feeds.py
+
+import hashlib
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db.models import F
+from django.utils import timezone
+
+from apps.bookings.models import Booking
+from apps.bookings.utils.calendar import build_ics_event, iter_ics_calendar
+from apps.psychologists.models import Psychologist
+
+# ─────────────────────────
+# CONFIG
+# ─────────────────────────
+# Sessions that appear in a psychologist's feed
+FEED_STATUSES = {"CONFIRMED", "COMPLETED"}
+
+# Past sessions kept in the feed
+FEED_HISTORY = timedelta(days=30)
+
+# Rows fetched per round trip while rendering
+FEED_CHUNK_SIZE = 500
+
+# Feeds are cached under Psychologist.feed_version, which every worker
+# reads from the database; the TTL only ages out superseded versions
+FEED_CACHE_TTL = 60 * 60
+
+
+def _feed_key(psychologist_id, version):
+    return f"psychologist-feed:{psychologist_id}:{version}"
+
+
+# ─────────────────────────
+# INVALIDATION
+# ─────────────────────────
+def _feed_contribution(values):
+    """
+    (psychologist_id, what the feed shows) for tracked booking values,
+    or None when the booking is not in any feed.
+    """
+    if (
+        not values
+        or values["status"] not in FEED_STATUSES
+        or not values["psychologist_id"]
+        or not values["approved_slot_start"]
+        or not values["approved_slot_end"]
+    ):
+        return None
+
+    return values["psychologist_id"], (
+        values["mode"],
+        values["approved_slot_start"],
+        values["approved_slot_end"],
+    )
+
+
+def invalidate_feed_delta(old, new, using="default"):
+    """
+    Moves every psychologist whose sessions changed between two tracked
+    value snapshots (either may be None) to a new feed version. The
+    UPDATE commits with the change, so no worker, whatever its cache,
+    serves the old feed afterwards.
+    """
+    old_entry = _feed_contribution(old)
+    new_entry = _feed_contribution(new)
+    if old_entry == new_entry:
+        return
+
+    Psychologist.objects.using(using).filter(
+        id__in={entry[0] for entry in (old_entry, new_entry) if entry}
+    ).update(feed_version=F("feed_version") + 1)
+
+
+def reissues_feed_event(old, new):
+    """
+    True when a session already in a feed moves or leaves it: calendar
+    apps only replace their copy for a higher SEQUENCE.
+    """
+    old_entry = _feed_contribution(old)
+    return old_entry is not None and old_entry != _feed_contribution(new)
+
+
+# ─────────────────────────
+# RENDERING
+# ─────────────────────────
+def _iter_feed_events(psychologist_id):
+    rows = (
+        Booking.objects.filter(
+            psychologist_id=psychologist_id,
+            status__in=FEED_STATUSES,
+            approved_slot_start__gte=timezone.now() - FEED_HISTORY,
+            approved_slot_end__isnull=False,
+        )
+        .order_by("approved_slot_start", "id")
+        .values_list(
+            "acknowledgement_id",
+            "mode",
+            "approved_slot_start",
+            "approved_slot_end",
+            "updated_at",
+            "ics_sequence",
+        )
+        .iterator(chunk_size=FEED_CHUNK_SIZE)
+    )
+    for row in rows:
+        yield build_ics_event(*row)
+
+
+def get_psychologist_feed(psychologist_id):
+    """
+    (etag, body) of a psychologist's .ics feed. Served from the cache
+    after one primary-key lookup of the feed version; rendered event by
+    event from one streamed query on a miss.
+    """
+    version = (
+        Psychologist.objects.filter(pk=psychologist_id)
+        .values_list("feed_version", flat=True)
+        .first()
+    )
+    key = _feed_key(psychologist_id, version)
+    feed = cache.get(key)
+
+    if feed is None:
+        body = "".join(iter_ics_calendar(
+            _iter_feed_events(psychologist_id), name="MindSettler sessions"
+        ))
+        etag = '"{}"'.format(hashlib.sha256(body.encode()).hexdigest()[:32])
+        feed = (etag, body)
+        cache.set(key, feed, FEED_CACHE_TTL)
+
+    return feed
@@ -0,0 +1,181 @@
+# apps/bookings/services/exports.py
+
+import csv
+from datetime import datetime, time
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+
+from apps.bookings.models import Booking
+
+# ─────────────────────────
+# CONFIG
+# ─────────────────────────
+# (column header, ORM lookup) — related names are joined, not fetched
+EXPORT_COLUMNS = (
+    ("acknowledgement_id", "acknowledgement_id"),
+    ("status", "status"),
+    ("created_at", "created_at"),
+    ("full_name", "full_name"),
+    ("email", "user__email"),
+    ("phone_number", "phone_number"),
+    ("city", "city"),
+    ("mode", "mode"),
+    ("payment_mode", "payment_mode"),
+    ("preferred_date", "preferred_date"),
+    ("session_start", "approved_slot_start"),
+    ("session_end", "approved_slot_end"),
+    ("amount", "amount"),
+    ("psychologist", "psychologist__full_name"),
+    ("corporate", "corporate__name"),
+    ("payment_reference", "payment_reference"),
+    ("confirmed_at", "confirmed_at"),
+    ("cancelled_at", "cancelled_at"),
+)
+
+# Rows fetched per round trip; with PostgreSQL this is a server-side
+# cursor, so memory stays flat however large the export is
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+}
+
+# Spreadsheets run cells starting with these as formulas; CSV cells
+# that do get a leading apostrophe
+CSV_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+# Which timestamp the date range applies to
+DATE_FIELDS = {
+    "created": "created_at",
+    "session": "approved_slot_start",
+}
+
+
+# ─────────────────────────
+# QUERY
+# ─────────────────────────
+def filter_export_queryset(queryset, date_from=None, date_to=None,
+                           date_field="created", corporate=None,
+                           psychologist=None, statuses=None):
+    """
+    Applies export filters. Dates are inclusive local calendar days.
+    """
+    column = DATE_FIELDS[date_field]
+    tz = timezone.get_current_timezone()
+
+    if date_from:
+        queryset = queryset.filter(**{
+            f"{column}__gte": timezone.make_aware(
+                datetime.combine(date_from, time.min), tz
+            )
+        })
+    if date_to:
+        queryset = queryset.filter(**{
+            f"{column}__lte": timezone.make_aware(
+                datetime.combine(date_to, time.max), tz
+            )
+        })
+    if corporate:
+        queryset = queryset.filter(corporate_id=corporate)
+    if psychologist:
+        queryset = queryset.filter(psychologist_id=psychologist)
+    if statuses:
+        queryset = queryset.filter(status__in=statuses)
+
+    return queryset
+
+
+def export_queryset(**filters):
+    """
+    Bookings for the export API. Drafts are left out unless a status
+    filter asks for them.
+    """
+    queryset = Booking.objects.all()
+    if not filters.get("statuses"):
+        queryset = queryset.exclude(status="DRAFT")
+    return filter_export_queryset(queryset, **filters)
+
+
+def iter_export_rows(queryset):
+    """
+    Yields plain value tuples in EXPORT_COLUMNS order, chunk by chunk.
+    """
+    return (
+        queryset.order_by("id")
+        .values_list(*(lookup for _, lookup in EXPORT_COLUMNS))
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    )
+
+
+# ─────────────────────────
+# ENCODERS
+# ─────────────────────────
+class _Echo:
+    """
+    File-like object for csv.writer that hands each line back.
+    """
+
+    def write(self, value):
+        return value
+
+
+def _local(value):
+    # Both formats carry timestamps in the site's local time
+    if isinstance(value, datetime):
+        return timezone.localtime(value).isoformat()
+    return value
+
+
+def _csv_cell(value):
+    if value is None:
+        return ""
+    value = _local(value)
+    # User-entered text (names, cities) must not become a formula
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def stream_csv(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow([header for header, _ in EXPORT_COLUMNS])
+    for row in rows:
+        yield writer.writerow([_csv_cell(value) for value in row])
+
+
+def stream_ndjson(rows):
+    headers = [header for header, _ in EXPORT_COLUMNS]
+    encoder = DjangoJSONEncoder()
+    for row in rows:
+        yield encoder.encode(
+            dict(zip(headers, (_local(value) for value in row)))
+        ) + "\n"
+
+
+STREAMERS = {
+    "csv": stream_csv,
+    "ndjson": stream_ndjson,
+}
+
+
+# ─────────────────────────
+# RESPONSE
+# ─────────────────────────
+def export_response(queryset, output="csv", filename="bookings"):
+    """
+    StreamingHttpResponse of `queryset` as CSV or NDJSON.
+    Nothing is evaluated until the response is iterated.
+    """
+    content_type, extension = EXPORT_FORMATS[output]
+
+    response = StreamingHttpResponse(
+        STREAMERS[output](iter_export_rows(queryset)),
+        content_type=content_type,
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="{filename}.{extension}"'
+    )
+    return response
@@ -0,0 +1,155 @@
+# apps/bookings/services/facets.py
+
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Case, Count, F, Q, Sum, Value, When
+
+from apps.bookings.models import Booking, BookingFacetCount
+
+# Drafts are hidden from the admin list, so they are not counted
+UNCOUNTED_STATUSES = {"DRAFT"}
+
+
+def _facet_pairs(values):
+    """
+    (dimension, value) pairs a booking contributes, or none when
+    `values` is missing or the booking is not admin-visible.
+    """
+    if not values or values["status"] in UNCOUNTED_STATUSES:
+        return []
+    return [
+        (field, values[field] or "") for field in Booking.FACET_FIELDS
+    ]
+
+
+# ─────────────────────────
+# INCREMENTAL UPDATES
+# ─────────────────────────
+def _increment(manager, delta):
+    match = Q()
+    whens = []
+    for (dimension, value), change in delta.items():
+        match |= Q(dimension=dimension, value=value)
+        whens.append(When(dimension=dimension, value=value, then=Value(change)))
+
+    return manager.filter(match).update(
+        count=F("count") + Case(*whens, default=Value(0))
+    )
+
+
+def apply_facet_delta(old, new, using="default"):
+    """
+    Moves one booking's contribution from `old` to `new` tracked values
+    (Booking.tracked_values()). Either side may be None (created /
+    deleted).
+
+    One UPDATE when every row exists; values seen for the first time
+    (e.g. a new city) cost two more queries, once.
+    """
+    delta = Counter()
+    for pair in _facet_pairs(old):
+        delta[pair] -= 1
+    for pair in _facet_pairs(new):
+        delta[pair] += 1
+
+    apply_facet_counts(delta, using=using)
+
+
+def apply_facet_counts(delta, using="default"):
+    """
+    Adds {(dimension, value): change} to the counters, e.g. the summed
+    delta of a bulk status UPDATE that skipped signals.
+    """
+    delta = {pair: change for pair, change in delta.items() if change}
+    if not delta:
+        return
+
+    manager = BookingFacetCount.objects.using(using)
+
+    if _increment(manager, delta) == len(delta):
+        return
+
+    existing = set(
+        manager.filter(
+            dimension__in={dimension for dimension, _ in delta},
+            value__in={value for _, value in delta},
+        ).values_list("dimension", "value")
+    )
+    missing = {
+        pair: change for pair, change in delta.items()
+        if pair not in existing and change > 0
+    }
+    if not missing:
+        return
+
+    # Zero rows first, then increment: safe against a concurrent insert
+    manager.bulk_create(
+        [
+            BookingFacetCount(dimension=dimension, value=value, count=0)
+            for dimension, value in missing
+        ],
+        ignore_conflicts=True,
+    )
+    _increment(manager, missing)
+
+
+# ─────────────────────────
+# READS
+# ─────────────────────────
+def get_facet_counts(using="default"):
+    """
+    {dimension: {value: count}} for every facet, in one query.
+    """
+    counts = defaultdict(dict)
+    rows = BookingFacetCount.objects.using(using).filter(count__gt=0)
+
+    for dimension, value, count in rows.values_list(
+        "dimension", "value", "count"
+    ):
+        counts[dimension][value] = count
+
+    return counts
+
+
+def visible_booking_count(counts=None, using="default"):
+    """
+    Admin-visible (non-DRAFT) bookings, from the status counters: every
+    counted booking has exactly one status row. Pass `counts` when a
+    get_facet_counts() result is already in hand.
+    """
+    if counts is not None:
+        return sum(counts.get("status", {}).values())
+    return BookingFacetCount.objects.using(using).filter(
+        dimension="status"
+    ).aggregate(total=Sum("count"))["total"] or 0
+
+
+# ─────────────────────────
+# FULL REBUILD
+# ─────────────────────────
+def rebuild_facet_counts(using="default"):
+    """
+    Recounts every facet from the bookings table.
+    Needed after bulk writes that skip signals (bulk_create, update()).
+    """
+    visible = Booking.objects.using(using).exclude(
+        status__in=UNCOUNTED_STATUSES
+    )
+
+    rows = []
+    for field in Booking.FACET_FIELDS:
+        for value, count in (
+            visible.order_by()
+            .values_list(field)
+            .annotate(total=Count("id"))
+        ):
+            rows.append(BookingFacetCount(
+                dimension=field, value=value or "", count=count
+            ))
+
+    with transaction.atomic(using=using):
+        BookingFacetCount.objects.using(using).all().delete()
+        BookingFacetCount.objects.using(using).bulk_create(rows)
+
+    return len(rows)
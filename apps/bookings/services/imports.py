@@ -0,0 +1,195 @@
+# apps/bookings/services/imports.py
+
+import csv
+import io
+import json
+
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.users.services import get_or_create_users
+from apps.bookings.models import Booking
+from apps.bookings.serializers.imports import CorporateImportRowSerializer
+from apps.bookings.services.lookup_filter import remember
+from apps.bookings.services.queries import ACTIVE_STATUSES
+from apps.bookings.services.rollups import record_bulk_created
+from apps.bookings.utils.search import normalize_search_text
+
+# ─────────────────────────
+# CONFIG
+# ─────────────────────────
+MAX_IMPORT_ROWS = 10_000
+
+# Rows written per round of bulk queries (also keeps IN lists small)
+IMPORT_BATCH_SIZE = 500
+
+
+# ─────────────────────────
+# INPUT
+# ─────────────────────────
+def parse_import_file(upload):
+    """
+    Rows from an uploaded .csv (header row) or .json (list of objects).
+    """
+    name = (upload.name or "").lower()
+
+    try:
+        text = upload.read().decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise ValidationError("Import file must be UTF-8 encoded")
+
+    if name.endswith(".json"):
+        try:
+            rows = json.loads(text)
+        except ValueError:
+            raise ValidationError("Import file is not valid JSON")
+    else:
+        rows = [
+            # Empty CSV cells mean "not provided"
+            {key: value for key, value in row.items() if key and value != ""}
+            for row in csv.DictReader(io.StringIO(text))
+        ]
+
+    if not isinstance(rows, list):
+        raise ValidationError("Import must be a list of employee rows")
+    return rows
+
+
+def _validate_rows(rows):
+    """
+    (valid, errors): valid is [(row_number, data)] with unique emails.
+    One serializer instance validates every row.
+    """
+    serializer = CorporateImportRowSerializer()
+    valid = []
+    errors = []
+    seen = set()
+
+    for number, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            errors.append({"row": number, "errors": "Row must be an object"})
+            continue
+
+        try:
+            data = serializer.run_validation(row)
+        except ValidationError as exc:
+            errors.append({"row": number, "errors": exc.detail})
+            continue
+
+        if data["email"] in seen:
+            errors.append({
+                "row": number,
+                "errors": {"email": ["Duplicate email in this import"]},
+            })
+            continue
+
+        seen.add(data["email"])
+        valid.append((number, data))
+
+    return valid, errors
+
+
+# ─────────────────────────
+# IMPORT
+# ─────────────────────────
+def _resolve_users(batch):
+    """
+    email → user id for a batch, creating missing users and updating
+    changed names and phones in bulk.
+    """
+    return get_or_create_users(
+        {
+            "email": data["email"],
+            "full_name": data.get("full_name", ""),
+            "phone": data.get("phone_number", ""),
+        }
+        for _, data in batch
+    )
+
+
+def import_corporate_bookings(corporate, rows):
+    """
+    Creates DRAFT bookings for a corporate's employees in bulk.
+
+    - Rows are validated with draft rules; invalid rows are reported,
+      valid ones imported.
+    - Employees with an active booking are skipped, as in the draft flow.
+    - Verification emails are queued: drafts are created without
+      last_verification_email_sent_at and picked up by the
+      send_pending_verification_emails command.
+    """
+    if not rows:
+        raise ValidationError("No rows to import")
+
+    if len(rows) > MAX_IMPORT_ROWS:
+        raise ValidationError(
+            f"At most {MAX_IMPORT_ROWS} rows can be imported at once"
+        )
+
+    valid, errors = _validate_rows(rows)
+    skipped = []
+    created = 0
+    now = timezone.now()
+
+    with transaction.atomic():
+        for start in range(0, len(valid), IMPORT_BATCH_SIZE):
+            batch = valid[start:start + IMPORT_BATCH_SIZE]
+            users = _resolve_users(batch)
+
+            busy = set(
+                Booking.objects.filter(
+                    user_id__in=users.values(),
+                    status__in=ACTIVE_STATUSES,
+                ).values_list("user_id", flat=True)
+            )
+
+            bookings = []
+            emails = []
+            for number, data in batch:
+                email = data.pop("email")
+                data.pop("consent_given")
+
+                if users[email] in busy:
+                    skipped.append({
+                        "row": number,
+                        "email": email,
+                        "reason": "Active booking already exists",
+                    })
+                    continue
+
+                bookings.append(Booking(
+                    **data,
+                    user_id=users[email],
+                    corporate=corporate,
+                    status="DRAFT",
+                    consent_given=True,
+                    consent_given_at=now,
+                ))
+                emails.append(email)
+
+            codes = Booking.generate_acknowledgement_ids(len(bookings))
+            for booking, email, code in zip(bookings, emails, codes):
+                booking.acknowledgement_id = code
+                # bulk_create skips save(), so fill the search column here
+                booking.search_text = normalize_search_text(
+                    code,
+                    booking.full_name,
+                    email,
+                    booking.phone_number,
+                    booking.city,
+                )
+
+            Booking.objects.bulk_create(bookings)
+            remember("acknowledgement_id", codes)
+            created += len(bookings)
+
+        if created:
+            record_bulk_created(created)
+
+    return {
+        "created": created,
+        "queued_emails": created,
+        "skipped": skipped,
+        "errors": errors,
+    }
@@ -0,0 +1,196 @@
+# apps/bookings/services/lookup_filter.py
+
+import mmap
+import os
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import transaction
+
+from apps.bookings.models import Booking
+from apps.bookings.utils.bloom import BloomFilter
+
+# ─────────────────────────
+# CONFIG
+# ─────────────────────────
+# Public lookup keys kept in the filter
+LOOKUP_FIELDS = ("acknowledgement_id", "payment_reference")
+
+FILTER_ERROR_RATE = 0.01
+
+# Sized for HEADROOM × the values present at build time; once that
+# many are in, the next lookup rebuilds it
+FILTER_MIN_CAPACITY = 10_000
+FILTER_HEADROOM = 2
+
+SCAN_CHUNK_SIZE = 5000
+
+_lock = threading.RLock()
+_state = {"filter": None, "file": None}
+
+
+# ─────────────────────────
+# STORAGE
+# ─────────────────────────
+def _shared_path():
+    """
+    The filter file, or None when the filter is not in use. A miss is
+    only trusted when every process that issues values (web workers,
+    management commands) adds them to this one file, so there is no
+    per-process fallback: without BOOKING_LOOKUP_FILTER and a shared
+    BOOKING_LOOKUP_FILTER_PATH, might_exist() always says "ask".
+    """
+    if not settings.BOOKING_LOOKUP_FILTER:
+        return None
+    return settings.BOOKING_LOOKUP_FILTER_PATH or None
+
+
+@contextmanager
+def _writing(path):
+    """
+    Serialises writers: threads of this process, and every process
+    using the file.
+    """
+    import fcntl
+
+    with _lock, open(f"{path}.lock", "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
+def _map_shared(path):
+    # The old mapping is not closed: a lookup in another thread may
+    # still hold it. It goes when the last reference does.
+    with open(path, "r+b") as handle:
+        _state.update(
+            filter=BloomFilter(mmap.mmap(handle.fileno(), 0)),
+            file=(path, os.fstat(handle.fileno()).st_ino),
+        )
+
+
+def _loaded(path):
+    """
+    The current filter (re-mapping the file when another process has
+    rebuilt it), or None when none has been built yet.
+    """
+    try:
+        file = (path, os.stat(path).st_ino)
+    except FileNotFoundError:
+        return None
+    if file != _state["file"]:
+        with _lock:
+            if file != _state["file"]:
+                _map_shared(path)
+    return _state["filter"]
+
+
+def _key(field, value):
+    return f"{field}:{value}"
+
+
+# ─────────────────────────
+# BUILD
+# ─────────────────────────
+def _build(using):
+    bookings = Booking.objects.using(using)
+    capacity = max(
+        FILTER_MIN_CAPACITY,
+        bookings.count() * len(LOOKUP_FIELDS) * FILTER_HEADROOM,
+    )
+    bloom = BloomFilter.create(capacity, FILTER_ERROR_RATE)
+
+    rows = (
+        bookings.order_by()
+        .values_list(*LOOKUP_FIELDS)
+        .iterator(chunk_size=SCAN_CHUNK_SIZE)
+    )
+    for row in rows:
+        for field, value in zip(LOOKUP_FIELDS, row):
+            if value:
+                bloom.add(_key(field, value))
+
+    return bloom
+
+
+def _rebuild(path, using):
+    bloom = _build(using)
+
+    # Readers notice the new inode and re-map on their next lookup
+    temp = f"{path}.{os.getpid()}.tmp"
+    with open(temp, "wb") as handle:
+        handle.write(bloom.buffer)
+    os.replace(temp, path)
+    _map_shared(path)
+    return _state["filter"]
+
+
+def rebuild_lookup_filter(using="default"):
+    """
+    Rebuilds the shared filter file from one values_list scan of the
+    bookings table. Returns the number of values in it; 0 (and no
+    scan) when the filter is not in use.
+    """
+    path = _shared_path()
+    if not path:
+        return 0
+    with _writing(path):
+        return _rebuild(path, using).count
+
+
+def _current(path):
+    bloom = _loaded(path)
+    if bloom is not None and not bloom.is_full:
+        return bloom
+
+    with _writing(path):
+        # Another thread or process may have built it meanwhile
+        bloom = _loaded(path)
+        if bloom is None or bloom.is_full:
+            bloom = _rebuild(path, "default")
+        return bloom
+
+
+# ─────────────────────────
+# LOOKUPS
+# ─────────────────────────
+def might_exist(field, value):
+    """
+    False only when no booking has ever had `field` = `value`: the
+    caller can answer "not found" without a query. True means ask the
+    database, always so when the filter is not in use.
+    """
+    path = _shared_path()
+    if not path:
+        return True
+    return _key(field, value) in _current(path)
+
+
+def _add(path, keys):
+    bloom = _loaded(path)
+    # Not built yet: the build scans the table and will see them
+    if bloom is None or all(key in bloom for key in keys):
+        return
+
+    with _writing(path):
+        bloom = _loaded(path)
+        if bloom is not None:
+            for key in keys:
+                bloom.add(key)
+
+
+def remember(field, values):
+    """
+    Adds newly issued values: right away, and again after commit in
+    case a rebuild scanned the table before the rows were visible.
+    """
+    path = _shared_path()
+    if not path:
+        return
+
+    keys = [_key(field, value) for value in values if value]
+    if not keys:
+        return
+
+    _add(path, keys)
+    transaction.on_commit(lambda: _add(path, keys))
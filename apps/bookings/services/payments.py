@@ -1,6 +1,8 @@
 # apps/bookings/services/payments.py
 
 from uuid import uuid4
+
+from django.db import transaction
 from rest_framework.exceptions import ValidationError
 from apps.bookings.email import send_booking_confirmed_email
 
@@ -75,6 +77,20 @@ def initiate_payment(booking):
 # ─────────────────────────
 # PAYMENT COMPLETION
 # ─────────────────────────
+def _announce_confirmation(booking):
+    """
+    Marks the confirmation email sent together with the confirmation,
+    and sends it once that commits: a rolled-back confirmation is never
+    announced, and no row lock is held while the mail API is called.
+    """
+    if booking.confirmation_email_sent:
+        return
+
+    booking.confirmation_email_sent = True
+    booking.save(update_fields=["confirmation_email_sent"])
+    transaction.on_commit(lambda: send_booking_confirmed_email(booking))
+
+
 def complete_payment(booking):
     """
     Completes payment for a booking.
@@ -84,7 +100,7 @@ def complete_payment(booking):
 
     Guarantees:
     - Idempotent (safe to call multiple times)
-    - Sends confirmation email exactly once
+    - Sends confirmation email exactly once, after commit
     """
 
     # Idempotency
@@ -94,12 +110,7 @@ def complete_payment(booking):
     # Allow direct confirmation when payment is not required
     if booking.status == "APPROVED" and not is_payment_required(booking):
         confirm_booking(booking)
-
-        if not getattr(booking, "confirmation_email_sent", False):
-            send_booking_confirmed_email(booking)
-            booking.confirmation_email_sent = True
-            booking.save(update_fields=["confirmation_email_sent"])
-
+        _announce_confirmation(booking)
         return booking
 
     # Only allowed from PAYMENT_PENDING
@@ -112,10 +123,7 @@ def complete_payment(booking):
     confirm_booking(booking)
 
     # Send confirmation email once
-    if not getattr(booking, "confirmation_email_sent", False):
-        send_booking_confirmed_email(booking)
-        booking.confirmation_email_sent = True
-        booking.save(update_fields=["confirmation_email_sent"])
+    _announce_confirmation(booking)
 
     return booking
 
@@ -1,6 +1,14 @@
 # apps/bookings/services/queries.py
 
 from apps.bookings.models import Booking
+from apps.bookings.utils.pagination import keyset_page
+from apps.bookings.utils.tokens import (
+    CANCEL,
+    HISTORY,
+    VERIFY_EMAIL,
+    read_booking_token,
+    read_legacy_token,
+)
 
 # ─────────────────────────
 # SINGLE SOURCE OF TRUTH
@@ -67,4 +75,83 @@ def get_cancellable_booking(user, acknowledgement_id=None):
     if acknowledgement_id is not None:
         qs = qs.filter(acknowledgement_id=acknowledgement_id)
 
-    return qs.order_by("-created_at").first()
\ No newline at end of file
+    return qs.order_by("-created_at").first()
+
+
+# ─────────────────────────
+# HISTORY
+# ─────────────────────────
+HISTORY_FIELDS = (
+    "id",
+    "acknowledgement_id",
+    "status",
+    "mode",
+    "preferred_date",
+    "approved_slot_start",
+    "approved_slot_end",
+    "created_at",
+)
+
+
+# Purpose → UUID column of links sent before tokens were signed
+LEGACY_TOKEN_FIELDS = {
+    VERIFY_EMAIL: "email_verification_token",
+    CANCEL: "cancellation_token",
+}
+
+
+def filter_by_token(queryset, token, purpose):
+    """
+    Narrows `queryset` to the booking an email-link token points at:
+    by primary key for signed tokens, by the UUID column for legacy
+    ones. None when the token is invalid; nothing is queried then.
+    """
+
+    booking_id = read_booking_token(token, purpose)
+    if booking_id is not None:
+        return queryset.filter(pk=booking_id)
+
+    legacy = (
+        read_legacy_token(token) if purpose in LEGACY_TOKEN_FIELDS else None
+    )
+    if legacy is not None:
+        return queryset.filter(**{LEGACY_TOKEN_FIELDS[purpose]: legacy})
+
+    return None
+
+
+def get_verified_user_id(token):
+    """
+    The user behind a history token (valid 30 days) or, for links
+    from the verification email, an email-verification token (valid
+    2 days), provided that booking's email was actually verified.
+    Legacy UUID tokens never expire, so they are not accepted here.
+    None otherwise.
+    """
+
+    booking_id = read_booking_token(token, HISTORY)
+    if booking_id is None:
+        booking_id = read_booking_token(token, VERIFY_EMAIL)
+    if booking_id is None:
+        return None
+
+    return (
+        Booking.objects.filter(pk=booking_id, email_verified=True)
+        .values_list("user_id", flat=True)
+        .first()
+    )
+
+
+def get_booking_history(user_id, cursor=None, limit=20):
+    """
+    A page of the user's bookings, newest first (drafts excluded).
+    Returns (bookings, next_cursor). Raises ValueError on a bad cursor.
+    """
+
+    queryset = (
+        Booking.objects.filter(user_id=user_id)
+        .exclude(status="DRAFT")
+        .only(*HISTORY_FIELDS)
+    )
+
+    return keyset_page(queryset, cursor=cursor, limit=limit)
@@ -0,0 +1,163 @@
+# apps/bookings/services/reconciliation.py
+
+import time
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.bookings.models import Booking
+from apps.bookings.services.facets import apply_facet_counts
+from apps.bookings.services.payments import complete_payment
+from apps.bookings.services.rollups import record_bulk_transition
+from apps.bookings.services.webhooks import EXPIRED, OPEN, SETTLED
+
+# ─────────────────────────
+# CONFIG
+# ─────────────────────────
+# Bookings read per round trip
+RECONCILE_CHUNK_SIZE = 500
+
+# Payments started more recently than this may still be in progress
+RECONCILE_GRACE = timedelta(minutes=30)
+
+
+# ─────────────────────────
+# TRANSITIONS
+# ─────────────────────────
+def _confirm(ids):
+    """
+    Settled payments go through complete_payment one by one: each needs
+    its confirmation email. Each booking is read again with its row
+    locked, so a webhook worker confirming it at the same time cannot
+    send a second email. Returns (confirmed, errors).
+    """
+    confirmed = errors = 0
+    for booking_id in ids:
+        try:
+            with transaction.atomic():
+                booking = (
+                    Booking.objects.select_for_update(of=("self",))
+                    .select_related("user")
+                    .filter(pk=booking_id, status="PAYMENT_PENDING")
+                    .first()
+                )
+                if booking is None:
+                    continue
+                complete_payment(booking)
+        except ValidationError:
+            errors += 1
+        else:
+            confirmed += 1
+    return confirmed, errors
+
+
+def _fail(ids):
+    """
+    Expired payments: one UPDATE for the chunk. It skips signals, so the
+    status facets and the day rollup are adjusted here (the move touches
+    no load or usage counters).
+    """
+    if not ids:
+        return 0
+
+    with transaction.atomic():
+        failed = Booking.objects.filter(
+            id__in=ids, status="PAYMENT_PENDING"
+        ).update(status="PAYMENT_FAILED", updated_at=timezone.now())
+        if failed:
+            apply_facet_counts({
+                ("status", "PAYMENT_PENDING"): -failed,
+                ("status", "PAYMENT_FAILED"): failed,
+            })
+            record_bulk_transition("PAYMENT_FAILED", failed)
+    return failed
+
+
+# ─────────────────────────
+# RECONCILIATION
+# ─────────────────────────
+def reconcile_payments(provider, chunk_size=RECONCILE_CHUNK_SIZE,
+                       grace=RECONCILE_GRACE, max_seconds=None, limit=None):
+    """
+    Checks PAYMENT_PENDING bookings against the provider, oldest first.
+
+    Bookings are read in keyset chunks of ids and references, and the
+    provider is asked in batches of its status_batch_size. Settled
+    payments are confirmed, expired ones moved to PAYMENT_FAILED.
+
+    `max_seconds` and `limit` bound the run; a run that stops early
+    says so in the report and the next one starts from the oldest
+    booking still pending.
+    """
+    started = time.monotonic()
+    cutoff = timezone.now() - grace
+    report = {
+        "checked": 0,
+        "confirmed": 0,
+        "failed": 0,
+        "open": 0,
+        "unknown": 0,
+        "errors": 0,
+        "complete": False,
+    }
+
+    # Served by the partial booking_payment_pending_idx
+    pending = Booking.objects.filter(
+        Q(payment_requested_at__lt=cutoff)
+        | Q(payment_requested_at__isnull=True),
+        status="PAYMENT_PENDING",
+        payment_reference__isnull=False,
+    ).order_by("id")
+    last_id = 0
+
+    while True:
+        if max_seconds is not None and time.monotonic() - started >= max_seconds:
+            break
+
+        size = chunk_size
+        if limit is not None:
+            size = min(size, limit - report["checked"])
+            if size <= 0:
+                break
+
+        rows = list(
+            pending.filter(id__gt=last_id).values_list(
+                "id", "payment_reference"
+            )[:size]
+        )
+        if not rows:
+            report["complete"] = True
+            break
+        last_id = rows[-1][0]
+
+        references = [reference for _, reference in rows]
+        statuses = {}
+        for start in range(0, len(references), provider.status_batch_size):
+            statuses.update(provider.payment_statuses(
+                references[start:start + provider.status_batch_size]
+            ))
+
+        settled = []
+        expired = []
+        for booking_id, reference in rows:
+            status = statuses.get(reference)
+            if status == SETTLED:
+                settled.append(booking_id)
+            elif status == EXPIRED:
+                expired.append(booking_id)
+            elif status == OPEN:
+                report["open"] += 1
+            else:
+                report["unknown"] += 1
+
+        confirmed, errors = _confirm(settled)
+        report["checked"] += len(rows)
+        report["confirmed"] += confirmed
+        report["errors"] += errors
+        report["failed"] += _fail(expired)
+
+    report["seconds"] = round(time.monotonic() - started, 2)
+    return report
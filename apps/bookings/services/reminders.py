@@ -0,0 +1,124 @@
+# apps/bookings/services/reminders.py
+
+from collections import defaultdict
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.bookings.email import send_session_reminder_emails
+from apps.bookings.models import Booking
+
+# ─────────────────────────
+# CONFIG
+# ─────────────────────────
+# Bookings claimed and handed to the email layer at a time
+REMINDER_BATCH_SIZE = 200
+
+
+def reminder_offsets():
+    """
+    settings.SESSION_REMINDER_OFFSETS, furthest from the session first:
+    reminder_stage n means the first n of these have been sent.
+    """
+    return sorted(settings.SESSION_REMINDER_OFFSETS, reverse=True)
+
+
+def _due_stage(booking, now, offsets):
+    # Every offset already reached counts: a booking confirmed an hour
+    # before its session gets only the last reminder, once
+    until = booking.approved_slot_start - now
+    return sum(1 for offset in offsets if until <= offset)
+
+
+def due_reminders(now, offsets):
+    """
+    Confirmed upcoming sessions owed a reminder. Each stage is a range
+    on approved_slot_start, served by booking_reminder_due_idx.
+    """
+    due = Q()
+    for stage, offset in enumerate(offsets):
+        due |= Q(
+            reminder_stage__lte=stage,
+            approved_slot_start__lte=now + offset,
+        )
+
+    return Booking.objects.filter(
+        due,
+        status="CONFIRMED",
+        approved_slot_start__gt=now,
+        approved_slot_start__lte=now + offsets[0],
+    )
+
+
+def _claim(booking, stage):
+    """
+    Moves the booking to `stage` only if no other runner has (and the
+    slot has not moved) since it was read. One conditional UPDATE.
+    """
+    return Booking.objects.filter(
+        pk=booking.pk,
+        status="CONFIRMED",
+        reminder_stage=booking.reminder_stage,
+        approved_slot_start=booking.approved_slot_start,
+    ).update(reminder_stage=stage) == 1
+
+
+# ─────────────────────────
+# SENDING
+# ─────────────────────────
+def send_due_reminders(batch_size=REMINDER_BATCH_SIZE, limit=None, now=None):
+    """
+    Claims due bookings one conditional UPDATE at a time, so parallel
+    runners never send the same reminder twice, and hands each claimed
+    batch to the email layer. Undelivered reminders are released for
+    the next run. Returns {"sent", "failed", "skipped"}.
+    """
+    now = now or timezone.now()
+    offsets = reminder_offsets()
+    report = {"sent": 0, "failed": 0, "skipped": 0}
+    if not offsets:
+        return report
+
+    pending = (
+        due_reminders(now, offsets).select_related("user").order_by("id")
+    )
+    last_id = 0
+
+    while limit is None or report["sent"] + report["failed"] < limit:
+        size = batch_size if limit is None else min(
+            batch_size, limit - report["sent"] - report["failed"]
+        )
+        batch = list(pending.filter(id__gt=last_id)[:size])
+        if not batch:
+            break
+        last_id = batch[-1].id
+
+        claimed = []
+        for booking in batch:
+            stage = _due_stage(booking, now, offsets)
+            if _claim(booking, stage):
+                claimed.append((booking, stage))
+            else:
+                report["skipped"] += 1
+
+        delivered = set(send_session_reminder_emails(
+            [booking for booking, _ in claimed]
+        ))
+        released = [
+            (booking, stage) for booking, stage in claimed
+            if booking.id not in delivered
+        ]
+        report["sent"] += len(delivered)
+        report["failed"] += len(claimed) - len(delivered)
+
+        # Hand undelivered claims back, one UPDATE per stage change
+        groups = defaultdict(list)
+        for booking, stage in released:
+            groups[booking.reminder_stage, stage].append(booking.id)
+        for (previous, stage), ids in groups.items():
+            Booking.objects.filter(id__in=ids, reminder_stage=stage).update(
+                reminder_stage=previous
+            )
+
+    return report
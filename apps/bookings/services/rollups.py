@@ -0,0 +1,355 @@
+# apps/bookings/services/rollups.py
+
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import (
+    Count,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    Min,
+    Q,
+    Sum,
+)
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.bookings.models import (
+    Booking,
+    BookingDailyRollup,
+    PsychologistDailyLoad,
+)
+from apps.bookings.services.facets import get_facet_counts
+from apps.bookings.utils.counters import add_to_counters
+
+# ─────────────────────────
+# CONFIG
+# ─────────────────────────
+# Status entered → BookingDailyRollup counter
+STATUS_COLUMNS = {
+    "PENDING": "submitted",
+    "APPROVED": "approved",
+    "REJECTED": "rejected",
+    "PAYMENT_PENDING": "payment_requested",
+    "CONFIRMED": "confirmed",
+    "COMPLETED": "completed",
+    "CANCELLED": "cancelled",
+    "PAYMENT_FAILED": "payment_failed",
+}
+
+# Statuses that occupy a psychologist's calendar
+LOAD_STATUSES = {"CONFIRMED", "COMPLETED"}
+
+# Bookable minutes per psychologist per day, for utilisation
+DAILY_CAPACITY_MINUTES = 8 * 60
+
+FUNNEL_STEPS = (
+    ("created", "Draft created"),
+    ("submitted", "Email verified"),
+    ("approved", "Approved"),
+    ("confirmed", "Confirmed"),
+)
+
+PENDING_AGE_BUCKETS = (
+    ("under_24h", timedelta(hours=24)),
+    ("under_72h", timedelta(hours=72)),
+)
+
+
+# ─────────────────────────
+# INCREMENTAL UPDATES
+# ─────────────────────────
+def _load_contribution(values):
+    """
+    ((psychologist_id, day), minutes) a booking adds to the calendar,
+    or None.
+    """
+    if (
+        not values
+        or values["status"] not in LOAD_STATUSES
+        or not values["psychologist_id"]
+        or not values["approved_slot_start"]
+        or not values["approved_slot_end"]
+    ):
+        return None
+
+    length = values["approved_slot_end"] - values["approved_slot_start"]
+    day = timezone.localdate(values["approved_slot_start"])
+    return (values["psychologist_id"], day), int(length.total_seconds() // 60)
+
+
+def apply_load_delta(old, new, using="default"):
+    """
+    Moves a booking's psychologist load between tracked value snapshots
+    (status change, reschedule, reassignment, delete).
+    """
+    old_load = _load_contribution(old)
+    new_load = _load_contribution(new)
+    if old_load == new_load:
+        return
+
+    manager = PsychologistDailyLoad.objects.using(using)
+    for load, sign in ((old_load, -1), (new_load, 1)):
+        if load is None:
+            continue
+        (psychologist_id, day), minutes = load
+        add_to_counters(
+            manager,
+            {"psychologist_id": psychologist_id, "date": day},
+            {"sessions": sign, "minutes": sign * minutes},
+        )
+
+
+def record_transition(booking, previous_status, using="default"):
+    """
+    Counts a booking entering its current status today.
+    `previous_status` is None for newly created bookings.
+    """
+    status = booking.status
+    changes = defaultdict(int)
+
+    if previous_status is None:
+        changes["created"] += 1
+
+    if status in STATUS_COLUMNS and status != previous_status:
+        changes[STATUS_COLUMNS[status]] += 1
+
+    # Offline + offline-payment approvals jump straight to CONFIRMED
+    if previous_status == "PENDING" and status == "CONFIRMED":
+        changes["approved"] += 1
+
+    amount = booking.amount or Decimal("0")
+    if status == "CONFIRMED" and previous_status != "CONFIRMED":
+        changes["revenue"] += amount
+    if previous_status == "CONFIRMED" and status == "CANCELLED":
+        changes["refunded"] += amount
+
+    add_to_counters(
+        BookingDailyRollup.objects.using(using),
+        {"date": timezone.localdate()},
+        changes,
+    )
+
+
+def record_bulk_created(count, using="default"):
+    """
+    bulk_create skips post_save: count drafts created that way today.
+    """
+    add_to_counters(
+        BookingDailyRollup.objects.using(using),
+        {"date": timezone.localdate()},
+        {"created": count},
+    )
+
+
+def record_bulk_transition(status, count, using="default"):
+    """
+    Bulk status UPDATEs skip post_save: count bookings that entered
+    `status` that way today.
+    """
+    add_to_counters(
+        BookingDailyRollup.objects.using(using),
+        {"date": timezone.localdate()},
+        {STATUS_COLUMNS[status]: count},
+    )
+
+
+# ─────────────────────────
+# BACKFILL
+# ─────────────────────────
+def _count_by_day(queryset, column):
+    rows = (
+        queryset.filter(**{f"{column}__isnull": False})
+        .annotate(day=TruncDate(column))
+        .order_by()
+        .values("day")
+        .annotate(total=Count("id"), amount=Sum("amount"))
+    )
+    return {
+        row["day"]: (row["total"], row["amount"] or Decimal("0"))
+        for row in rows
+    }
+
+
+def rebuild_rollups(using="default"):
+    """
+    Recomputes every rollup from the bookings table timestamps.
+
+    COMPLETED and PAYMENT_FAILED have no timestamp of their own; they
+    are dated by session end and last update respectively.
+    """
+    bookings = Booking.objects.using(using)
+
+    sources = {
+        "created": (bookings, "created_at"),
+        "submitted": (bookings, "submitted_at"),
+        "approved": (bookings, "approved_at"),
+        "rejected": (bookings, "rejected_at"),
+        "payment_requested": (bookings, "payment_requested_at"),
+        "confirmed": (bookings, "confirmed_at"),
+        "cancelled": (bookings, "cancelled_at"),
+        "completed": (
+            bookings.filter(status="COMPLETED"), "approved_slot_end"
+        ),
+        "payment_failed": (
+            bookings.filter(status="PAYMENT_FAILED"), "updated_at"
+        ),
+    }
+
+    days = defaultdict(lambda: defaultdict(int))
+
+    for column, (queryset, source) in sources.items():
+        for day, (total, amount) in _count_by_day(queryset, source).items():
+            days[day][column] = total
+            if column == "confirmed":
+                days[day]["revenue"] = amount
+
+    refunds = _count_by_day(
+        bookings.filter(status="CANCELLED", confirmed_at__isnull=False),
+        "cancelled_at",
+    )
+    for day, (_, amount) in refunds.items():
+        days[day]["refunded"] = amount
+
+    loads = (
+        bookings.filter(
+            status__in=LOAD_STATUSES,
+            psychologist__isnull=False,
+            approved_slot_start__isnull=False,
+            approved_slot_end__isnull=False,
+        )
+        .annotate(
+            day=TruncDate("approved_slot_start"),
+            length=ExpressionWrapper(
+                F("approved_slot_end") - F("approved_slot_start"),
+                output_field=DurationField(),
+            ),
+        )
+        .order_by()
+        .values("psychologist_id", "day")
+        .annotate(sessions=Count("id"), duration=Sum("length"))
+    )
+
+    with transaction.atomic(using=using):
+        BookingDailyRollup.objects.using(using).all().delete()
+        BookingDailyRollup.objects.using(using).bulk_create(
+            [BookingDailyRollup(date=day, **counts) for day, counts in days.items()],
+            batch_size=1000,
+        )
+
+        PsychologistDailyLoad.objects.using(using).all().delete()
+        PsychologistDailyLoad.objects.using(using).bulk_create(
+            [
+                PsychologistDailyLoad(
+                    psychologist_id=row["psychologist_id"],
+                    date=row["day"],
+                    sessions=row["sessions"],
+                    minutes=int(row["duration"].total_seconds() // 60),
+                )
+                for row in loads
+            ],
+            batch_size=1000,
+        )
+
+    return len(days)
+
+
+# ─────────────────────────
+# DASHBOARD
+# ─────────────────────────
+def _pending_queue(now):
+    aggregates = {
+        "count": Count("id"),
+        "oldest": Min("submitted_at"),
+    }
+    for name, age in PENDING_AGE_BUCKETS:
+        aggregates[name] = Count("id", filter=Q(submitted_at__gte=now - age))
+
+    queue = Booking.objects.filter(status="PENDING").aggregate(**aggregates)
+    queue["oldest_age"] = now - queue["oldest"] if queue["oldest"] else None
+    queue["older"] = queue["count"] - queue["under_72h"]
+    queue["under_72h"] -= queue["under_24h"]
+    return queue
+
+
+def build_dashboard(days=30):
+    """
+    Everything the admin dashboard shows, in four small queries:
+    facet counts, the pending queue, the day rollups and the
+    psychologist loads for the last `days` days.
+    """
+    now = timezone.now()
+    today = timezone.localdate()
+    since = today - timedelta(days=days - 1)
+
+    rollups = {
+        row.date: row
+        for row in BookingDailyRollup.objects.filter(date__gte=since)
+    }
+    intake = []
+    totals = defaultdict(int)
+    for offset in range(days):
+        day = since + timedelta(days=offset)
+        row = rollups.get(day) or BookingDailyRollup(date=day)
+        intake.append({
+            "date": day,
+            "created": row.created,
+            "submitted": row.submitted,
+            "confirmed": row.confirmed,
+            "revenue": row.revenue,
+        })
+        for column in (*STATUS_COLUMNS.values(), "created"):
+            totals[column] += getattr(row, column)
+        totals["revenue"] += row.revenue
+        totals["refunded"] += row.refunded
+
+    started = totals["created"]
+    funnel = [
+        {
+            "step": label,
+            "count": totals[column],
+            "rate": (totals[column] / started * 100) if started else None,
+        }
+        for column, label in FUNNEL_STEPS
+    ]
+
+    capacity = DAILY_CAPACITY_MINUTES * days
+    utilisation = [
+        {
+            "psychologist": row["psychologist__full_name"],
+            "sessions": row["sessions"],
+            "hours": row["minutes"] / 60,
+            "utilisation": row["minutes"] / capacity * 100,
+        }
+        for row in (
+            PsychologistDailyLoad.objects.filter(
+                date__gte=since, date__lte=today
+            )
+            .values("psychologist_id", "psychologist__full_name")
+            .annotate(sessions=Sum("sessions"), minutes=Sum("minutes"))
+            .filter(sessions__gt=0)
+            .order_by("-minutes")
+        )
+    ]
+
+    status_counts = get_facet_counts().get("status", {})
+
+    return {
+        "days": days,
+        "since": since,
+        "status_counts": [
+            {"status": label, "count": status_counts.get(value, 0)}
+            for value, label in Booking.STATUS_CHOICES
+            if value != "DRAFT"
+        ],
+        "pending": _pending_queue(now),
+        "intake": intake,
+        "funnel": funnel,
+        "revenue": totals["revenue"],
+        "refunded": totals["refunded"],
+        "net_revenue": totals["revenue"] - totals["refunded"],
+        "utilisation": utilisation,
+    }
@@ -0,0 +1,152 @@
+# apps/bookings/services/search.py
+
+from django.db import connections
+from django.db.models.expressions import RawSQL
+
+from apps.bookings.utils.search import normalize_search_text
+
+# ─────────────────────────
+# CONFIG
+# ─────────────────────────
+FTS_TABLE = "bookings_booking_fts"
+
+# Trigram indexes (pg_trgm / FTS5) can only serve terms this long
+MIN_INDEXED_TERM_LENGTH = 3
+
+# FTS5 trigram tokenizer
+SQLITE_TRIGRAM_MIN_VERSION = (3, 34, 0)
+
+POSTGRES_INDEX_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS booking_search_trgm_idx "
+    "ON bookings_booking USING gin (search_text gin_trgm_ops)",
+]
+
+SQLITE_FTS_TABLE_SQL = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        search_text,
+        content='bookings_booking',
+        content_rowid='id',
+        tokenize='trigram'
+    )
+"""
+
+SQLITE_FTS_TRIGGERS = {
+    f"{FTS_TABLE}_ai": f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai
+        AFTER INSERT ON bookings_booking BEGIN
+            INSERT INTO {FTS_TABLE}(rowid, search_text)
+            VALUES (new.id, new.search_text);
+        END
+    """,
+    f"{FTS_TABLE}_ad": f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad
+        AFTER DELETE ON bookings_booking BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_text)
+            VALUES ('delete', old.id, old.search_text);
+        END
+    """,
+    f"{FTS_TABLE}_au": f"""
+        CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au
+        AFTER UPDATE OF search_text ON bookings_booking BEGIN
+            INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_text)
+            VALUES ('delete', old.id, old.search_text);
+            INSERT INTO {FTS_TABLE}(rowid, search_text)
+            VALUES (new.id, new.search_text);
+        END
+    """,
+}
+
+_fts_available = {}
+
+
+# ─────────────────────────
+# INDEX MAINTENANCE
+# ─────────────────────────
+def install_search_index(connection):
+    """
+    Idempotently creates the database-specific search index.
+
+    SQLite drops triggers whenever a migration rebuilds the bookings
+    table, so this runs after every migrate (post_migrate) and
+    rebuilds the FTS table if any trigger had gone missing.
+    """
+    _fts_available.pop(connection.alias, None)
+
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            for sql in POSTGRES_INDEX_SQL:
+                cursor.execute(sql)
+            return
+
+        if connection.vendor != "sqlite":
+            return
+
+        if connection.Database.sqlite_version_info < SQLITE_TRIGRAM_MIN_VERSION:
+            return
+
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' "
+            "AND tbl_name = 'bookings_booking'"
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+
+        cursor.execute(SQLITE_FTS_TABLE_SQL)
+
+        if not set(SQLITE_FTS_TRIGGERS) <= existing:
+            for sql in SQLITE_FTS_TRIGGERS.values():
+                cursor.execute(sql)
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+            )
+
+
+def _has_fts_table(connection):
+    """
+    Whether the FTS5 table exists on this database.
+    Checked once per connection alias.
+    """
+    if connection.alias not in _fts_available:
+        _fts_available[connection.alias] = (
+            FTS_TABLE in connection.introspection.table_names()
+        )
+    return _fts_available[connection.alias]
+
+
+# ─────────────────────────
+# SEARCH
+# ─────────────────────────
+def search_bookings(queryset, term):
+    """
+    Filters bookings whose search_text contains every word of `term`.
+
+    - PostgreSQL → LIKE '%word%', served by the GIN trigram index
+    - SQLite     → FTS5 trigram MATCH, LIKE for words under 3 chars
+    - Others     → plain LIKE on the denormalised column
+    """
+    words = normalize_search_text(term).split()
+
+    if not words:
+        return queryset
+
+    connection = connections[queryset.db]
+
+    if (
+        connection.vendor == "sqlite"
+        and _has_fts_table(connection)
+        and all(len(word) >= MIN_INDEXED_TERM_LENGTH for word in words)
+    ):
+        match = " AND ".join(
+            '"{}"'.format(word.replace('"', '""')) for word in words
+        )
+        return queryset.filter(
+            id__in=RawSQL(
+                f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s",
+                [match],
+            )
+        )
+
+    for word in words:
+        queryset = queryset.filter(search_text__contains=word)
+
+    return queryset
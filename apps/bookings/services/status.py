@@ -0,0 +1,97 @@
+# apps/bookings/services/status.py
+
+from apps.bookings.models import Booking
+from apps.bookings.serializers.fast import FastBookingPublicSerializer
+from apps.bookings.services.lookup_filter import might_exist
+
+# ─────────────────────────
+# CONFIG
+# ─────────────────────────
+MAX_BATCH_STATUS_IDS = 50
+
+# Timestamp → status reached, in timeline order
+TIMELINE_STEPS = (
+    ("created_at", "DRAFT"),
+    ("submitted_at", "PENDING"),
+    ("approved_at", "APPROVED"),
+    ("payment_requested_at", "PAYMENT_PENDING"),
+    ("confirmed_at", "CONFIRMED"),
+    ("cancelled_at", "CANCELLED"),
+    ("rejected_at", "REJECTED"),
+)
+
+# values_list() columns of a status payload: the public booking, then
+# the timeline timestamps, then the amount
+STATUS_COLUMNS = (
+    FastBookingPublicSerializer.columns
+    + tuple(stamp for stamp, _ in TIMELINE_STEPS)
+    + ("amount",)
+)
+
+_TIMELINE_START = len(FastBookingPublicSerializer.columns)
+
+
+def _status_payloads(rows):
+    serializer = FastBookingPublicSerializer()
+    payloads = []
+
+    for row in rows:
+        data = serializer.to_representation(row)
+        data["timeline"] = [
+            status
+            for (_, status), stamp in zip(
+                TIMELINE_STEPS, row[_TIMELINE_START:-1]
+            )
+            if stamp
+        ]
+        amount = row[-1]
+        data["amount"] = str(amount) if amount else None
+        payloads.append(data)
+
+    return payloads
+
+
+def get_public_status(acknowledgement_id):
+    """
+    Public status payload (booking, timeline, amount), or None.
+    """
+    if not might_exist("acknowledgement_id", acknowledgement_id):
+        return None
+
+    rows = Booking.objects.filter(
+        acknowledgement_id=acknowledgement_id
+    ).values_list(*STATUS_COLUMNS)[:1]
+
+    payloads = _status_payloads(rows)
+    return payloads[0] if payloads else None
+
+
+def get_batch_statuses(acknowledgement_ids):
+    """
+    Public statuses for many acknowledgement IDs in one query, in the
+    order asked (duplicates once). Unknown IDs get an error entry
+    instead of failing the batch; no query when none can exist.
+    """
+    acknowledgement_ids = list(dict.fromkeys(acknowledgement_ids))
+    candidates = [
+        ack_id for ack_id in acknowledgement_ids
+        if might_exist("acknowledgement_id", ack_id)
+    ]
+
+    rows = list(
+        Booking.objects.filter(
+            acknowledgement_id__in=candidates
+        ).values_list(*STATUS_COLUMNS)
+    ) if candidates else []
+    found = dict(zip((row[0] for row in rows), _status_payloads(rows)))
+
+    return [
+        {"acknowledgement_id": ack_id, "found": True, "booking": found[ack_id]}
+        if ack_id in found
+        else {
+            "acknowledgement_id": ack_id,
+            "found": False,
+            "error": "Booking not found",
+        }
+        for ack_id in acknowledgement_ids
+    ]
@@ -0,0 +1,316 @@
+# apps/bookings/services/webhooks.py
+
+import abc
+import hashlib
+import hmac
+import json
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.bookings.models import Booking, PaymentEvent
+from apps.bookings.services.payments import complete_payment
+
+# ─────────────────────────
+# CONFIG
+# ─────────────────────────
+# Provider-neutral event types; providers map theirs onto these
+PAYMENT_SUCCEEDED = "payment.succeeded"
+
+# Provider-neutral payment states (PaymentProvider.payment_statuses)
+SETTLED = "SETTLED"
+EXPIRED = "EXPIRED"
+OPEN = "OPEN"
+
+# Events claimed per worker round
+EVENT_BATCH_SIZE = 100
+
+# A claimed event not finished within this is claimed again
+EVENT_CLAIM_TIMEOUT = timedelta(minutes=5)
+
+# Unexpected errors are retried this many times, then the event is
+# marked FAILED and left for an admin
+MAX_EVENT_ATTEMPTS = 5
+
+# Wait before the first retry; doubles with every further attempt
+EVENT_RETRY_BACKOFF = timedelta(seconds=30)
+
+
+# ─────────────────────────
+# PROVIDERS
+# ─────────────────────────
+class PaymentProvider(abc.ABC):
+    """
+    What the webhook needs from a payment provider: check that a body
+    really came from it, and turn the body into events. Reconciliation
+    also asks it about payments directly.
+    """
+
+    name = ""
+
+    # References per payment_statuses() call
+    status_batch_size = 100
+
+    @abc.abstractmethod
+    def verify(self, body, headers):
+        """
+        True when `body` was signed by the provider (request.META
+        headers).
+        """
+
+    @abc.abstractmethod
+    def parse(self, body):
+        """
+        [{"event_id", "event_type", "payment_reference"}] in the body.
+        Raises ValueError for bodies it does not understand.
+        """
+
+    @abc.abstractmethod
+    def payment_statuses(self, references):
+        """
+        {reference: SETTLED / EXPIRED / OPEN} for the references the
+        provider knows; unknown ones are left out.
+        """
+
+
+class MockPaymentProvider(PaymentProvider):
+    """
+    Local stand-in for a real provider, for development and tests.
+
+    Body: one event or a list of them, each
+        {"id": ..., "type": ..., "data": {"payment_reference": ...}}
+    Header: X-Mock-Signature: t=<unix time>,v1=<hex HMAC-SHA256 of
+    "<t>.<body>" keyed with PAYMENT_WEBHOOK_SECRETS["mock"]>
+
+    Payment states live in memory: set them with set_payment_status().
+    """
+
+    name = "mock"
+    signature_header = "HTTP_X_MOCK_SIGNATURE"
+
+    # Signed bodies older than this are refused (replayed requests)
+    tolerance = 5 * 60
+
+    def __init__(self):
+        self.payments = {}
+
+    @property
+    def secret(self):
+        return settings.PAYMENT_WEBHOOK_SECRETS.get(self.name, "")
+
+    def _digest(self, timestamp, body):
+        return hmac.new(
+            self.secret.encode(),
+            f"{timestamp}.".encode() + body,
+            hashlib.sha256,
+        ).hexdigest()
+
+    def sign(self, body, timestamp=None):
+        """
+        Header value for `body`, as the provider would send it.
+        """
+        timestamp = int(time.time()) if timestamp is None else timestamp
+        return f"t={timestamp},v1={self._digest(timestamp, body)}"
+
+    def verify(self, body, headers):
+        if not self.secret:
+            return False
+
+        parts = dict(
+            part.split("=", 1)
+            for part in headers.get(self.signature_header, "").split(",")
+            if "=" in part
+        )
+        try:
+            timestamp = int(parts["t"])
+        except (KeyError, ValueError):
+            return False
+
+        if abs(time.time() - timestamp) > self.tolerance:
+            return False
+
+        return hmac.compare_digest(
+            self._digest(timestamp, body), parts.get("v1", "")
+        )
+
+    def parse(self, body):
+        data = json.loads(body)
+        events = data if isinstance(data, list) else [data]
+
+        parsed = []
+        for event in events:
+            if not isinstance(event, dict) or not event.get("id"):
+                raise ValueError("Every event needs an id")
+            parsed.append({
+                "event_id": str(event["id"]),
+                "event_type": str(event.get("type", "")),
+                "payment_reference": str(
+                    (event.get("data") or {}).get("payment_reference") or ""
+                ),
+            })
+        return parsed
+
+    def set_payment_status(self, reference, status):
+        self.payments[reference] = status
+
+    def payment_statuses(self, references):
+        return {
+            reference: self.payments[reference]
+            for reference in references
+            if reference in self.payments
+        }
+
+
+PAYMENT_PROVIDERS = {
+    provider.name: provider for provider in (MockPaymentProvider(),)
+}
+
+
+# ─────────────────────────
+# INGEST
+# ─────────────────────────
+def store_payment_events(provider, body):
+    """
+    Saves the events in a verified webhook body, in one INSERT.
+    Events already stored (redeliveries) are skipped by the unique
+    constraint. Returns the number of events in the body.
+    """
+    try:
+        events = provider.parse(body)
+    except ValueError:
+        raise ValidationError("Malformed webhook body")
+
+    payload = body.decode("utf-8", errors="replace")
+    PaymentEvent.objects.bulk_create(
+        [
+            PaymentEvent(provider=provider.name, payload=payload, **event)
+            for event in events
+        ],
+        ignore_conflicts=True,
+    )
+    return len(events)
+
+
+# ─────────────────────────
+# PROCESSING
+# ─────────────────────────
+def _claim_events(batch_size):
+    """
+    The oldest unprocessed events, claimed in one short transaction.
+    On PostgreSQL SKIP LOCKED keeps concurrent claims apart; the row
+    locks end with the claim, and claimed_until keeps other workers
+    off the events while they are applied.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        pending = PaymentEvent.objects.filter(
+            Q(claimed_until__isnull=True) | Q(claimed_until__lt=now),
+            processed_at__isnull=True,
+            attempts__lt=MAX_EVENT_ATTEMPTS,
+        ).order_by("id")
+        if connection.features.has_select_for_update_skip_locked:
+            pending = pending.select_for_update(skip_locked=True)
+
+        events = list(pending[:batch_size])
+        if events:
+            PaymentEvent.objects.filter(
+                id__in=[event.id for event in events]
+            ).update(
+                claimed_until=now + EVENT_CLAIM_TIMEOUT,
+                attempts=F("attempts") + 1,
+            )
+
+    for event in events:
+        event.attempts += 1
+    return events
+
+
+def _apply_event(event, booking_id):
+    """
+    (outcome, error) for one event, in its own transaction with the
+    booking row locked. ValidationError from the booking lifecycle is
+    final; anything else propagates to be retried.
+    """
+    if event.event_type != PAYMENT_SUCCEEDED:
+        return "IGNORED", f"Unhandled event type: {event.event_type}"
+
+    if booking_id is None:
+        return "IGNORED", "Unknown payment reference"
+
+    with transaction.atomic():
+        booking = (
+            Booking.objects.select_for_update(of=("self",))
+            .select_related("user")
+            .get(pk=booking_id)
+        )
+        if booking.status == "CONFIRMED":
+            return "IGNORED", "Booking already confirmed"
+
+        try:
+            with transaction.atomic():
+                complete_payment(booking)
+        except ValidationError as exc:
+            return "FAILED", "; ".join(map(str, exc.detail))
+
+    return "APPLIED", ""
+
+
+def _retry_at(event, now):
+    """
+    When a failed event may be claimed again: EVENT_RETRY_BACKOFF after
+    the first attempt, twice as long after each one since.
+    """
+    return now + EVENT_RETRY_BACKOFF * 2 ** (event.attempts - 1)
+
+
+def process_payment_events(batch_size=EVENT_BATCH_SIZE):
+    """
+    Applies the oldest unprocessed events to their bookings.
+
+    The batch is claimed in a short transaction of its own, so several
+    workers can drain the queue side by side; each event is then
+    applied in its own transaction. Booking ids for the whole batch
+    are fetched in one query, and every event's outcome is written
+    back in one UPDATE. Events that fail unexpectedly are retried
+    after a growing backoff. Returns the number of events handled.
+    """
+    events = _claim_events(batch_size)
+    if not events:
+        return 0
+
+    booking_ids = dict(
+        Booking.objects.filter(
+            payment_reference__in={
+                event.payment_reference
+                for event in events
+                if event.event_type == PAYMENT_SUCCEEDED
+            }
+        ).values_list("payment_reference", "id")
+    )
+
+    now = timezone.now()
+    for event in events:
+        try:
+            event.outcome, event.error = _apply_event(
+                event, booking_ids.get(event.payment_reference)
+            )
+        except Exception as exc:
+            event.error = f"{type(exc).__name__}: {exc}"
+            if event.attempts < MAX_EVENT_ATTEMPTS:
+                # Stays claimed until its retry is due
+                event.claimed_until = _retry_at(event, now)
+                continue
+            event.outcome = "FAILED"
+        event.claimed_until = None
+        event.processed_at = now
+
+    PaymentEvent.objects.bulk_update(
+        events, ["outcome", "error", "processed_at", "claimed_until"]
+    )
+
+    return len(events)
@@ -0,0 +1,187 @@
+# apps/bookings/signals.py
+
+from django.db import connections
+from django.db.models import F
+
+from apps.bookings.models import Booking
+from apps.bookings.services.calendar_feeds import (
+    invalidate_feed_delta,
+    reissues_feed_event,
+)
+from apps.bookings.services.facets import apply_facet_delta
+from apps.bookings.services.lookup_filter import LOOKUP_FIELDS, remember
+from apps.bookings.services.rollups import apply_load_delta, record_transition
+from apps.bookings.services.search import install_search_index
+from apps.corporates.services.usage import apply_usage_delta
+
+
+def ensure_search_index(sender, using="default", **kwargs):
+    """
+    post_migrate: re-create search triggers dropped by table rebuilds.
+    """
+    install_search_index(connections[using])
+
+
+# ─────────────────────────
+# DERIVED COUNTERS
+# ─────────────────────────
+# Admin facets, dashboard rollups, corporate usage and cached calendar
+# feeds all follow deltas between the stored and saved
+# Booking.TRACKED_FIELDS.
+# pre_save / pre_delete read the stored values under a row lock
+# (Booking.save holds it until the write), never from the instance:
+# an instance loaded earlier may be stale, or hold values from a
+# transaction that rolled back.
+def _written_fields(sender, update_fields):
+    # update_fields may name a foreign key either way ("corporate" or
+    # "corporate_id"); tracked values use the column attribute
+    return {sender._meta.get_field(name).attname for name in update_fields}
+
+
+def _touches_tracked(sender, update_fields):
+    return update_fields is None or bool(
+        set(sender.TRACKED_FIELDS) & _written_fields(sender, update_fields)
+    )
+
+
+def _apply_deltas(old, new, using):
+    apply_facet_delta(old, new, using=using)
+    apply_load_delta(old, new, using=using)
+    apply_usage_delta(old, new, using=using)
+    invalidate_feed_delta(old, new, using=using)
+
+
+def _lock_stored_values(sender, instance, using):
+    return (
+        sender.objects.using(using)
+        .select_for_update()
+        .filter(pk=instance.pk)
+        .values(*sender.TRACKED_FIELDS)
+        .first()
+    )
+
+
+def capture_stored_values(sender, instance, raw=False, using="default",
+                          update_fields=None, **kwargs):
+    if (
+        raw
+        or instance._state.adding
+        or not _touches_tracked(sender, update_fields)
+    ):
+        return
+
+    instance._stored_values = _lock_stored_values(sender, instance, using)
+
+
+def capture_deleted_values(sender, instance, using="default", **kwargs):
+    instance._stored_values = _lock_stored_values(sender, instance, using)
+
+
+def booking_saved(sender, instance, created, raw=False, using="default",
+                  update_fields=None, **kwargs):
+    stored = instance.__dict__.pop("_stored_values", None)
+    if raw or not _touches_tracked(sender, update_fields):
+        return
+
+    current = instance.tracked_values()
+    if stored and update_fields is not None:
+        # Fields left out of the save still hold their stored values
+        written = _written_fields(sender, update_fields)
+        current = {
+            field: value if field in written else stored[field]
+            for field, value in current.items()
+        }
+    previous_status = stored["status"] if stored else None
+
+    if created or (stored and previous_status != instance.status):
+        record_transition(instance, previous_status, using=using)
+
+    _apply_deltas(stored, current, using)
+
+    changes = {}
+    # A moved session gets its reminders again
+    if (
+        stored
+        and instance.reminder_stage
+        and stored["approved_slot_start"] != current["approved_slot_start"]
+    ):
+        changes["reminder_stage"] = 0
+    if reissues_feed_event(stored, current):
+        changes["ics_sequence"] = F("ics_sequence") + 1
+
+    if changes:
+        booking = sender.objects.using(using).filter(pk=instance.pk)
+        booking.update(**changes)
+        if "ics_sequence" in changes:
+            instance.ics_sequence = booking.values_list(
+                "ics_sequence", flat=True
+            ).get()
+        if "reminder_stage" in changes:
+            instance.reminder_stage = 0
+
+
+def booking_deleted(sender, instance, using="default", **kwargs):
+    stored = instance.__dict__.pop("_stored_values", None)
+    if stored:
+        _apply_deltas(stored, None, using)
+
+
+# ─────────────────────────
+# SEARCH TEXT
+# ─────────────────────────
+# Booking.search_text includes the user's email, so an email change on
+# AppUser has to reach every booking of that user
+def capture_stored_email(sender, instance, raw=False, using="default",
+                         update_fields=None, **kwargs):
+    if (
+        raw
+        or instance._state.adding
+        or (update_fields is not None and "email" not in update_fields)
+    ):
+        return
+
+    instance._stored_email = (
+        sender.objects.using(using)
+        .filter(pk=instance.pk)
+        .values_list("email", flat=True)
+        .first()
+    )
+
+
+def refresh_search_text(sender, instance, created, raw=False,
+                        using="default", **kwargs):
+    stored = instance.__dict__.pop("_stored_email", None)
+    if raw or created or stored is None:
+        return
+    # search_text is lower-cased, so a change of case changes nothing
+    if stored.lower() == instance.email.lower():
+        return
+
+    bookings = list(
+        Booking.objects.using(using)
+        .filter(user_id=instance.pk)
+        .only(*Booking.SEARCH_SOURCE_FIELDS)
+    )
+    for booking in bookings:
+        booking.user = instance
+        booking.search_text = booking.build_search_text()
+    Booking.objects.using(using).bulk_update(
+        bookings, ["search_text"], batch_size=500
+    )
+
+
+# ─────────────────────────
+# LOOKUP FILTER
+# ─────────────────────────
+def remember_lookup_keys(sender, instance, raw=False, update_fields=None,
+                         **kwargs):
+    """
+    post_save: new acknowledgement IDs and payment references must be
+    in the lookup filter before clients can ask about them.
+    """
+    if raw:
+        return
+
+    for field in LOOKUP_FIELDS:
+        if update_fields is None or field in update_fields:
+            remember(field, [getattr(instance, field)])
@@ -0,0 +1,158 @@
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.bookings.models import Booking, BookingFacetCount
+from apps.corporates.models import Corporate
+from apps.psychologists.models import Psychologist
+from apps.users.models import AppUser
+
+# ─────────────────────────
+# QUERY-COUNT REGRESSION SUITE
+# ─────────────────────────
+# Every endpoint is exercised at a small and a large table size with
+# the same pinned query count, proving the count does not grow with
+# data. If a pinned number changes, the change must be intentional.
+
+SMALL_ROWS = 3
+LARGE_ROWS = 40
+
+
+def make_booking(user, status="PENDING", **extra):
+    slot_start = timezone.now() + timedelta(days=7)
+    defaults = {
+        "full_name": "Test User",
+        "phone_number": "9999999999",
+        "city": "Surat",
+        "mode": "ONLINE",
+        "payment_mode": "ONLINE",
+        "preferred_date": slot_start.date(),
+        "preferred_period": "MORNING",
+        "email_verified": status != "DRAFT",
+        "consent_given": True,
+    }
+    if status not in {"DRAFT", "PENDING", "REJECTED"}:
+        defaults.update({
+            "approved_slot_start": slot_start,
+            "approved_slot_end": slot_start + timedelta(hours=1),
+            "amount": Decimal("1500.00"),
+        })
+    defaults.update(extra)
+    return Booking.objects.create(user=user, status=status, **defaults)
+
+
+class BookingTestCase(TestCase):
+    """
+    Outbound email stubbed, plus helpers for users and JSON requests.
+    """
+
+    def setUp(self):
+        patcher = mock.patch(
+            "apps.bookings.email._send_email", return_value=True
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def new_user(self):
+        return AppUser.objects.create(email=f"{uuid.uuid4().hex}@example.com")
+
+    def post_json(self, path, data, **extra):
+        return self.client.post(
+            path, data, content_type="application/json", **extra
+        )
+
+
+class QueryCountTestCase(BookingTestCase):
+    """
+    Shared fixtures: filler rows spread across users, psychologists and
+    corporates so list-style pages have something to N+1 over.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.psychologist = Psychologist.objects.create(
+            full_name="Dr. Test",
+            email="psy@example.com",
+            specialization="GENERAL",
+            experience_years=5,
+        )
+        cls.corporate = Corporate.objects.create(
+            name="Test Corp",
+            contact_email="hr@example.com",
+        )
+        cls.filler_rows = 0
+        # Steady state: every facet value already has its counter row
+        BookingFacetCount.objects.bulk_create([
+            BookingFacetCount(dimension=field, value=value)
+            for field in ("status", "mode", "preferred_period")
+            for value, _ in Booking._meta.get_field(field).choices
+        ] + [BookingFacetCount(dimension="city", value="Surat")])
+
+    def seed_rows(self, total):
+        """
+        Top up filler bookings (each with its own user) to `total`.
+        """
+        statuses = ("PENDING", "APPROVED", "CONFIRMED", "CANCELLED")
+        while self.filler_rows < total:
+            n = self.filler_rows
+            user = AppUser.objects.create(email=f"filler{n}@example.com")
+            make_booking(
+                user,
+                status=statuses[n % len(statuses)],
+                psychologist=self.psychologist,
+                corporate=self.corporate,
+            )
+            self.filler_rows += 1
+
+    def assertQueriesAtEachSize(self, num, perform, prepare=None,
+                                status=200):
+        """
+        Run `perform(prepare())` at every table size and pin its query
+        count, on-commit work (emails) included. `prepare` builds
+        per-request fixtures outside the count.
+        """
+        for rows in (SMALL_ROWS, LARGE_ROWS):
+            self.seed_rows(rows)
+            context = prepare() if prepare else None
+            with self.subTest(rows=rows):
+                with self.assertNumQueries(num), \
+                        self.captureOnCommitCallbacks(execute=True):
+                    response = perform(context)
+                self.assertEqual(response.status_code, status)
+
+
+# ─────────────────────────
+# ADMIN API (JWT)
+# ─────────────────────────
+class AdminApiTestCase(QueryCountTestCase):
+    """
+    Staff user with a JWT access token in self.auth.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        get_user_model().objects.create_user(
+            username="staff", password="staff-password", is_staff=True
+        )
+
+    def setUp(self):
+        super().setUp()
+        token = self.post_json("/api/token/", {
+            "username": "staff",
+            "password": "staff-password",
+        }).json()["access"]
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+
+    def export(self, query=""):
+        response = self.client.get(
+            f"/api/bookings/admin/export/{query}", **self.auth
+        )
+        # Rows are only fetched while the body streams
+        response.body = b"".join(response.streaming_content).decode()
+        return response
@@ -0,0 +1,1415 @@
+import csv
+import io
+import json
+import mmap
+import os
+import tempfile
+import uuid
+from datetime import time as datetime_time, timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib import admin
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from apps.bookings.management.commands.send_pending_verification_emails import (
+    _claim,
+)
+from apps.bookings.models import (
+    Booking,
+    BookingDailyRollup,
+    PsychologistDailyLoad,
+)
+from apps.bookings.serializers.fast import FastBookingPublicSerializer
+from apps.bookings.serializers.public import BookingPublicSerializer
+from apps.bookings.services.facets import (
+    get_facet_counts,
+    rebuild_facet_counts,
+    visible_booking_count,
+)
+from apps.bookings.services.lookup_filter import (
+    might_exist,
+    rebuild_lookup_filter,
+)
+from apps.bookings.services.rollups import build_dashboard, rebuild_rollups
+from apps.bookings.services.search import search_bookings
+from apps.bookings.services.status import MAX_BATCH_STATUS_IDS
+from apps.bookings.tests.base import (
+    LARGE_ROWS,
+    SMALL_ROWS,
+    AdminApiTestCase,
+    BookingTestCase,
+    QueryCountTestCase,
+    make_booking,
+)
+from apps.bookings.utils.bloom import BloomFilter
+from apps.bookings.utils.pagination import (
+    EstimatedCountPaginator,
+    encode_cursor,
+)
+from apps.bookings.utils.tokens import (
+    CANCEL,
+    HISTORY,
+    TOKEN_MAX_AGE,
+    VERIFY_EMAIL,
+    make_booking_token,
+    read_booking_token,
+)
+from apps.core.idempotency import IDEMPOTENCY_KEY_TTL, IN_FLIGHT_TIMEOUT
+from apps.core.models import IdempotencyRecord
+from apps.users.models import AppUser
+from apps.psychologists.models import Psychologist
+from apps.corporates.models import Corporate
+
+
+# ─────────────────────────
+# PUBLIC BOOKING API
+# ─────────────────────────
+class BookingApiQueryCountTests(QueryCountTestCase):
+
+    def test_draft_create(self):
+        self.assertQueriesAtEachSize(
+            10,
+            prepare=lambda: {
+                "email": f"{uuid.uuid4().hex}@example.com",
+                "consent_given": True,
+                "full_name": "New User",
+                "phone_number": "9999999999",
+                "mode": "ONLINE",
+                "payment_mode": "ONLINE",
+            },
+            perform=lambda payload: self.post_json(
+                "/api/bookings/draft/", payload
+            ),
+            status=201,
+        )
+
+    def test_draft_with_active_booking(self):
+        self.assertQueriesAtEachSize(
+            5,
+            prepare=lambda: make_booking(self.new_user(), status="PENDING"),
+            perform=lambda booking: self.post_json("/api/bookings/draft/", {
+                "email": booking.user.email,
+                "consent_given": True,
+            }),
+        )
+
+    def test_verify_email(self):
+        self.assertQueriesAtEachSize(
+            7,
+            prepare=lambda: make_booking(self.new_user(), status="DRAFT"),
+            perform=lambda booking: self.client.get(
+                "/api/bookings/verify-email/",
+                {"token": make_booking_token(booking.id, VERIFY_EMAIL)},
+            ),
+        )
+
+    def test_confirm_requires_token(self):
+        self.assertQueriesAtEachSize(
+            0,
+            perform=lambda _: self.post_json("/api/bookings/confirm/", {}),
+            status=400,
+        )
+
+    def test_check_status_by_acknowledgement_id(self):
+        self.assertQueriesAtEachSize(
+            1,
+            prepare=lambda: make_booking(self.new_user(), status="CONFIRMED"),
+            perform=lambda booking: self.client.get(
+                "/api/bookings/check-status/",
+                {"acknowledgement_id": booking.acknowledgement_id},
+            ),
+        )
+
+    def test_check_status_batch(self):
+        def prepare():
+            return [
+                make_booking(self.new_user(), status=status).acknowledgement_id
+                for status in ("PENDING", "CONFIRMED", "CANCELLED")
+            ]
+
+        self.assertQueriesAtEachSize(
+            1,
+            prepare=prepare,
+            perform=lambda ids: self.post_json(
+                "/api/bookings/check-status/batch/",
+                {"acknowledgement_ids": ids + ["MS-UNKNOWN"]},
+            ),
+        )
+
+    def test_check_status_by_email(self):
+        self.assertQueriesAtEachSize(
+            5,
+            prepare=lambda: make_booking(self.new_user(), status="PENDING"),
+            perform=lambda booking: self.post_json(
+                "/api/bookings/check-status/", {"email": booking.user.email}
+            ),
+        )
+
+    def test_request_cancellation_instant(self):
+        self.assertQueriesAtEachSize(
+            6,
+            prepare=lambda: make_booking(self.new_user(), status="APPROVED"),
+            perform=lambda booking: self.post_json(
+                "/api/bookings/request-cancellation/",
+                {"acknowledgement_id": booking.acknowledgement_id},
+            ),
+        )
+
+    def test_request_cancellation_confirmed(self):
+        self.assertQueriesAtEachSize(
+            3,
+            prepare=lambda: make_booking(self.new_user(), status="CONFIRMED"),
+            perform=lambda booking: self.post_json(
+                "/api/bookings/request-cancellation/",
+                {"acknowledgement_id": booking.acknowledgement_id},
+            ),
+        )
+
+    def test_verify_cancellation(self):
+        self.assertQueriesAtEachSize(
+            6,
+            prepare=lambda: make_booking(
+                self.new_user(),
+                status="CONFIRMED",
+                cancellation_requested_at=timezone.now(),
+            ),
+            perform=lambda booking: self.client.get(
+                "/api/bookings/verify-cancellation/",
+                {"token": make_booking_token(booking.id, CANCEL)},
+            ),
+        )
+
+    def test_initiate_payment(self):
+        self.assertQueriesAtEachSize(
+            5,
+            prepare=lambda: make_booking(self.new_user(), status="APPROVED"),
+            perform=lambda booking: self.post_json(
+                "/api/bookings/initiate-payment/",
+                {"acknowledgement_id": booking.acknowledgement_id},
+            ),
+        )
+
+    def test_complete_payment(self):
+        self.assertQueriesAtEachSize(
+            7,
+            prepare=lambda: make_booking(
+                self.new_user(),
+                status="PAYMENT_PENDING",
+                payment_reference=f"PAY-{uuid.uuid4().hex[:12].upper()}",
+            ),
+            perform=lambda booking: self.post_json(
+                "/api/bookings/complete-payment/",
+                {"payment_reference": booking.payment_reference},
+            ),
+        )
+
+
+
+# ─────────────────────────
+# ADMIN API (JWT)
+# ─────────────────────────
+class AdminApiQueryCountTests(AdminApiTestCase):
+
+    def test_admin_approve(self):
+        slot_start = timezone.now() + timedelta(days=3)
+        self.assertQueriesAtEachSize(
+            7,
+            prepare=lambda: make_booking(self.new_user(), status="PENDING"),
+            perform=lambda booking: self.post_json(
+                f"/api/bookings/admin/bookings/{booking.id}/approve/",
+                {
+                    "start": slot_start.isoformat(),
+                    "end": (slot_start + timedelta(hours=1)).isoformat(),
+                    "amount": "1500.00",
+                    "psychologist": self.psychologist.id,
+                },
+                **self.auth,
+            ),
+        )
+
+    def test_admin_reject(self):
+        self.assertQueriesAtEachSize(
+            6,
+            prepare=lambda: make_booking(self.new_user(), status="PENDING"),
+            perform=lambda booking: self.post_json(
+                f"/api/bookings/admin/bookings/{booking.id}/reject/",
+                {"reason": "No slots"},
+                **self.auth,
+            ),
+        )
+
+    def test_admin_export(self):
+        self.assertQueriesAtEachSize(
+            2, perform=lambda _: self.export("?output=csv")
+        )
+
+
+class AdminApiValidationTests(AdminApiTestCase):
+
+    def test_unknown_ids_are_rejected(self):
+        booking = make_booking(self.new_user(), status="PENDING")
+        slot_start = timezone.now() + timedelta(days=3)
+        approve = {
+            "start": slot_start.isoformat(),
+            "end": (slot_start + timedelta(hours=1)).isoformat(),
+            "amount": "1500.00",
+        }
+        requests = (
+            (f"/api/bookings/admin/bookings/{booking.id}/approve/",
+             {**approve, "psychologist": 999999}),
+            (f"/api/bookings/admin/bookings/{booking.id}/approve/",
+             {**approve, "corporate": 999999}),
+            ("/api/bookings/admin/bookings/999999/approve/", approve),
+            ("/api/bookings/admin/bookings/999999/reject/", {}),
+        )
+        for path, data in requests:
+            with self.subTest(path=path, data=data):
+                response = self.post_json(path, data, **self.auth)
+                self.assertEqual(response.status_code, 400)
+
+        booking.refresh_from_db()
+        self.assertEqual(booking.status, "PENDING")
+
+
+class BookingExportTests(AdminApiTestCase):
+
+    def test_csv_export_streams_every_visible_booking(self):
+        self.seed_rows(SMALL_ROWS)
+        make_booking(self.new_user(), status="DRAFT")
+
+        response = self.export()
+        rows = list(csv.DictReader(response.body.splitlines()))
+
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertEqual(len(rows), SMALL_ROWS)
+        self.assertEqual(rows[0]["corporate"], "Test Corp")
+
+    def test_csv_cells_cannot_start_a_formula(self):
+        make_booking(
+            self.new_user(),
+            status="PENDING",
+            full_name='=HYPERLINK("http://evil.example")',
+            city="@SUM(A1)",
+        )
+
+        csv_row = next(csv.DictReader(self.export().body.splitlines()))
+        self.assertEqual(
+            csv_row["full_name"], '\'=HYPERLINK("http://evil.example")'
+        )
+        self.assertEqual(csv_row["city"], "'@SUM(A1)")
+        self.assertEqual(csv_row["amount"], "")
+
+        ndjson_row = json.loads(self.export("?output=ndjson").body)
+        self.assertEqual(ndjson_row["city"], "@SUM(A1)")
+
+    def test_ndjson_export_with_filters(self):
+        self.seed_rows(SMALL_ROWS)
+        response = self.export("?output=ndjson&status=confirmed,approved")
+        rows = [json.loads(line) for line in response.body.splitlines()]
+
+        self.assertEqual(
+            sorted(row["status"] for row in rows), ["APPROVED", "CONFIRMED"]
+        )
+        self.assertEqual(rows[0]["amount"], "1500.00")
+
+    def test_date_range_on_session(self):
+        self.seed_rows(SMALL_ROWS)
+        today = timezone.localdate()
+        response = self.export(
+            f"?output=ndjson&date_field=session&date_to={today}"
+        )
+        self.assertEqual(response.body, "")
+
+    def test_invalid_filters(self):
+        response = self.client.get(
+            "/api/bookings/admin/export/?status=NOPE", **self.auth
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_requires_admin(self):
+        response = self.client.get("/api/bookings/admin/export/")
+        self.assertEqual(response.status_code, 401)
+
+
+class CorporateImportTests(AdminApiTestCase):
+
+    def employees(self, count, prefix="emp"):
+        return [
+            {
+                "email": f"{prefix}{n}@corp.example.com",
+                "full_name": f"Employee {n}",
+                "phone_number": "9999999999",
+                "mode": "ONLINE",
+                "consent_given": True,
+            }
+            for n in range(count)
+        ]
+
+    def import_rows(self, payload, **extra):
+        return self.post_json(
+            f"/api/bookings/admin/corporates/{self.corporate.id}/import/",
+            payload,
+            **self.auth,
+            **extra,
+        )
+
+    def test_query_count_does_not_grow_with_rows(self):
+        self.seed_rows(SMALL_ROWS)
+        for count in (SMALL_ROWS, LARGE_ROWS):
+            rows = self.employees(count, prefix=f"batch{count}-")
+            with self.subTest(rows=count):
+                with CaptureQueriesContext(connection) as ctx:
+                    response = self.import_rows({"employees": rows})
+                self.assertEqual(response.json()["created"], count)
+
+                # SQLite splits the booking INSERT at 999 parameters;
+                # everything else is a fixed number of bulk statements.
+                other = [
+                    query for query in ctx.captured_queries
+                    if not query["sql"].startswith(
+                        'INSERT INTO "bookings_booking"'
+                    )
+                ]
+                self.assertEqual(len(other), 10)
+
+    def test_import_creates_queued_drafts(self):
+        response = self.import_rows(self.employees(2))
+
+        self.assertEqual(response.status_code, 201)
+        bookings = Booking.objects.filter(corporate=self.corporate)
+        self.assertEqual(bookings.count(), 2)
+        booking = bookings.select_related("user").first()
+        self.assertEqual(booking.status, "DRAFT")
+        self.assertIsNone(booking.last_verification_email_sent_at)
+        self.assertTrue(booking.acknowledgement_id.startswith("MS-"))
+        self.assertIn(booking.user.email, booking.search_text)
+
+    def test_invalid_and_busy_rows_are_reported(self):
+        make_booking(
+            AppUser.objects.create(email="emp1@corp.example.com"),
+            status="PENDING",
+        )
+        rows = self.employees(3)
+        rows[0]["consent_given"] = False
+        rows.append(dict(rows[2]))
+
+        report = self.import_rows(rows).json()
+
+        self.assertEqual(report["created"], 1)
+        self.assertEqual([e["row"] for e in report["errors"]], [1, 4])
+        self.assertEqual(report["skipped"][0]["email"], "emp1@corp.example.com")
+
+    def test_csv_upload(self):
+        upload = SimpleUploadedFile(
+            "employees.csv",
+            b"email,full_name,phone_number,mode,consent_given,city\n"
+            b"A@Corp.example.com,Asha,9999999999,ONLINE,true,\n",
+            content_type="text/csv",
+        )
+        response = self.client.post(
+            f"/api/bookings/admin/corporates/{self.corporate.id}/import/",
+            {"file": upload},
+            **self.auth,
+        )
+
+        self.assertEqual(response.json()["created"], 1)
+        self.assertTrue(
+            AppUser.objects.filter(email="a@corp.example.com").exists()
+        )
+
+    def test_pending_verification_emails_are_sent_once(self):
+        self.import_rows(self.employees(3))
+        # Not queued by an import: left to the draft view
+        self_serve = make_booking(self.new_user(), status="DRAFT")
+
+        call_command("send_pending_verification_emails", stdout=io.StringIO())
+        call_command("send_pending_verification_emails", stdout=io.StringIO())
+
+        from apps.bookings import email
+        self.assertEqual(email._send_email.call_count, 3)
+        self.assertEqual(
+            list(Booking.objects.filter(
+                last_verification_email_sent_at__isnull=True
+            )),
+            [self_serve],
+        )
+
+    def test_pending_verification_emails_are_claimed(self):
+        self.import_rows(self.employees(3))
+        first, taken, undelivered = Booking.objects.filter(
+            status="DRAFT"
+        ).order_by("id")
+
+        def competing_claim(booking, claimed_at):
+            # Another run claims `taken` between our read and our claim
+            if booking.pk == taken.pk:
+                _claim(booking, timezone.now())
+            return _claim(booking, claimed_at)
+
+        from apps.bookings import email
+        email._send_email.side_effect = (
+            lambda message: message.get()["personalizations"][0]["to"][0]
+            ["email"] != undelivered.user.email
+        )
+        out = io.StringIO()
+        with mock.patch(
+            "apps.bookings.management.commands."
+            "send_pending_verification_emails._claim",
+            side_effect=competing_claim,
+        ):
+            call_command("send_pending_verification_emails", stdout=out)
+
+        self.assertEqual(email._send_email.call_count, 2)
+        self.assertIn("1 failed, 1 claimed by another run", out.getvalue())
+        self.assertEqual(
+            list(Booking.objects.filter(
+                last_verification_email_sent_at__isnull=True
+            )),
+            [undelivered],
+        )
+
+
+# ─────────────────────────
+# DJANGO ADMIN PAGES
+# ─────────────────────────
+class AdminPageQueryCountTests(QueryCountTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.superuser = get_user_model().objects.create_superuser(
+            username="admin", password="admin-password", email="a@example.com"
+        )
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.superuser)
+        # Content types are cached per process; warm them so the first
+        # request of a test does not pay for the lookup.
+        ContentType.objects.get_for_models(
+            Booking, AppUser, Psychologist, Corporate
+        )
+        # Same for the one-off FTS table introspection behind search.
+        search_bookings(Booking.objects.none(), "warm")
+        # Admin last-seen reaches the session at most once a minute;
+        # record it now so no measured request pays for the write.
+        self.get_admin("/admin/")
+
+    def get_admin(self, path):
+        return self.client.get(path, HTTP_ACCEPT="text/html")
+
+    def test_index(self):
+        self.assertQueriesAtEachSize(
+            5, perform=lambda _: self.get_admin("/admin/")
+        )
+
+    def test_changelist(self):
+        self.assertQueriesAtEachSize(
+            7, perform=lambda _: self.get_admin("/admin/bookings/booking/")
+        )
+
+    def test_filtered_changelist(self):
+        self.assertQueriesAtEachSize(
+            7,
+            perform=lambda _: self.get_admin(
+                "/admin/bookings/booking/?status__exact=CONFIRMED"
+            ),
+        )
+
+    def test_change_form(self):
+        self.assertQueriesAtEachSize(
+            6,
+            prepare=lambda: make_booking(self.new_user(), status="PENDING"),
+            perform=lambda booking: self.get_admin(
+                f"/admin/bookings/booking/{booking.id}/change/"
+            ),
+        )
+
+    def test_searched_changelist(self):
+        self.assertQueriesAtEachSize(
+            7,
+            perform=lambda _: self.get_admin(
+                "/admin/bookings/booking/?q=filler1"
+            ),
+        )
+
+    def test_dashboard(self):
+        self.assertQueriesAtEachSize(
+            8,
+            perform=lambda _: self.get_admin(
+                "/admin/bookings/booking/dashboard/"
+            ),
+        )
+
+    def test_export_action(self):
+        self.seed_rows(SMALL_ROWS)
+        response = self.client.post("/admin/bookings/booking/", {
+            "action": "export_csv",
+            "select_across": "1",
+            "index": "0",
+            # The UI posts the ticked page rows along with select_across
+            "_selected_action": [Booking.objects.first().pk],
+        })
+        body = b"".join(response.streaming_content).decode()
+        self.assertEqual(len(body.splitlines()), SMALL_ROWS + 1)
+
+    def test_add_form(self):
+        self.assertQueriesAtEachSize(
+            4, perform=lambda _: self.get_admin("/admin/bookings/booking/add/")
+        )
+
+    def test_calendar(self):
+        self.assertQueriesAtEachSize(
+            2,
+            perform=lambda _: self.get_admin(
+                "/admin/bookings/booking/calendar/"
+            ),
+        )
+
+    def test_calendar_data(self):
+        self.assertQueriesAtEachSize(
+            3,
+            perform=lambda _: self.get_admin(
+                "/admin/bookings/booking/calendar/data/"
+            ),
+        )
+
+    def test_calendar_list(self):
+        self.assertQueriesAtEachSize(
+            3,
+            perform=lambda _: self.get_admin(
+                "/admin/bookings/booking/calendar/list/"
+            ),
+        )
+
+    def test_user_changelist(self):
+        self.assertQueriesAtEachSize(
+            7, perform=lambda _: self.get_admin("/admin/users/appuser/")
+        )
+
+    def test_psychologist_changelist(self):
+        self.assertQueriesAtEachSize(
+            7,
+            perform=lambda _: self.get_admin(
+                "/admin/psychologists/psychologist/"
+            ),
+        )
+
+    def test_corporate_changelist(self):
+        self.assertQueriesAtEachSize(
+            7, perform=lambda _: self.get_admin("/admin/corporates/corporate/")
+        )
+
+    def test_corporate_usage_changelist(self):
+        self.assertQueriesAtEachSize(
+            9,
+            perform=lambda _: self.get_admin(
+                "/admin/corporates/corporatemonthlyusage/"
+            ),
+        )
+
+    def autocomplete(self, field, term):
+        return self.client.get("/admin/autocomplete/", {
+            "app_label": "bookings",
+            "model_name": "booking",
+            "field_name": field,
+            "term": term,
+        })
+
+    def test_user_autocomplete(self):
+        self.assertQueriesAtEachSize(
+            4, perform=lambda _: self.autocomplete("user", "FILLER1")
+        )
+
+        results = self.autocomplete("user", "filler1").json()["results"]
+        emails = {row["text"] for row in results}
+        self.assertEqual(
+            emails,
+            {f"filler{n}@example.com" for n in range(LARGE_ROWS)
+             if str(n).startswith("1")},
+        )
+
+    def test_autocomplete_matches_prefix_only(self):
+        self.seed_rows(SMALL_ROWS)
+        # "example" is inside every filler email, at the start of none
+        response = self.autocomplete("user", "example")
+        self.assertEqual(response.json()["results"], [])
+
+        response = self.autocomplete("corporate", "test")
+        self.assertEqual(
+            [row["text"] for row in response.json()["results"]], ["Test Corp"]
+        )
+
+    def test_change_form_renders_selected_user_only(self):
+        self.seed_rows(SMALL_ROWS)
+        booking = make_booking(self.new_user(), status="PENDING")
+
+        response = self.get_admin(
+            f"/admin/bookings/booking/{booking.id}/change/"
+        )
+        self.assertContains(response, booking.user.email)
+        self.assertNotContains(response, "filler0@example.com")
+
+
+class BookingBatchStatusTests(BookingTestCase):
+
+    def batch(self, ids):
+        return self.post_json(
+            "/api/bookings/check-status/batch/", {"acknowledgement_ids": ids}
+        )
+
+    def test_matches_single_lookup_with_per_item_errors(self):
+        confirmed = make_booking(
+            self.new_user(), status="CONFIRMED", confirmed_at=timezone.now()
+        )
+        pending = make_booking(self.new_user(), status="PENDING")
+        ids = [
+            pending.acknowledgement_id,
+            "MS-MISSING",
+            confirmed.acknowledgement_id,
+        ]
+
+        # Duplicates are answered once
+        results = self.batch(ids + ids[:1]).json()["results"]
+
+        self.assertEqual([item["acknowledgement_id"] for item in results], ids)
+        self.assertEqual(
+            results[1],
+            {
+                "acknowledgement_id": "MS-MISSING",
+                "found": False,
+                "error": "Booking not found",
+            },
+        )
+        single = self.client.get(
+            "/api/bookings/check-status/",
+            {"acknowledgement_id": confirmed.acknowledgement_id},
+        ).json()
+        self.assertEqual(results[2]["booking"], single)
+        self.assertEqual(single["timeline"], ["DRAFT", "CONFIRMED"])
+
+    def test_drafts_cannot_claim_a_rejection(self):
+        response = self.post_json("/api/bookings/draft/", {
+            "email": "rejected@example.com",
+            "consent_given": True,
+            "full_name": "Rejected",
+            "phone_number": "9999999999",
+            "mode": "ONLINE",
+            "payment_mode": "ONLINE",
+            "rejected_at": timezone.now().isoformat(),
+        })
+        self.assertEqual(response.status_code, 201)
+
+        booking = Booking.objects.get(user__email="rejected@example.com")
+        self.assertIsNone(booking.rejected_at)
+        result = self.batch([booking.acknowledgement_id]).json()["results"][0]
+        self.assertEqual(result["booking"]["timeline"], ["DRAFT"])
+
+    def test_batch_size_is_limited(self):
+        self.assertEqual(self.batch([]).status_code, 400)
+        too_many = [f"MS-{n}" for n in range(MAX_BATCH_STATUS_IDS + 1)]
+        self.assertEqual(self.batch(too_many).status_code, 400)
+
+
+class FastPublicSerializerTests(BookingTestCase):
+
+    def test_matches_drf_serializer(self):
+        for status in ("PENDING", "CONFIRMED", "CANCELLED"):
+            make_booking(
+                self.new_user(),
+                status=status,
+                preferred_time_start=datetime_time(9, 15),
+            )
+        bookings = Booking.objects.order_by("id")
+        renderer = JSONRenderer()
+
+        with timezone.override("Asia/Kolkata"):
+            expected = BookingPublicSerializer(bookings, many=True).data
+            fast = FastBookingPublicSerializer().serialize(
+                bookings.values_list(*FastBookingPublicSerializer.columns)
+            )
+
+        self.assertEqual(renderer.render(fast), renderer.render(expected))
+        self.assertIsNotNone(fast[1]["add_to_calendar_url"])
+
+
+class BookingHistoryTests(BookingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.user = self.new_user()
+        self.token = make_booking_token(
+            make_booking(self.user, status="COMPLETED").id, VERIFY_EMAIL
+        )
+
+    def add_bookings(self, total):
+        existing = Booking.objects.filter(user=self.user).count()
+        for _ in range(total - existing):
+            make_booking(self.user, status="CANCELLED")
+
+    def history(self, **params):
+        return self.client.get(
+            "/api/bookings/history/", {"token": self.token, **params}
+        )
+
+    def walk(self, limit):
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": limit}
+            if cursor:
+                params["cursor"] = cursor
+            data = self.history(**params).json()
+            seen += [row["acknowledgement_id"] for row in data["results"]]
+            cursor = data["next_cursor"]
+            if not cursor:
+                return seen
+
+    def test_deep_pages_cost_the_same_as_the_first(self):
+        for total in (SMALL_ROWS, LARGE_ROWS):
+            self.add_bookings(total)
+            deep = Booking.objects.filter(user=self.user).order_by(
+                "created_at", "id"
+            )[1]
+            for cursor in (None, encode_cursor(deep.created_at, deep.pk)):
+                with self.subTest(rows=total, deep=bool(cursor)):
+                    params = {"limit": 2}
+                    if cursor:
+                        params["cursor"] = cursor
+                    with self.assertNumQueries(2):
+                        response = self.history(**params)
+                    self.assertEqual(response.status_code, 200)
+
+    def test_pages_cover_every_booking_once_newest_first(self):
+        self.add_bookings(7)
+        make_booking(self.user, status="DRAFT")
+        # Same timestamp everywhere: the id tie-break must still hold
+        Booking.objects.filter(user=self.user).update(
+            created_at=timezone.now()
+        )
+
+        expected = list(
+            Booking.objects.filter(user=self.user)
+            .exclude(status="DRAFT")
+            .order_by("-created_at", "-id")
+            .values_list("acknowledgement_id", flat=True)
+        )
+        self.assertEqual(self.walk(limit=3), expected)
+        self.assertEqual(len(expected), 7)
+
+    def test_unverified_token_is_rejected(self):
+        self.token = make_booking_token(
+            make_booking(self.new_user(), status="DRAFT").id, VERIFY_EMAIL
+        )
+        self.assertEqual(self.history().status_code, 400)
+
+    def test_legacy_uuid_tokens_are_not_accepted(self):
+        # They never expire; history needs a signed token
+        self.token = Booking.objects.get(
+            user=self.user
+        ).email_verification_token
+        self.assertEqual(self.history().status_code, 400)
+
+    def test_token_lifetimes(self):
+        booking = Booking.objects.get(user=self.user)
+        issued = timezone.now()
+        with mock.patch("time.time", return_value=issued.timestamp()):
+            verify = make_booking_token(booking.id, VERIFY_EMAIL)
+            history = make_booking_token(booking.id, HISTORY)
+
+        for age, token, status in (
+            (timedelta(days=1), verify, 200),
+            (timedelta(days=3), verify, 400),
+            (timedelta(days=29), history, 200),
+            (timedelta(days=31), history, 400),
+        ):
+            self.token = token
+            with self.subTest(age=age, token=token):
+                later = (issued + age).timestamp()
+                with mock.patch("time.time", return_value=later):
+                    self.assertEqual(self.history().status_code, status)
+
+    def test_verification_hands_out_a_history_token(self):
+        booking = make_booking(self.new_user(), status="DRAFT")
+        response = self.client.get(
+            "/api/bookings/verify-email/",
+            {"token": make_booking_token(booking.id, VERIFY_EMAIL)},
+        )
+
+        self.token = response.json()["history_token"]
+        self.assertEqual(self.history().status_code, 200)
+        self.assertEqual(
+            read_booking_token(self.token, HISTORY), booking.id
+        )
+
+    def test_malformed_cursor_is_rejected(self):
+        for cursor in ("not-a-cursor", encode_cursor(timezone.now(), 1)[:-2]):
+            with self.subTest(cursor=cursor):
+                self.assertEqual(self.history(cursor=cursor).status_code, 400)
+
+
+class SignedTokenTests(BookingTestCase):
+
+    def verify_email(self, token):
+        return self.client.get("/api/bookings/verify-email/", {"token": token})
+
+    def verify_cancellation(self, token):
+        return self.client.get(
+            "/api/bookings/verify-cancellation/", {"token": token}
+        )
+
+    def test_bad_tokens_are_rejected_without_queries(self):
+        booking = make_booking(self.new_user(), status="DRAFT")
+        signed = make_booking_token(booking.id, VERIFY_EMAIL)
+        expired = timezone.now() - TOKEN_MAX_AGE[VERIFY_EMAIL]
+        with mock.patch("time.time", return_value=expired.timestamp()):
+            old = make_booking_token(booking.id, VERIFY_EMAIL)
+
+        forged = signed.replace(f"{booking.id}:", f"{booking.id + 1}:", 1)
+        for token in (
+            forged,
+            old,
+            make_booking_token(booking.id, CANCEL),
+            "not-a-token",
+        ):
+            with self.subTest(token=token):
+                with self.assertNumQueries(0):
+                    response = self.verify_email(token)
+                self.assertEqual(response.status_code, 400)
+
+        booking.refresh_from_db()
+        self.assertEqual(booking.status, "DRAFT")
+
+    def test_cancellation_email_link_cancels(self):
+        booking = make_booking(self.new_user(), status="CONFIRMED")
+        with mock.patch("apps.bookings.email._send_email") as send:
+            self.post_json(
+                "/api/bookings/request-cancellation/",
+                {"acknowledgement_id": booking.acknowledgement_id},
+            )
+        html = send.call_args.args[0].get()["content"][-1]["value"]
+        token = html.split("verify-cancellation?token=", 1)[1].split('"', 1)[0]
+
+        # The verification token of the same booking does not cancel it
+        response = self.verify_cancellation(
+            make_booking_token(booking.id, VERIFY_EMAIL)
+        )
+        self.assertEqual(response.status_code, 400)
+
+        response = self.verify_cancellation(token)
+        self.assertEqual(response.status_code, 200)
+        booking.refresh_from_db()
+        self.assertEqual(booking.status, "CANCELLED")
+
+    def test_cancellation_token_needs_a_request(self):
+        booking = make_booking(self.new_user(), status="CONFIRMED")
+        response = self.verify_cancellation(
+            make_booking_token(booking.id, CANCEL)
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_legacy_uuid_tokens(self):
+        booking = make_booking(self.new_user(), status="DRAFT")
+        token = str(booking.email_verification_token)
+
+        with self.settings(ACCEPT_LEGACY_BOOKING_TOKENS=False):
+            with self.assertNumQueries(0):
+                self.assertEqual(self.verify_email(token).status_code, 400)
+
+        self.assertEqual(self.verify_email(token).status_code, 200)
+        booking.refresh_from_db()
+        self.assertEqual(booking.status, "PENDING")
+
+
+class LookupFilterTests(QueryCountTestCase):
+
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "lookups.bloom")
+
+        overrides = self.settings(
+            BOOKING_LOOKUP_FILTER=True, BOOKING_LOOKUP_FILTER_PATH=self.path
+        )
+        overrides.enable()
+        self.addCleanup(overrides.disable)
+        # Built once by the gunicorn master; not inside a count here
+        rebuild_lookup_filter()
+
+    def test_unknown_ids_are_rejected_without_queries(self):
+        self.seed_rows(SMALL_ROWS)
+        requests = (
+            lambda: self.client.get(
+                "/api/bookings/check-status/",
+                {"acknowledgement_id": "MS-NOPE0000"},
+            ),
+            lambda: self.post_json(
+                "/api/bookings/check-status/batch/",
+                {"acknowledgement_ids": ["MS-NOPE0000", "MS-NOPE0001"]},
+            ),
+            lambda: self.post_json(
+                "/api/bookings/initiate-payment/",
+                {"acknowledgement_id": "MS-NOPE0000"},
+            ),
+            lambda: self.post_json(
+                "/api/bookings/request-cancellation/",
+                {"acknowledgement_id": "MS-NOPE0000"},
+            ),
+            lambda: self.post_json(
+                "/api/bookings/complete-payment/",
+                {"payment_reference": "PAY-NOPE"},
+            ),
+        )
+        for number, request in enumerate(requests):
+            with self.subTest(request=number):
+                with self.assertNumQueries(0):
+                    response = request()
+                self.assertIn(response.status_code, (200, 400))
+
+    def test_new_values_are_found_at_once(self):
+        booking = make_booking(self.new_user(), status="APPROVED")
+        self.assertTrue(
+            might_exist("acknowledgement_id", booking.acknowledgement_id)
+        )
+
+        response = self.post_json(
+            "/api/bookings/initiate-payment/",
+            {"acknowledgement_id": booking.acknowledgement_id},
+        )
+        reference = response.json()["payment_reference"]
+        self.assertTrue(might_exist("payment_reference", reference))
+
+    def test_shared_file_is_seen_by_other_processes(self):
+        booking = make_booking(self.new_user(), status="PENDING")
+        rebuild_lookup_filter()
+        # What another worker's mapping of the file sees
+        with open(self.path, "r+b") as handle:
+            other = BloomFilter(mmap.mmap(handle.fileno(), 0))
+
+        for ack_id in (
+            booking.acknowledgement_id,
+            make_booking(self.new_user()).acknowledgement_id,
+        ):
+            self.assertIn(f"acknowledgement_id:{ack_id}", other)
+
+        # A rebuild elsewhere replaces the file; lookups follow it
+        with open(f"{self.path}.new", "wb") as handle:
+            handle.write(BloomFilter.create(100).buffer)
+        os.replace(f"{self.path}.new", self.path)
+        self.assertFalse(
+            might_exist("acknowledgement_id", booking.acknowledgement_id)
+        )
+
+    def test_misses_go_to_the_database_without_a_shared_file(self):
+        booking = make_booking(self.new_user(), status="PENDING")
+        for overrides in (
+            {"BOOKING_LOOKUP_FILTER_PATH": ""},
+            {"BOOKING_LOOKUP_FILTER": False},
+        ):
+            with self.subTest(**overrides), self.settings(**overrides):
+                # A booking this process never saw must still be found
+                self.assertTrue(might_exist("acknowledgement_id", "MS-NOPE"))
+                self.assertEqual(rebuild_lookup_filter(), 0)
+                with self.assertNumQueries(1):
+                    response = self.client.get(
+                        "/api/bookings/check-status/",
+                        {"acknowledgement_id": booking.acknowledgement_id},
+                    )
+                self.assertEqual(response.status_code, 200)
+
+
+class IdempotencyKeyTests(BookingTestCase):
+
+    def draft(self, key, **data):
+        return self.post_json(
+            "/api/bookings/draft/",
+            {
+                "email": "retry@example.com",
+                "consent_given": True,
+                "full_name": "Retry",
+                "phone_number": "9999999999",
+                "city": "Surat",
+                "mode": "ONLINE",
+                "payment_mode": "ONLINE",
+                "preferred_period": "MORNING",
+                **data,
+            },
+            HTTP_IDEMPOTENCY_KEY=key,
+        )
+
+    def test_retry_replays_without_running_the_view(self):
+        first = self.draft("key-1")
+        self.assertEqual(first.status_code, 201)
+
+        with mock.patch("apps.bookings.email._send_email") as send:
+            # Failed claim in a savepoint, then one read of the stored reply
+            with self.assertNumQueries(5):
+                retry = self.draft("key-1")
+
+        send.assert_not_called()
+        self.assertEqual(retry.status_code, 201)
+        self.assertEqual(retry.content, first.content)
+        self.assertEqual(retry["Idempotent-Replayed"], "true")
+        self.assertEqual(
+            Booking.objects.filter(user__email="retry@example.com").count(), 1
+        )
+
+    def test_error_responses_are_replayed_too(self):
+        for _ in range(2):
+            response = self.post_json(
+                "/api/bookings/complete-payment/",
+                {"payment_reference": "PAY-UNKNOWN"},
+                HTTP_IDEMPOTENCY_KEY="key-2",
+            )
+            self.assertEqual(response.status_code, 400)
+        self.assertEqual(response["Idempotent-Replayed"], "true")
+
+    def test_key_reused_for_another_request(self):
+        self.draft("key-3")
+        response = self.draft("key-3", city="Pune")
+        self.assertEqual(response.status_code, 422)
+
+    def test_duplicate_of_an_in_flight_request(self):
+        IdempotencyRecord.objects.create(
+            scope="POST /api/bookings/draft/",
+            key="key-4",
+            fingerprint="",
+            created_at=timezone.now(),
+        )
+        with mock.patch(
+            "apps.core.idempotency._fingerprint", return_value=""
+        ), mock.patch("apps.core.idempotency.IN_FLIGHT_WAIT_SECONDS", 0):
+            response = self.draft("key-4")
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response["Retry-After"], "1")
+        self.assertFalse(Booking.objects.filter(full_name="Retry").exists())
+
+    def test_abandoned_and_expired_keys_run_again(self):
+        for key, age in (
+            ("key-5", IN_FLIGHT_TIMEOUT),
+            ("key-6", IDEMPOTENCY_KEY_TTL),
+        ):
+            with self.subTest(key=key):
+                IdempotencyRecord.objects.create(
+                    scope="POST /api/bookings/request-cancellation/",
+                    key=key,
+                    fingerprint="stale",
+                    created_at=timezone.now() - age - timedelta(seconds=1),
+                    completed_at=None if key == "key-5" else timezone.now(),
+                    status_code=200,
+                )
+                booking = make_booking(self.new_user(), status="APPROVED")
+                response = self.post_json(
+                    "/api/bookings/request-cancellation/",
+                    {"acknowledgement_id": booking.acknowledgement_id},
+                    HTTP_IDEMPOTENCY_KEY=key,
+                )
+                self.assertNotIn("Idempotent-Replayed", response)
+                booking.refresh_from_db()
+                self.assertEqual(booking.status, "CANCELLED")
+
+    def test_requests_without_a_key_are_untouched(self):
+        self.draft("")
+        self.assertFalse(IdempotencyRecord.objects.exists())
+
+
+class BloomFilterTests(TestCase):
+
+    def test_no_false_negatives_and_bounded_false_positives(self):
+        bloom = BloomFilter.create(capacity=2000, error_rate=0.01)
+        for n in range(2000):
+            bloom.add(f"MS-{n}")
+
+        self.assertTrue(all(f"MS-{n}" in bloom for n in range(2000)))
+        false_positives = sum(f"PAY-{n}" in bloom for n in range(10_000))
+        self.assertLess(false_positives, 200)
+        self.assertFalse(bloom.is_full)
+
+        count = bloom.count
+        bloom.add("MS-0")
+        self.assertEqual(bloom.count, count)
+
+
+class EstimatedCountPaginatorTests(QueryCountTestCase):
+
+    def test_falls_back_to_exact_count_without_estimate(self):
+        self.seed_rows(SMALL_ROWS)
+        paginator = EstimatedCountPaginator(
+            Booking.objects.all(), 10, estimate=lambda: None
+        )
+        self.assertEqual(paginator.count, SMALL_ROWS)
+
+    def test_admin_count_comes_from_status_counters(self):
+        self.seed_rows(SMALL_ROWS)
+        make_booking(self.new_user(), status="DRAFT")
+        visible = Booking.objects.exclude(status="DRAFT")
+        expected = visible.count()
+        model_admin = admin.site._registry[Booking]
+
+        paginator = model_admin.get_paginator(
+            RequestFactory().get("/"), visible, 10
+        )
+        paginator.threshold = 0
+        with self.assertNumQueries(1):
+            self.assertEqual(paginator.count, expected)
+        self.assertEqual(visible_booking_count(), expected)
+        self.assertEqual(visible_booking_count(get_facet_counts()), expected)
+
+        filtered = model_admin.get_paginator(
+            RequestFactory().get("/", {"city__exact": "Pune"}), visible, 10
+        )
+        self.assertIsNone(filtered.estimate)
+
+
+class BookingSearchTests(QueryCountTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.booking = make_booking(
+            AppUser.objects.create(email="Riya.Shah@Example.com"),
+            full_name="Riya  Shah",
+            city="Ahmedabad",
+        )
+        self.seed_rows(SMALL_ROWS)
+
+    def search(self, term):
+        return list(search_bookings(Booking.objects.all(), term))
+
+    def test_search_text_is_normalised(self):
+        self.assertIn("riya shah", self.booking.search_text)
+        self.assertIn("riya.shah@example.com", self.booking.search_text)
+
+    def test_substring_match(self):
+        self.assertEqual(self.search("hmedab"), [self.booking])
+        self.assertEqual(self.search(self.booking.acknowledgement_id),
+                         [self.booking])
+
+    def test_every_word_must_match(self):
+        self.assertEqual(self.search("RIYA ahmedabad"), [self.booking])
+        self.assertEqual(self.search("riya surat"), [])
+
+    def test_short_terms_fall_back_to_like(self):
+        self.assertEqual(self.search("riya sh"), [self.booking])
+
+    def test_search_text_follows_updates(self):
+        self.booking.city = "Vadodara"
+        self.booking.save(update_fields=["city"])
+        self.assertEqual(self.search("vadodara"), [self.booking])
+        self.assertEqual(self.search("ahmedabad"), [])
+
+    def test_search_text_follows_user_email(self):
+        user = self.booking.user
+        other = make_booking(user, city="Surat")
+
+        user.email = "riya@newmail.example"
+        user.save(update_fields=["email"])
+
+        self.assertCountEqual(
+            self.search("newmail"), [self.booking, other]
+        )
+        self.assertEqual(self.search("riya.shah@example"), [])
+
+    def test_user_save_without_email_skips_bookings(self):
+        user = self.booking.user
+        user.is_verified = True
+        with self.assertNumQueries(1):
+            user.save(update_fields=["is_verified"])
+
+
+class BookingFacetCountTests(QueryCountTestCase):
+
+    def counts(self):
+        return get_facet_counts()
+
+    def test_create_counts_visible_bookings_only(self):
+        make_booking(self.new_user(), status="DRAFT", city="Pune")
+        self.assertNotIn("Pune", self.counts()["city"])
+
+        make_booking(self.new_user(), status="PENDING", city="Pune")
+        counts = self.counts()
+        self.assertEqual(counts["city"]["Pune"], 1)
+        self.assertEqual(counts["status"]["PENDING"], 1)
+
+    def test_status_change_moves_count(self):
+        booking = make_booking(self.new_user(), status="PENDING")
+        booking.status = "REJECTED"
+        booking.save(update_fields=["status"])
+
+        counts = self.counts()
+        self.assertNotIn("PENDING", counts["status"])
+        self.assertEqual(counts["status"]["REJECTED"], 1)
+
+    def test_save_of_deferred_instance(self):
+        booking = make_booking(self.new_user(), status="PENDING")
+        deferred = Booking.objects.only("id").get(pk=booking.pk)
+        deferred.status = "REJECTED"
+        deferred.save(update_fields=["status"])
+
+        self.assertEqual(self.counts()["status"], {"REJECTED": 1})
+
+    def test_delete_releases_count(self):
+        booking = make_booking(self.new_user(), status="PENDING")
+        booking.user.delete()
+        self.assertEqual(self.counts()["status"], {})
+
+    def test_stale_copies_count_the_stored_row(self):
+        booking = make_booking(self.new_user(), status="PENDING")
+        first = Booking.objects.get(pk=booking.pk)
+        second = Booking.objects.get(pk=booking.pk)
+
+        for copy in (first, second):
+            copy.status = "APPROVED"
+            copy.save(update_fields=["status"])
+
+        self.assertEqual(self.counts()["status"], {"APPROVED": 1})
+
+    def test_save_after_rolled_back_save(self):
+        booking = make_booking(self.new_user(), status="PENDING")
+        booking.status = "APPROVED"
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            booking.save(update_fields=["status"])
+            raise RuntimeError
+
+        booking.status = "REJECTED"
+        booking.save(update_fields=["status"])
+        self.assertEqual(self.counts()["status"], {"REJECTED": 1})
+
+    def test_rebuild_matches_incremental_counts(self):
+        self.seed_rows(SMALL_ROWS)
+        make_booking(self.new_user(), status="DRAFT")
+        incremental = self.counts()
+
+        rebuild_facet_counts()
+        self.assertEqual(self.counts(), incremental)
+
+    def test_changelist_filter_shows_counts(self):
+        self.seed_rows(SMALL_ROWS)
+        admin_user = get_user_model().objects.create_superuser(
+            username="admin", password="admin-password"
+        )
+        self.client.force_login(admin_user)
+
+        response = self.client.get("/admin/bookings/booking/")
+        self.assertContains(response, "Pending (1)")
+        self.assertContains(response, "Surat (3)")
+
+
+class BookingRollupTests(QueryCountTestCase):
+
+    def today(self):
+        return BookingDailyRollup.objects.get(date=timezone.localdate())
+
+    def test_transitions_are_counted_on_the_day(self):
+        booking = make_booking(self.new_user(), status="DRAFT")
+        booking.status = "PENDING"
+        booking.save(update_fields=["status"])
+
+        rollup = self.today()
+        self.assertEqual((rollup.created, rollup.submitted), (1, 1))
+
+    def test_confirmation_adds_revenue_and_load(self):
+        booking = make_booking(
+            self.new_user(),
+            status="PAYMENT_PENDING",
+            psychologist=self.psychologist,
+        )
+        booking.status = "CONFIRMED"
+        booking.save(update_fields=["status"])
+
+        self.assertEqual(self.today().revenue, Decimal("1500.00"))
+        load = PsychologistDailyLoad.objects.get(psychologist=self.psychologist)
+        self.assertEqual((load.sessions, load.minutes), (1, 60))
+
+        booking.status = "CANCELLED"
+        booking.save(update_fields=["status"])
+
+        self.assertEqual(self.today().refunded, Decimal("1500.00"))
+        load.refresh_from_db()
+        self.assertEqual((load.sessions, load.minutes), (0, 0))
+
+    def test_reschedule_moves_load(self):
+        booking = make_booking(
+            self.new_user(), status="CONFIRMED", psychologist=self.psychologist
+        )
+        first_day = timezone.localdate(booking.approved_slot_start)
+
+        booking.approved_slot_start += timedelta(days=1)
+        booking.approved_slot_end += timedelta(days=1, minutes=30)
+        booking.save(
+            update_fields=["approved_slot_start", "approved_slot_end"]
+        )
+
+        loads = dict(
+            PsychologistDailyLoad.objects.values_list("date", "minutes")
+        )
+        self.assertEqual(loads, {
+            first_day: 0,
+            first_day + timedelta(days=1): 90,
+        })
+
+    def test_backfill_matches_incremental_counts(self):
+        now = timezone.now()
+        slot_start = now + timedelta(days=2)
+        booking = make_booking(
+            self.new_user(),
+            status="DRAFT",
+            psychologist=self.psychologist,
+            approved_slot_start=slot_start,
+            approved_slot_end=slot_start + timedelta(minutes=50),
+            amount=Decimal("1200.00"),
+        )
+        for status, stamp in (
+            ("PENDING", "submitted_at"),
+            ("APPROVED", "approved_at"),
+            ("PAYMENT_PENDING", "payment_requested_at"),
+            ("CONFIRMED", "confirmed_at"),
+        ):
+            booking.status = status
+            setattr(booking, stamp, now)
+            booking.save()
+
+        load_fields = ("psychologist", "date", "sessions", "minutes")
+        incremental = list(BookingDailyRollup.objects.values())
+        incremental_load = list(
+            PsychologistDailyLoad.objects.values(*load_fields)
+        )
+        self.assertEqual(incremental_load[0]["minutes"], 50)
+
+        rebuild_rollups()
+
+        self.assertEqual(
+            [
+                {**row, "id": None}
+                for row in BookingDailyRollup.objects.values()
+            ],
+            [{**row, "id": None} for row in incremental],
+        )
+        self.assertEqual(
+            list(PsychologistDailyLoad.objects.values(*load_fields)),
+            incremental_load,
+        )
+
+    def test_dashboard_summary(self):
+        make_booking(self.new_user(), status="DRAFT")
+        make_booking(
+            self.new_user(), status="PENDING", submitted_at=timezone.now()
+        )
+
+        dashboard = build_dashboard(days=7)
+
+        self.assertEqual(dashboard["pending"]["count"], 1)
+        self.assertEqual(dashboard["pending"]["under_24h"], 1)
+        self.assertEqual(len(dashboard["intake"]), 7)
+        self.assertEqual(dashboard["funnel"][0]["count"], 2)
+        self.assertEqual(dashboard["funnel"][1]["rate"], 50)
@@ -0,0 +1,202 @@
+import base64
+from datetime import timedelta, timezone as dt_timezone
+from unittest import mock
+
+from django.core.cache import cache
+
+from apps.bookings.models import Booking
+from apps.bookings.services.payments import complete_payment
+from apps.bookings.tests.base import BookingTestCase, make_booking
+from apps.bookings.utils.calendar import booking_ics
+from apps.bookings.utils.tokens import make_feed_token
+from apps.psychologists.models import Psychologist
+
+
+class CalendarFeedTests(BookingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.psychologist = Psychologist.objects.create(
+            full_name="Dr. Test",
+            email="psy@example.com",
+            specialization="GENERAL",
+            experience_years=5,
+        )
+        self.other = Psychologist.objects.create(
+            full_name="Dr. Other",
+            email="other@example.com",
+            specialization="GENERAL",
+            experience_years=3,
+        )
+
+    def session(self, psychologist=None, status="CONFIRMED", **extra):
+        return make_booking(
+            self.new_user(),
+            status=status,
+            psychologist=psychologist or self.psychologist,
+            **extra,
+        )
+
+    def feed(self, psychologist=None, token=None, **headers):
+        psychologist_id = (psychologist or self.psychologist).pk
+        return self.client.get(
+            f"/api/psychologists/{psychologist_id}/calendar.ics",
+            {"token": token or make_feed_token(psychologist_id)},
+            **headers,
+        )
+
+    def test_booking_ics(self):
+        booking = self.session(city="Surat")
+        ics = booking_ics(booking)
+
+        self.assertTrue(ics.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertIn(f"UID:{booking.acknowledgement_id}@mindsettler", ics)
+        self.assertIn(
+            "DTSTART:" + booking.approved_slot_start.astimezone(
+                dt_timezone.utc
+            ).strftime("%Y%m%dT%H%M%SZ"),
+            ics,
+        )
+        self.assertIn("\\nMode: ONLINE", ics)
+        for line in ics.split("\r\n"):
+            self.assertLessEqual(len(line.encode()), 75)
+        self.assertIn("SEQUENCE:0\r\n", ics)
+        self.assertIn("LAST-MODIFIED:" + booking.updated_at.astimezone(
+            dt_timezone.utc
+        ).strftime("%Y%m%dT%H%M%SZ"), ics)
+
+    def test_confirmation_email_carries_the_ics(self):
+        booking = self.session(status="PAYMENT_PENDING")
+        with mock.patch("apps.bookings.email._send_email") as send, \
+                self.captureOnCommitCallbacks(execute=True):
+            complete_payment(booking)
+
+        attachment = send.call_args.args[0].get()["attachments"][0]
+        self.assertEqual(
+            attachment["filename"], f"{booking.acknowledgement_id}.ics"
+        )
+        self.assertIn(
+            booking.acknowledgement_id,
+            base64.b64decode(attachment["content"]).decode(),
+        )
+
+    def test_attachment_matches_the_feed(self):
+        booking = self.session(status="PAYMENT_PENDING")
+        with mock.patch("apps.bookings.email._send_email") as send, \
+                self.captureOnCommitCallbacks(execute=True):
+            complete_payment(booking)
+
+        attachment = base64.b64decode(
+            send.call_args.args[0].get()["attachments"][0]["content"]
+        ).decode()
+        event = attachment[
+            attachment.index("BEGIN:VEVENT"):
+            attachment.index("END:VEVENT\r\n") + len("END:VEVENT\r\n")
+        ]
+        self.assertIn(event, self.feed().content.decode())
+
+    def test_moved_sessions_get_a_higher_sequence(self):
+        booking = self.session()
+        self.assertIn("SEQUENCE:0\r\n", self.feed().content.decode())
+
+        booking.approved_slot_start += timedelta(hours=1)
+        booking.approved_slot_end += timedelta(hours=1)
+        booking.save(
+            update_fields=["approved_slot_start", "approved_slot_end"]
+        )
+
+        self.assertEqual(booking.ics_sequence, 1)
+        stored = Booking.objects.get(pk=booking.pk)
+        self.assertEqual(stored.ics_sequence, 1)
+        self.assertEqual(stored.updated_at, booking.updated_at)
+        body = self.feed().content.decode()
+        self.assertIn("SEQUENCE:1\r\n", body)
+        self.assertIn("LAST-MODIFIED:" + booking.updated_at.astimezone(
+            dt_timezone.utc
+        ).strftime("%Y%m%dT%H%M%SZ"), body)
+
+        # Saves that leave the event alone keep its sequence
+        booking.full_name = "Renamed"
+        booking.save(update_fields=["full_name"])
+        self.assertEqual(
+            Booking.objects.get(pk=booking.pk).ics_sequence, 1
+        )
+
+    def test_changes_reach_workers_with_their_own_cache(self):
+        booking = self.session()
+        first = self.feed()
+        version = Psychologist.objects.get(pk=self.psychologist.pk).feed_version
+
+        # Another worker's cache is never told about the change; the
+        # version it reads from the database moves on instead
+        with mock.patch("django.core.cache.cache.delete_many") as delete, \
+                mock.patch("django.core.cache.cache.delete") as delete_one:
+            booking.approved_slot_start += timedelta(hours=1)
+            booking.approved_slot_end += timedelta(hours=1)
+            booking.save(
+                update_fields=["approved_slot_start", "approved_slot_end"]
+            )
+        delete.assert_not_called()
+        delete_one.assert_not_called()
+
+        self.psychologist.refresh_from_db()
+        self.assertEqual(self.psychologist.feed_version, version + 1)
+        self.assertNotEqual(self.feed()["ETag"], first["ETag"])
+
+    def test_feed_lists_the_psychologists_sessions(self):
+        mine = self.session()
+        pending = self.session(status="PAYMENT_PENDING")
+        theirs = self.session(psychologist=self.other)
+
+        response = self.feed()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response["Content-Type"], "text/calendar; charset=utf-8"
+        )
+        body = response.content.decode()
+        self.assertIn(mine.acknowledgement_id, body)
+        self.assertNotIn(pending.acknowledgement_id, body)
+        self.assertNotIn(theirs.acknowledgement_id, body)
+
+    def test_polling_is_served_from_the_cache(self):
+        for _ in range(3):
+            self.session()
+        first = self.feed()
+
+        # One feed version lookup per request
+        with self.assertNumQueries(2):
+            again = self.feed()
+            unchanged = self.feed(HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(again.content, first.content)
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(unchanged["ETag"], first["ETag"])
+
+    def test_changes_invalidate_only_that_feed(self):
+        booking = self.session()
+        mine = self.feed()
+        theirs = self.feed(self.other)
+
+        booking.psychologist = self.other
+        booking.save(update_fields=["psychologist"])
+
+        self.assertNotEqual(self.feed()["ETag"], mine["ETag"])
+        self.assertIn(
+            booking.acknowledgement_id, self.feed(self.other).content.decode()
+        )
+
+        # Saves that do not touch what a feed shows keep it cached
+        cached = self.feed(self.other)
+        booking.full_name = "Renamed"
+        booking.save(update_fields=["full_name"])
+        with self.assertNumQueries(1):
+            self.assertEqual(self.feed(self.other)["ETag"], cached["ETag"])
+        self.assertNotEqual(cached["ETag"], theirs["ETag"])
+
+    def test_feed_needs_its_own_token(self):
+        other_token = make_feed_token(self.other.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.feed(token=other_token).status_code, 404)
+            self.assertEqual(self.feed(token="forged").status_code, 404)
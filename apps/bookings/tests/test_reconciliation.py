@@ -0,0 +1,179 @@
+import io
+import uuid
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.bookings.models import Booking, BookingDailyRollup
+from apps.bookings.services.facets import get_facet_counts, rebuild_facet_counts
+from apps.bookings.services.payments import complete_payment
+from apps.bookings.services.reconciliation import (
+    RECONCILE_GRACE,
+    reconcile_payments,
+)
+from apps.bookings.services.webhooks import (
+    EXPIRED,
+    OPEN,
+    PAYMENT_PROVIDERS,
+    SETTLED,
+)
+from apps.bookings.tests.base import (
+    LARGE_ROWS,
+    SMALL_ROWS,
+    BookingTestCase,
+    make_booking,
+)
+
+
+class PaymentReconciliationTests(BookingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.provider = PAYMENT_PROVIDERS["mock"]
+        self.addCleanup(self.provider.payments.clear)
+
+    def pending_payment(self, status=None, age=RECONCILE_GRACE * 2):
+        reference = f"PAY-{uuid.uuid4().hex[:12].upper()}"
+        booking = make_booking(
+            self.new_user(),
+            status="PAYMENT_PENDING",
+            payment_reference=reference,
+            payment_requested_at=timezone.now() - age,
+        )
+        if status:
+            self.provider.set_payment_status(reference, status)
+        return booking
+
+    def statuses(self, *bookings):
+        return [
+            Booking.objects.get(pk=booking.pk).status for booking in bookings
+        ]
+
+    def test_settled_and_expired_payments_are_applied(self):
+        settled = self.pending_payment(SETTLED)
+        expired = self.pending_payment(EXPIRED)
+        still_open = self.pending_payment(OPEN)
+        unknown = self.pending_payment()
+        recent = self.pending_payment(EXPIRED, age=timedelta(minutes=1))
+
+        with mock.patch("apps.bookings.email._send_email") as send, \
+                self.captureOnCommitCallbacks(execute=True):
+            report = reconcile_payments(self.provider)
+
+        self.assertEqual(send.call_count, 1)
+        self.assertEqual(
+            self.statuses(settled, expired, still_open, unknown, recent),
+            ["CONFIRMED", "PAYMENT_FAILED", "PAYMENT_PENDING",
+             "PAYMENT_PENDING", "PAYMENT_PENDING"],
+        )
+        self.assertEqual(
+            {key: report[key] for key in (
+                "checked", "confirmed", "failed", "open", "unknown", "errors",
+            )},
+            {"checked": 4, "confirmed": 1, "failed": 1, "open": 1,
+             "unknown": 1, "errors": 0},
+        )
+        self.assertTrue(report["complete"])
+
+    def test_bookings_confirmed_meanwhile_are_not_announced_again(self):
+        first = self.pending_payment(SETTLED)
+        second = self.pending_payment(SETTLED)
+        handled = []
+
+        def webhook_confirms_the_other(booking):
+            # A webhook worker confirms the other booking while the
+            # first one reconciliation reaches is being handled
+            if not handled:
+                other = second if booking.pk == first.pk else first
+                complete_payment(Booking.objects.get(pk=other.pk))
+            handled.append(booking.pk)
+            return complete_payment(booking)
+
+        with mock.patch("apps.bookings.email._send_email") as send, \
+                mock.patch(
+                    "apps.bookings.services.reconciliation.complete_payment",
+                    side_effect=webhook_confirms_the_other,
+                ), \
+                self.captureOnCommitCallbacks(execute=True):
+            report = reconcile_payments(self.provider)
+
+        print("SENDS", [c.args[0].get()["personalizations"] if hasattr(c.args[0],"get") else c for c in send.call_args_list])
+        self.assertEqual(send.call_count, 2)
+        self.assertEqual((report["confirmed"], report["errors"]), (1, 0))
+        self.assertEqual(self.statuses(first, second), ["CONFIRMED"] * 2)
+
+    def test_bulk_failures_keep_counters_in_step(self):
+        make_booking(self.new_user(), status="CONFIRMED")
+        for _ in range(3):
+            self.pending_payment(EXPIRED)
+
+        reconcile_payments(self.provider)
+
+        incremental = get_facet_counts()
+        rebuild_facet_counts()
+        self.assertEqual(incremental, get_facet_counts())
+        self.assertEqual(
+            BookingDailyRollup.objects.get(
+                date=timezone.localdate()
+            ).payment_failed,
+            3,
+        )
+
+    def test_queries_per_chunk_do_not_grow_with_failures(self):
+        # The first failure of the day creates its counter rows
+        self.pending_payment(EXPIRED)
+        reconcile_payments(self.provider)
+
+        counts = []
+        for rows in (SMALL_ROWS, LARGE_ROWS):
+            bookings = [self.pending_payment(EXPIRED) for _ in range(rows)]
+            with CaptureQueriesContext(connection) as queries:
+                report = reconcile_payments(self.provider, chunk_size=100)
+            self.assertEqual(report["failed"], rows)
+            counts.append(len(queries))
+            Booking.objects.filter(pk__in=[b.pk for b in bookings]).delete()
+        self.assertEqual(counts[0], counts[1])
+
+    def test_provider_is_asked_in_batches(self):
+        for _ in range(5):
+            self.pending_payment(OPEN)
+
+        with mock.patch.object(self.provider, "status_batch_size", 2), \
+                mock.patch.object(
+                    self.provider,
+                    "payment_statuses",
+                    wraps=self.provider.payment_statuses,
+                ) as ask:
+            reconcile_payments(self.provider, chunk_size=4)
+
+        self.assertEqual(
+            [len(call.args[0]) for call in ask.call_args_list], [2, 2, 1]
+        )
+
+    def test_runs_are_bounded(self):
+        bookings = [self.pending_payment(EXPIRED) for _ in range(3)]
+
+        report = reconcile_payments(self.provider, max_seconds=0)
+        self.assertEqual(report["checked"], 0)
+        self.assertFalse(report["complete"])
+
+        report = reconcile_payments(self.provider, chunk_size=1, limit=2)
+        self.assertEqual(report["checked"], 2)
+        self.assertFalse(report["complete"])
+        self.assertEqual(
+            self.statuses(*bookings),
+            ["PAYMENT_FAILED", "PAYMENT_FAILED", "PAYMENT_PENDING"],
+        )
+
+    def test_command_reports_a_summary(self):
+        self.pending_payment(SETTLED)
+
+        out = io.StringIO()
+        call_command("reconcile_payments", provider="mock", stdout=out)
+
+        self.assertIn("confirmed  1", out.getvalue())
+        self.assertIn("Reconciled 1 pending payments", out.getvalue())
@@ -0,0 +1,130 @@
+import io
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+from apps.bookings.models import Booking
+from apps.bookings.services.reminders import _claim, send_due_reminders
+from apps.bookings.tests.base import BookingTestCase, make_booking
+
+
+@override_settings(
+    SESSION_REMINDER_OFFSETS=[timedelta(hours=1), timedelta(hours=24)]
+)
+class SessionReminderTests(BookingTestCase):
+
+    def confirmed(self, starts_in, **extra):
+        booking = make_booking(self.new_user(), status="CONFIRMED", **extra)
+        booking.approved_slot_start = timezone.now() + starts_in
+        booking.approved_slot_end = booking.approved_slot_start + timedelta(hours=1)
+        booking.save()
+        return booking
+
+    def run_reminders(self, now=None, **kwargs):
+        with mock.patch(
+            "apps.bookings.email._send_email", return_value=True
+        ) as send:
+            report = send_due_reminders(now=now, **kwargs)
+        return report, send.call_count
+
+    def stage(self, booking):
+        booking.refresh_from_db(fields=["reminder_stage"])
+        return booking.reminder_stage
+
+    def test_each_reminder_is_sent_once(self):
+        booking = self.confirmed(timedelta(hours=23))
+
+        report, sent = self.run_reminders()
+        self.assertEqual((report["sent"], sent), (1, 1))
+        self.assertEqual(self.stage(booking), 1)
+        self.assertEqual(self.run_reminders()[1], 0)
+
+        an_hour_before = booking.approved_slot_start - timedelta(minutes=59)
+        self.assertEqual(self.run_reminders(now=an_hour_before)[1], 1)
+        self.assertEqual(self.stage(booking), 2)
+        self.assertEqual(self.run_reminders(now=an_hour_before)[1], 0)
+
+    def test_late_confirmation_gets_only_the_last_reminder(self):
+        booking = self.confirmed(timedelta(minutes=30))
+
+        self.assertEqual(self.run_reminders()[1], 1)
+        self.assertEqual(self.stage(booking), 2)
+
+    def test_sessions_not_due_are_left_alone(self):
+        self.confirmed(timedelta(days=3))
+        self.confirmed(-timedelta(hours=1))
+        make_booking(self.new_user(), status="APPROVED")
+
+        self.assertEqual(self.run_reminders()[1], 0)
+
+    def test_claims_are_exclusive(self):
+        booking = self.confirmed(timedelta(hours=2))
+        stale = Booking.objects.get(pk=booking.pk)
+
+        self.assertTrue(_claim(booking, 1))
+        self.assertFalse(_claim(stale, 1))
+
+        other = self.confirmed(timedelta(hours=2))
+
+        def competing_claim(booking, stage):
+            Booking.objects.filter(pk=booking.pk).update(reminder_stage=stage)
+            return _claim(booking, stage)
+
+        with mock.patch(
+            "apps.bookings.services.reminders._claim",
+            side_effect=competing_claim,
+        ):
+            report, sent = self.run_reminders()
+
+        self.assertEqual((report["skipped"], sent), (1, 0))
+        self.assertEqual(self.stage(other), 1)
+
+    def test_undelivered_reminders_are_released(self):
+        booking = self.confirmed(timedelta(hours=2))
+
+        with mock.patch(
+            "apps.bookings.email._send_email", return_value=False
+        ):
+            report = send_due_reminders()
+
+        self.assertEqual(report["failed"], 1)
+        self.assertEqual(self.stage(booking), 0)
+        self.assertEqual(self.run_reminders()[1], 1)
+
+    def test_moving_the_session_resets_reminders(self):
+        booking = self.confirmed(timedelta(hours=2))
+        self.run_reminders()
+
+        booking = Booking.objects.get(pk=booking.pk)
+        booking.approved_slot_start += timedelta(days=2)
+        booking.approved_slot_end += timedelta(days=2)
+        booking.save(update_fields=["approved_slot_start", "approved_slot_end"])
+
+        self.assertEqual(self.stage(booking), 0)
+
+    def test_clients_cannot_set_the_reminder_stage(self):
+        response = self.post_json("/api/bookings/draft/", {
+            "email": "stage@example.com",
+            "consent_given": True,
+            "full_name": "Stage",
+            "phone_number": "9999999999",
+            "mode": "ONLINE",
+            "payment_mode": "ONLINE",
+            "reminder_stage": 2,
+        })
+
+        self.assertEqual(response.status_code, 201)
+        booking = Booking.objects.get(user__email="stage@example.com")
+        self.assertEqual(booking.reminder_stage, 0)
+
+    def test_command_reports_what_it_sent(self):
+        self.confirmed(timedelta(hours=2))
+        self.confirmed(timedelta(hours=3))
+
+        out = io.StringIO()
+        call_command("send_session_reminders", limit=1, stdout=out)
+
+        self.assertIn("Sent 1 session reminders", out.getvalue())
@@ -0,0 +1,201 @@
+import io
+import json
+import uuid
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.utils import timezone
+
+from apps.bookings.models import PaymentEvent
+from apps.bookings.services.webhooks import (
+    EVENT_RETRY_BACKOFF,
+    MAX_EVENT_ATTEMPTS,
+    PAYMENT_PROVIDERS,
+    PaymentProvider,
+    process_payment_events,
+)
+from apps.bookings.tests.base import BookingTestCase, make_booking
+
+
+@override_settings(PAYMENT_WEBHOOK_SECRETS={"mock": "test-secret"})
+class PaymentWebhookTests(BookingTestCase):
+
+    def deliver(self, events, signature=None):
+        body = json.dumps(events).encode()
+        provider = PAYMENT_PROVIDERS["mock"]
+        return self.client.post(
+            "/api/bookings/webhooks/mock/",
+            body,
+            content_type="application/json",
+            HTTP_X_MOCK_SIGNATURE=signature or provider.sign(body),
+        )
+
+    def succeeded(self, event_id, booking):
+        return {
+            "id": event_id,
+            "type": "payment.succeeded",
+            "data": {"payment_reference": booking.payment_reference},
+        }
+
+    def pending_payment(self):
+        return make_booking(
+            self.new_user(),
+            status="PAYMENT_PENDING",
+            payment_reference=f"PAY-{uuid.uuid4().hex[:12].upper()}",
+        )
+
+    def test_webhook_only_stores_the_event(self):
+        booking = self.pending_payment()
+        with self.assertNumQueries(1):
+            response = self.deliver(self.succeeded("evt-1", booking))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(PaymentEvent.objects.count(), 1)
+        booking.refresh_from_db()
+        self.assertEqual(booking.status, "PAYMENT_PENDING")
+
+    def test_unverified_webhooks_are_refused(self):
+        booking = self.pending_payment()
+        event = self.succeeded("evt-1", booking)
+        body = json.dumps(event).encode()
+        stale = PAYMENT_PROVIDERS["mock"].sign(body, timestamp=1)
+
+        self.assertEqual(self.deliver(event, signature="t=1,v1=0").status_code, 403)
+        self.assertEqual(self.deliver(event, signature=stale).status_code, 403)
+        with override_settings(PAYMENT_WEBHOOK_SECRETS={"mock": ""}):
+            self.assertEqual(self.deliver(event).status_code, 403)
+        self.assertEqual(
+            self.client.post("/api/bookings/webhooks/acme/", {}).status_code,
+            404,
+        )
+        self.assertFalse(PaymentEvent.objects.exists())
+
+    def test_redelivered_events_are_stored_once(self):
+        booking = self.pending_payment()
+        for _ in range(2):
+            self.assertEqual(
+                self.deliver(self.succeeded("evt-1", booking)).status_code, 200
+            )
+        self.assertEqual(PaymentEvent.objects.count(), 1)
+
+    def test_worker_applies_a_batch(self):
+        paid = self.pending_payment()
+        cancelled = self.pending_payment()
+        cancelled.status = "CANCELLED"
+        cancelled.save(update_fields=["status"])
+
+        self.deliver([
+            self.succeeded("evt-1", paid),
+            self.succeeded("evt-2", paid),
+            self.succeeded("evt-3", cancelled),
+            {"id": "evt-4", "type": "payment.refunded", "data": {}},
+            {"id": "evt-5", "type": "payment.succeeded",
+             "data": {"payment_reference": "PAY-UNKNOWN"}},
+        ])
+
+        with mock.patch("apps.bookings.email._send_email") as send, \
+                self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(process_payment_events(), 5)
+            # Nothing is sent while the transactions are still open
+            self.assertEqual(send.call_count, 0)
+        self.assertEqual(send.call_count, 1)
+        self.assertEqual(process_payment_events(), 0)
+
+        paid.refresh_from_db()
+        self.assertEqual(paid.status, "CONFIRMED")
+        self.assertEqual(
+            dict(PaymentEvent.objects.values_list("event_id", "outcome")),
+            {
+                "evt-1": "APPLIED",
+                "evt-2": "IGNORED",
+                "evt-3": "FAILED",
+                "evt-4": "IGNORED",
+                "evt-5": "IGNORED",
+            },
+        )
+
+    def test_unexpected_errors_are_retried_then_given_up(self):
+        booking = self.pending_payment()
+        self.deliver(self.succeeded("evt-1", booking))
+
+        with mock.patch(
+            "apps.bookings.services.webhooks.complete_payment",
+            side_effect=RuntimeError("provider down"),
+        ):
+            for attempt in range(1, MAX_EVENT_ATTEMPTS + 1):
+                # Skip the backoff
+                PaymentEvent.objects.filter(processed_at__isnull=True).update(
+                    claimed_until=timezone.now() - timedelta(seconds=1)
+                )
+                process_payment_events()
+                event = PaymentEvent.objects.get()
+                self.assertEqual(event.attempts, attempt)
+                self.assertEqual(
+                    event.processed_at is None, attempt < MAX_EVENT_ATTEMPTS
+                )
+
+        self.assertEqual(event.outcome, "FAILED")
+        self.assertIn("provider down", event.error)
+
+    def test_failed_events_back_off_before_a_retry(self):
+        booking = self.pending_payment()
+        self.deliver(self.succeeded("evt-1", booking))
+
+        with mock.patch(
+            "apps.bookings.services.webhooks.complete_payment",
+            side_effect=RuntimeError("provider down"),
+        ):
+            self.assertEqual(process_payment_events(), 1)
+            self.assertEqual(process_payment_events(), 0)
+            first_retry = PaymentEvent.objects.get().claimed_until
+            self.assertGreaterEqual(
+                first_retry, timezone.now() + EVENT_RETRY_BACKOFF / 2
+            )
+
+            PaymentEvent.objects.update(
+                claimed_until=timezone.now() - timedelta(seconds=1)
+            )
+            self.assertEqual(process_payment_events(), 1)
+
+        event = PaymentEvent.objects.get()
+        self.assertEqual(event.attempts, 2)
+        self.assertIsNone(event.processed_at)
+        self.assertGreater(
+            event.claimed_until, timezone.now() + EVENT_RETRY_BACKOFF
+        )
+
+    def test_claimed_events_are_left_to_their_worker(self):
+        booking = self.pending_payment()
+        self.deliver(self.succeeded("evt-1", booking))
+        PaymentEvent.objects.update(
+            claimed_until=timezone.now() + timedelta(minutes=1)
+        )
+        self.assertEqual(process_payment_events(), 0)
+
+        # A worker that died: its claim runs out
+        PaymentEvent.objects.update(
+            claimed_until=timezone.now() - timedelta(seconds=1)
+        )
+        self.assertEqual(process_payment_events(), 1)
+        self.assertEqual(PaymentEvent.objects.get().outcome, "APPLIED")
+
+    def test_providers_must_implement_the_interface(self):
+        class Incomplete(PaymentProvider):
+            def verify(self, body, headers):
+                return True
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_command_drains_the_queue(self):
+        booking = self.pending_payment()
+        self.deliver(self.succeeded("evt-1", booking))
+
+        out = io.StringIO()
+        call_command("process_payment_events", batch_size=1, stdout=out)
+
+        self.assertIn("Processed 1 payment events", out.getvalue())
+        booking.refresh_from_db()
+        self.assertEqual(booking.status, "CONFIRMED")
@@ -8,12 +8,17 @@ from .views import (
     RequestCancellationView,
     VerifyCancellationView,
     BookingStatusCheckView,
+    BookingBatchStatusView,
+    BookingHistoryView,
+    AdminBookingExportView,
+    AdminCorporateImportView,
 )
 
 from .views.payments import (
     InitiatePaymentView,
     CompletePaymentView,
 )
+from .views.webhooks import PaymentWebhookView
 
 urlpatterns = [
     # ───── User flow ─────
@@ -21,6 +26,8 @@ urlpatterns = [
     path("verify-email/", VerifyEmailView.as_view()),
     path("confirm/", ConfirmBookingView.as_view()),
     path("check-status/", BookingStatusCheckView.as_view()),
+    path("check-status/batch/", BookingBatchStatusView.as_view()),
+    path("history/", BookingHistoryView.as_view()),
 
     path("request-cancellation/", RequestCancellationView.as_view()),
     path("verify-cancellation/", VerifyCancellationView.as_view()),
@@ -28,8 +35,14 @@ urlpatterns = [
     # ───── Payments ─────
     path("initiate-payment/", InitiatePaymentView.as_view()),
     path("complete-payment/", CompletePaymentView.as_view()),
+    path("webhooks/<slug:provider>/", PaymentWebhookView.as_view()),
 
     # ───── Admin flow ─────
     path("admin/bookings/<int:booking_id>/approve/", AdminApproveBookingView.as_view()),
     path("admin/bookings/<int:booking_id>/reject/", AdminRejectBookingView.as_view()),
+    path("admin/export/", AdminBookingExportView.as_view()),
+    path(
+        "admin/corporates/<int:corporate_id>/import/",
+        AdminCorporateImportView.as_view(),
+    ),
 ]
\ No newline at end of file
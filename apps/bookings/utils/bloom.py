@@ -0,0 +1,86 @@
+# apps/bookings/utils/bloom.py
+
+import math
+import struct
+from hashlib import blake2b
+
+# magic, bit count, hash count, capacity, values added
+HEADER = struct.Struct("<4sQBQQ")
+MAGIC = b"BLM1"
+
+_COUNT = struct.Struct("<Q")
+_COUNT_OFFSET = HEADER.size - _COUNT.size
+
+
+class BloomFilter:
+    """
+    Bloom filter of strings over a writable buffer: a bytearray, or an
+    mmap that several processes share. The header travels with the
+    bits, so a filter can be written to a file and mapped back.
+
+    `value in bloom` is never False for an added value and wrongly True
+    about `error_rate` of the time once `capacity` values are in.
+    """
+
+    def __init__(self, buffer):
+        magic, self.num_bits, self.num_hashes, self.capacity, _ = (
+            HEADER.unpack_from(buffer)
+        )
+        if magic != MAGIC:
+            raise ValueError("Not a Bloom filter")
+
+        self.buffer = buffer
+        self.bits = memoryview(buffer)[HEADER.size:]
+
+    @classmethod
+    def create(cls, capacity, error_rate=0.01):
+        num_bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+
+        buffer = bytearray(HEADER.size + (num_bits + 7) // 8)
+        HEADER.pack_into(buffer, 0, MAGIC, num_bits, num_hashes, capacity, 0)
+        return cls(buffer)
+
+    @property
+    def count(self):
+        """
+        Distinct values added (as far as the filter can tell).
+        """
+        return _COUNT.unpack_from(self.buffer, _COUNT_OFFSET)[0]
+
+    @property
+    def is_full(self):
+        return self.count > self.capacity
+
+    def _positions(self, value):
+        # Double hashing: k positions from one 128-bit digest
+        digest = blake2b(value.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        step = int.from_bytes(digest[8:], "little") | 1
+        return [
+            (first + i * step) % self.num_bits
+            for i in range(self.num_hashes)
+        ]
+
+    def add(self, value):
+        """
+        Sets the value's bits. Not atomic: callers serialise writers.
+        """
+        new = False
+        for position in self._positions(value):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not self.bits[byte] & mask:
+                self.bits[byte] |= mask
+                new = True
+
+        if new:
+            _COUNT.pack_into(self.buffer, _COUNT_OFFSET, self.count + 1)
+
+    def __contains__(self, value):
+        bits = self.bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
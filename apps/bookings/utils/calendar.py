@@ -1,5 +1,6 @@
 # apps/bookings/utils/calendar.py
 
+from datetime import timezone as dt_timezone
 from urllib.parse import urlencode
 from django.utils.timezone import localtime
 
@@ -14,24 +15,37 @@ def generate_google_calendar_link(booking):
     if booking.status != "CONFIRMED":
         return None
 
-    if not booking.approved_slot_start or not booking.approved_slot_end:
+    return build_google_calendar_link(
+        booking.acknowledgement_id,
+        booking.mode,
+        booking.approved_slot_start,
+        booking.approved_slot_end,
+    )
+
+
+def build_google_calendar_link(acknowledgement_id, mode, slot_start, slot_end):
+    """
+    The link itself, from plain column values (see serializers/fast.py).
+    """
+
+    if not slot_start or not slot_end:
         return None
 
     # Google Calendar expects local datetime without timezone suffix
-    start = localtime(booking.approved_slot_start).strftime("%Y%m%dT%H%M%S")
-    end = localtime(booking.approved_slot_end).strftime("%Y%m%dT%H%M%S")
+    start = localtime(slot_start).strftime("%Y%m%dT%H%M%S")
+    end = localtime(slot_end).strftime("%Y%m%dT%H%M%S")
 
     title = "MindSettler Counseling Session"
 
     description = (
-        f"Session ID: {booking.acknowledgement_id}\n"
-        f"Mode: {booking.mode}\n\n"
+        f"Session ID: {acknowledgement_id}\n"
+        f"Mode: {mode}\n\n"
         "Please arrive 5 minutes early."
     )
 
     location = (
         "MindSettler Studio"
-        if booking.mode == "OFFLINE"
+        if mode == "OFFLINE"
         else "Online Session"
     )
 
@@ -43,4 +57,107 @@ def generate_google_calendar_link(booking):
         "location": location,
     }
 
-    return "https://calendar.google.com/calendar/render?" + urlencode(params)
\ No newline at end of file
+    return "https://calendar.google.com/calendar/render?" + urlencode(params)
+
+
+# ─────────────────────────
+# ICALENDAR (RFC 5545)
+# ─────────────────────────
+ICS_PRODID = "-//MindSettler//Bookings//EN"
+
+
+def _ics_text(value):
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _ics_time(value):
+    return value.astimezone(dt_timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _ics_line(line):
+    """
+    One content line, folded at 75 octets, with its CRLF.
+    """
+    data = line.encode()
+    if len(data) <= 75:
+        return line + "\r\n"
+
+    parts = []
+    while data:
+        # Continuation lines start with a space, which counts
+        limit = 75 if not parts else 74
+        cut = min(limit, len(data))
+        # Never split a multi-byte character
+        while cut < len(data) and (data[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(data[:cut].decode())
+        data = data[cut:]
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def build_ics_event(acknowledgement_id, mode, slot_start, slot_end,
+                    updated_at, sequence):
+    """
+    VEVENT for one session, from plain column values. Output depends
+    only on the arguments, so unchanged bookings render identically;
+    SEQUENCE and LAST-MODIFIED tell calendar apps which copy is newer.
+    """
+    location = "MindSettler Studio" if mode == "OFFLINE" else "Online Session"
+    lines = (
+        "BEGIN:VEVENT",
+        f"UID:{acknowledgement_id}@mindsettler",
+        f"DTSTAMP:{_ics_time(updated_at)}",
+        f"LAST-MODIFIED:{_ics_time(updated_at)}",
+        f"SEQUENCE:{sequence}",
+        f"DTSTART:{_ics_time(slot_start)}",
+        f"DTEND:{_ics_time(slot_end)}",
+        "SUMMARY:MindSettler Counseling Session",
+        "DESCRIPTION:" + _ics_text(
+            f"Session ID: {acknowledgement_id}\nMode: {mode}"
+        ),
+        f"LOCATION:{_ics_text(location)}",
+        "STATUS:CONFIRMED",
+        "END:VEVENT",
+    )
+    return "".join(_ics_line(line) for line in lines)
+
+
+def iter_ics_calendar(events, name=None):
+    """
+    Yields a VCALENDAR piece by piece around already rendered VEVENTs.
+    """
+    yield _ics_line("BEGIN:VCALENDAR")
+    yield _ics_line("VERSION:2.0")
+    yield _ics_line(f"PRODID:{ICS_PRODID}")
+    yield _ics_line("CALSCALE:GREGORIAN")
+    yield _ics_line("METHOD:PUBLISH")
+    if name:
+        yield _ics_line(f"X-WR-CALNAME:{_ics_text(name)}")
+    yield from events
+    yield _ics_line("END:VCALENDAR")
+
+
+def booking_ics(booking):
+    """
+    Single-session .ics for a confirmed booking (email attachment),
+    or None when it has no slot yet. Same VEVENT as the booking's entry
+    in the psychologist's feed.
+    """
+    if not booking.approved_slot_start or not booking.approved_slot_end:
+        return None
+
+    event = build_ics_event(
+        booking.acknowledgement_id,
+        booking.mode,
+        booking.approved_slot_start,
+        booking.approved_slot_end,
+        booking.updated_at,
+        booking.ics_sequence,
+    )
+    return "".join(iter_ics_calendar([event]))
@@ -0,0 +1,27 @@
+# apps/bookings/utils/counters.py
+
+from django.db.models import F
+
+
+def add_to_counters(manager, lookup, changes):
+    """
+    Adds `changes` ({column: delta}) to the counter row matching
+    `lookup`, creating it at its defaults on first use.
+    One UPDATE when the row exists.
+    """
+    changes = {column: value for column, value in changes.items() if value}
+    if not changes:
+        return
+
+    values = {column: F(column) + value for column, value in changes.items()}
+
+    if manager.filter(**lookup).update(**values):
+        return
+
+    # Nothing to take away from a row that was never counted
+    if all(value < 0 for value in changes.values()):
+        return
+
+    # Insert-or-ignore, then update: safe against a concurrent insert
+    manager.bulk_create([manager.model(**lookup)], ignore_conflicts=True)
+    manager.filter(**lookup).update(**values)
@@ -0,0 +1,91 @@
+# apps/bookings/utils/pagination.py
+
+import base64
+import binascii
+from datetime import datetime
+
+from django.core.paginator import Paginator
+from django.db.models import Q
+from django.utils.functional import cached_property
+
+# Below this many rows an exact COUNT(*) is cheap enough to keep
+ESTIMATED_COUNT_THRESHOLD = 100_000
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that takes its count from `estimate` instead of COUNT(*)
+    for large lists. `estimate` is a callable returning a row count
+    (e.g. from a maintained counter), or None when it has none.
+
+    Only pass `estimate` when it counts exactly the rows object_list
+    covers — it knows nothing about WHERE clauses.
+    """
+
+    def __init__(self, *args, estimate=None,
+                 threshold=ESTIMATED_COUNT_THRESHOLD, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.estimate = estimate
+        self.threshold = threshold
+
+    @cached_property
+    def count(self):
+        if self.estimate is not None:
+            estimated = self.estimate()
+            if estimated is not None and estimated >= self.threshold:
+                return estimated
+        return super().count
+
+
+# ─────────────────────────
+# KEYSET (CURSOR) PAGINATION
+# ─────────────────────────
+def encode_cursor(created_at, pk):
+    """
+    Opaque cursor for the row a page ended on.
+    """
+    raw = f"{created_at.isoformat()}|{pk}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """
+    (created_at, pk) from encode_cursor(); ValueError when malformed.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, pk = raw.decode().split("|")
+        created_at = datetime.fromisoformat(created_at)
+        pk = int(pk)
+    except (binascii.Error, UnicodeDecodeError) as exc:
+        raise ValueError("Malformed cursor") from exc
+
+    if created_at.tzinfo is None:
+        raise ValueError("Malformed cursor")
+    return created_at, pk
+
+
+def keyset_page(queryset, cursor=None, limit=20):
+    """
+    One page of `queryset`, newest first, on (created_at, id).
+
+    Rows after the cursor are found by index seek, so page 1000 costs
+    the same as page 1 — unlike OFFSET, which reads and discards every
+    earlier row. Returns (rows, next_cursor or None).
+    """
+    queryset = queryset.order_by("-created_at", "-id")
+
+    if cursor:
+        created_at, pk = decode_cursor(cursor)
+        queryset = queryset.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+        )
+
+    # One extra row tells whether there is a next page
+    rows = list(queryset[:limit + 1])
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last.created_at, last.pk)
@@ -0,0 +1,43 @@
+# apps/bookings/utils/samples.py
+
+import uuid
+from datetime import time as dt_time, timedelta
+from decimal import Decimal
+
+from django.utils import timezone
+
+from apps.bookings.models import Booking
+
+
+def build_sample_bookings(count, rng):
+    """
+    Unsaved, varied bookings for benchmarks; nothing touches the database.
+    """
+    now = timezone.now()
+    statuses = [value for value, _ in Booking.STATUS_CHOICES]
+    periods = [value for value, _ in Booking.PERIOD_CHOICES]
+    modes = [value for value, _ in Booking.MODE_CHOICES]
+
+    bookings = []
+    for n in range(count):
+        slot = now + timedelta(days=rng.randrange(-60, 60), minutes=n)
+        end = slot + timedelta(hours=1)
+        scheduled = rng.random() < 0.7
+        bookings.append(Booking(
+            id=n + 1,
+            acknowledgement_id=f"MS-BENCH{n:06d}",
+            status=rng.choice(statuses),
+            full_name=f"Sample User {n}",
+            city=rng.choice(("Surat", "Pune", "Mumbai")),
+            preferred_date=slot.date(),
+            preferred_period=rng.choice(periods),
+            preferred_time_start=dt_time(10, 30) if n % 3 else None,
+            preferred_time_end=dt_time(11, 30) if n % 3 else None,
+            mode=rng.choice(modes),
+            approved_slot_start=slot if scheduled else None,
+            approved_slot_end=end if scheduled else None,
+            amount=Decimal("1500.00") if scheduled else None,
+            email_verification_token=uuid.UUID(int=rng.getrandbits(128)),
+            created_at=slot - timedelta(days=10, microseconds=n),
+        ))
+    return bookings
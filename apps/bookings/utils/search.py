@@ -0,0 +1,14 @@
+# apps/bookings/utils/search.py
+
+import re
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_search_text(*parts):
+    """
+    Lower-cased, whitespace-collapsed text used for booking search.
+    Empty parts are dropped.
+    """
+    text = " ".join(str(part) for part in parts if part)
+    return _WHITESPACE.sub(" ", text).strip().lower()
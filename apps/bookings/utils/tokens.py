@@ -0,0 +1,87 @@
+# apps/bookings/utils/tokens.py
+
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core import signing
+
+# ─────────────────────────
+# CONFIG
+# ─────────────────────────
+VERIFY_EMAIL = "verify-email"
+CANCEL = "cancel"
+# Read-only booking history, handed out once the email is verified
+HISTORY = "history"
+
+# Purpose → how long its links stay valid
+TOKEN_MAX_AGE = {
+    VERIFY_EMAIL: timedelta(days=2),
+    CANCEL: timedelta(days=1),
+    HISTORY: timedelta(days=30),
+}
+
+
+def _signer(purpose):
+    # The salt binds a token to its purpose: a verification link
+    # cannot be replayed against the cancellation endpoint
+    return signing.TimestampSigner(salt=f"bookings.{purpose}")
+
+
+def make_booking_token(booking_id, purpose):
+    """
+    '<booking id>:<timestamp>:<HMAC>' for an email link.
+    """
+    return _signer(purpose).sign(str(booking_id))
+
+
+def read_booking_token(token, purpose):
+    """
+    Booking ID from a signed token; None when it is forged, expired
+    or issued for another purpose. No database access.
+    """
+    try:
+        value = _signer(purpose).unsign(
+            token, max_age=TOKEN_MAX_AGE[purpose]
+        )
+    except signing.BadSignature:
+        # SignatureExpired is a BadSignature too
+        return None
+    return int(value)
+
+
+def read_legacy_token(token):
+    """
+    The UUID of a link sent before tokens were signed, or None.
+    Such tokens need a lookup on the UUID column and never expire;
+    ACCEPT_LEGACY_BOOKING_TOKENS = False turns them off.
+    """
+    if not settings.ACCEPT_LEGACY_BOOKING_TOKENS:
+        return None
+    try:
+        return uuid.UUID(token)
+    except (TypeError, ValueError):
+        return None
+
+
+# ─────────────────────────
+# CALENDAR FEEDS
+# ─────────────────────────
+# Subscription URLs are pasted into calendar apps once, so these
+# tokens never expire; rotating SECRET_KEY revokes them all
+_feed_signer = signing.Signer(salt="bookings.psychologist-feed")
+
+
+def make_feed_token(psychologist_id):
+    return _feed_signer.sign(str(psychologist_id)).split(":", 1)[1]
+
+
+def check_feed_token(psychologist_id, token):
+    """
+    True when `token` was issued for this psychologist's feed.
+    """
+    try:
+        _feed_signer.unsign(f"{psychologist_id}:{token}")
+    except signing.BadSignature:
+        return False
+    return True
@@ -3,4 +3,7 @@ from .verification import VerifyEmailView
 from .confirmation import ConfirmBookingView
 from .admin import AdminApproveBookingView, AdminRejectBookingView
 from .cancellation import RequestCancellationView, VerifyCancellationView
-from .status import BookingStatusCheckView
\ No newline at end of file
+from .status import BookingStatusCheckView, BookingBatchStatusView
+from .export import AdminBookingExportView
+from .imports import AdminCorporateImportView
+from .history import BookingHistoryView
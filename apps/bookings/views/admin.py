@@ -1,23 +1,53 @@
+from django.utils.dateparse import parse_datetime
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAdminUser
+from rest_framework.exceptions import ValidationError
 
 from apps.bookings.models import Booking
 from apps.bookings.services import approve_booking, reject_booking
+from apps.psychologists.models import Psychologist
+from apps.corporates.models import Corporate
+
+
+def _get_or_invalid(model, object_id, label):
+    try:
+        return model.objects.get(id=object_id)
+    except (model.DoesNotExist, ValueError, TypeError):
+        raise ValidationError(f"Invalid {label}")
 
 
 class AdminApproveBookingView(APIView):
     permission_classes = [IsAdminUser]
 
     def post(self, request, booking_id):
-        booking = Booking.objects.get(id=booking_id)
+        booking = _get_or_invalid(Booking, booking_id, "booking ID")
+
+        approved_start = parse_datetime(str(request.data.get("start", "")))
+        approved_end = parse_datetime(str(request.data.get("end", "")))
+
+        if not approved_start or not approved_end:
+            raise ValidationError("Valid slot start & end required")
+
+        if request.data.get("amount") is None:
+            raise ValidationError("Amount required")
+
+        psychologist_id = request.data.get("psychologist")
+        corporate_id = request.data.get("corporate")
 
         approve_booking(
             booking,
-            approved_start=request.data["start"],
-            approved_end=request.data["end"],
-            psychologist=request.data.get("psychologist"),
-            corporate=request.data.get("corporate"),
+            approved_start=approved_start,
+            approved_end=approved_end,
+            amount=request.data["amount"],
+            psychologist=(
+                _get_or_invalid(Psychologist, psychologist_id, "psychologist")
+                if psychologist_id else None
+            ),
+            corporate=(
+                _get_or_invalid(Corporate, corporate_id, "corporate")
+                if corporate_id else None
+            ),
         )
 
         return Response({"message": "Booking approved. Awaiting user confirmation."})
@@ -27,7 +57,7 @@ class AdminRejectBookingView(APIView):
     permission_classes = [IsAdminUser]
 
     def post(self, request, booking_id):
-        booking = Booking.objects.get(id=booking_id)
+        booking = _get_or_invalid(Booking, booking_id, "booking ID")
 
         reject_booking(
             booking,
@@ -35,4 +65,4 @@ class AdminRejectBookingView(APIView):
             alternate_slots=request.data.get("alternate_slots", ""),
         )
 
-        return Response({"message": "Booking rejected and user notified"})
\ No newline at end of file
+        return Response({"message": "Booking rejected and user notified"})
@@ -3,12 +3,16 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework.exceptions import ValidationError
 
+from apps.core.idempotency import IdempotentMixin
 from apps.bookings.models import Booking
 from apps.bookings.services.cancellation import cancel_by_user
+from apps.bookings.services.lookup_filter import might_exist
+from apps.bookings.services.queries import filter_by_token
+from apps.bookings.utils.tokens import CANCEL
 from apps.bookings.email import send_cancellation_verification_email
 
 
-class RequestCancellationView(APIView):
+class RequestCancellationView(IdempotentMixin, APIView):
     """
     Handles user-initiated cancellation requests.
 
@@ -17,6 +21,8 @@ class RequestCancellationView(APIView):
     - APPROVED         → instant cancel (no email)
     - PAYMENT_PENDING  → instant cancel (no email)
     - CONFIRMED        → email verification required
+
+    Retries with the same Idempotency-Key replay the first response.
     """
 
     permission_classes = [AllowAny]
@@ -28,6 +34,9 @@ class RequestCancellationView(APIView):
         if not ack_id:
             raise ValidationError("Acknowledgement ID required")
 
+        if not might_exist("acknowledgement_id", ack_id):
+            raise ValidationError("Booking not found or not cancellable")
+
         try:
             booking = Booking.objects.get(
                 acknowledgement_id=ack_id,
@@ -77,12 +86,19 @@ class VerifyCancellationView(APIView):
         if not token:
             raise ValidationError("Token required")
 
-        try:
-            booking = Booking.objects.get(
-                cancellation_token=token,
+        # Only issued with a cancellation request; rejected without a
+        # query when forged or expired
+        bookings = filter_by_token(
+            Booking.objects.filter(
                 status="CONFIRMED",
-            )
-        except Booking.DoesNotExist:
+                cancellation_requested_at__isnull=False,
+            ),
+            token,
+            CANCEL,
+        )
+        booking = bookings.first() if bookings is not None else None
+
+        if booking is None:
             raise ValidationError("Invalid or expired cancellation link")
 
         try:
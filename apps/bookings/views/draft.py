@@ -6,13 +6,14 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework.exceptions import ValidationError
 
-from apps.users.models import AppUser
+from apps.core.idempotency import IdempotentMixin
+from apps.users.services import get_or_create_user
 from apps.bookings.serializers.draft import BookingDraftSerializer
 from apps.bookings.services import get_active_booking
 from apps.bookings.email import send_booking_verification_email
 
 
-class BookingDraftCreateView(APIView):
+class BookingDraftCreateView(IdempotentMixin, APIView):
     permission_classes = [AllowAny]
     authentication_classes = []
 
@@ -29,7 +30,7 @@ class BookingDraftCreateView(APIView):
         if consent is not True:
             raise ValidationError("Privacy policy consent required")
 
-        user, _ = AppUser.objects.get_or_create(email=email)
+        user, _ = get_or_create_user(email)
 
         # ─────────────────────────
         # Active booking exists → email verification gate
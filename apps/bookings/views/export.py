@@ -0,0 +1,42 @@
+from django.utils import timezone
+from rest_framework.views import APIView
+from rest_framework.permissions import IsAdminUser
+
+from apps.bookings.serializers.export import BookingExportFilterSerializer
+from apps.bookings.services.exports import export_queryset, export_response
+
+
+class AdminBookingExportView(APIView):
+    """
+    GET /api/bookings/admin/export/?output=csv|ndjson
+        &date_from=&date_to=&date_field=created|session
+        &corporate=&psychologist=&status=CONFIRMED,COMPLETED
+
+    Streams the rows; the worker never holds the full result.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def perform_content_negotiation(self, request, force=False):
+        # The body is not rendered by DRF; accept `Accept: text/csv` too
+        return super().perform_content_negotiation(request, force=True)
+
+    def get(self, request):
+        serializer = BookingExportFilterSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+
+        queryset = export_queryset(
+            date_from=params.get("date_from"),
+            date_to=params.get("date_to"),
+            date_field=params["date_field"],
+            corporate=params.get("corporate"),
+            psychologist=params.get("psychologist"),
+            statuses=params.get("status"),
+        )
+
+        return export_response(
+            queryset,
+            output=params["output"],
+            filename=f"bookings-{timezone.localdate():%Y%m%d}",
+        )
@@ -0,0 +1,52 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+from rest_framework.exceptions import ValidationError
+
+from apps.bookings.serializers.history import (
+    BookingHistoryQuerySerializer,
+    BookingHistorySerializer,
+)
+from apps.bookings.services.queries import (
+    get_booking_history,
+    get_verified_user_id,
+)
+
+
+class BookingHistoryView(APIView):
+    """
+    GET /api/bookings/history/?token=<history token>&cursor=&limit=
+
+    The history token comes with a successful email verification and
+    lasts 30 days; the verification link's own token also works for
+    its 2 days.
+
+    Every booking of the verified user, newest first. Follow
+    `next_cursor` for older pages; it is null on the last page.
+    """
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request):
+        serializer = BookingHistoryQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+
+        user_id = get_verified_user_id(params["token"])
+        if user_id is None:
+            raise ValidationError("Invalid or unverified token")
+
+        try:
+            bookings, next_cursor = get_booking_history(
+                user_id,
+                cursor=params.get("cursor"),
+                limit=params["limit"],
+            )
+        except ValueError:
+            raise ValidationError("Invalid cursor")
+
+        return Response({
+            "results": BookingHistorySerializer(bookings, many=True).data,
+            "next_cursor": next_cursor,
+        })
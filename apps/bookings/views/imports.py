@@ -0,0 +1,46 @@
+from django.shortcuts import get_object_or_404
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAdminUser
+from rest_framework.exceptions import ValidationError
+
+from apps.corporates.models import Corporate
+from apps.bookings.services.imports import (
+    import_corporate_bookings,
+    parse_import_file,
+)
+
+
+class AdminCorporateImportView(APIView):
+    """
+    POST /api/bookings/admin/corporates/<id>/import/
+
+    Body: multipart `file` (.csv with a header row, or .json), or JSON
+    {"employees": [...]} / a bare list. Each row takes the draft fields plus
+    `email` and `consent_given`.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def post(self, request, corporate_id):
+        corporate = get_object_or_404(Corporate, id=corporate_id)
+
+        if not corporate.is_active:
+            raise ValidationError("Corporate is not active")
+
+        upload = request.FILES.get("file")
+        if upload is not None:
+            rows = parse_import_file(upload)
+        elif isinstance(request.data, list):
+            rows = request.data
+        else:
+            rows = request.data.get("employees")
+
+        if not isinstance(rows, list):
+            raise ValidationError(
+                "Upload a file or send an `employees` list"
+            )
+
+        report = import_corporate_bookings(corporate, rows)
+
+        return Response(report, status=201 if report["created"] else 200)
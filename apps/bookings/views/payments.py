@@ -3,11 +3,13 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework.exceptions import ValidationError
 
+from apps.core.idempotency import IdempotentMixin
 from apps.bookings.models import Booking
 from apps.bookings.services import initiate_payment, complete_payment
+from apps.bookings.services.lookup_filter import might_exist
 
 
-class InitiatePaymentView(APIView):
+class InitiatePaymentView(IdempotentMixin, APIView):
     permission_classes = [AllowAny]
     authentication_classes = []
 
@@ -17,6 +19,9 @@ class InitiatePaymentView(APIView):
         if not acknowledgement_id:
             raise ValidationError("Acknowledgement ID is required")
 
+        if not might_exist("acknowledgement_id", acknowledgement_id):
+            raise ValidationError("Invalid acknowledgement ID")
+
         try:
             booking = Booking.objects.get(
                 acknowledgement_id=acknowledgement_id
@@ -32,7 +37,7 @@ class InitiatePaymentView(APIView):
         })
     
 
-class CompletePaymentView(APIView):
+class CompletePaymentView(IdempotentMixin, APIView):
     permission_classes = [AllowAny]
     authentication_classes = []
 
@@ -42,6 +47,9 @@ class CompletePaymentView(APIView):
         if not payment_reference:
             raise ValidationError("Payment reference is required")
 
+        if not might_exist("payment_reference", payment_reference):
+            raise ValidationError("Invalid payment reference")
+
         try:
             booking = Booking.objects.get(
                 payment_reference=payment_reference
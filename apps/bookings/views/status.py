@@ -5,10 +5,13 @@ from rest_framework.exceptions import ValidationError
 from django.utils import timezone
 from datetime import timedelta
 
-from apps.bookings.models import Booking
-from apps.bookings.serializers.public import BookingPublicSerializer
-from apps.users.models import AppUser
+from apps.bookings.serializers.status import BookingBatchStatusSerializer
+from apps.users.services import find_user
 from apps.bookings.services import get_active_booking
+from apps.bookings.services.status import (
+    get_batch_statuses,
+    get_public_status,
+)
 from apps.bookings.email import send_booking_verification_email
 
 
@@ -22,34 +25,10 @@ class BookingStatusCheckView(APIView):
         if not acknowledgement_id:
             raise ValidationError("Acknowledgement ID is required")
 
-        try:
-            booking = Booking.objects.get(
-                acknowledgement_id=acknowledgement_id
-            )
-        except Booking.DoesNotExist:
-            raise ValidationError("Booking not found")
+        data = get_public_status(acknowledgement_id)
 
-        # Build timeline
-        timeline = []
-        if booking.created_at:
-            timeline.append("DRAFT")
-        if booking.submitted_at:
-            timeline.append("PENDING")
-        if booking.approved_at:
-            timeline.append("APPROVED")
-        if booking.payment_requested_at:
-            timeline.append("PAYMENT_PENDING")
-        if booking.confirmed_at:
-            timeline.append("CONFIRMED")
-        if booking.cancelled_at:
-            timeline.append("CANCELLED")
-        if booking.rejected_at:
-            timeline.append("REJECTED")
-
-        serializer = BookingPublicSerializer(booking)
-        data = serializer.data
-        data["timeline"] = timeline
-        data["amount"] = str(booking.amount) if booking.amount else None
+        if data is None:
+            raise ValidationError("Booking not found")
 
         return Response(data)
 
@@ -59,8 +38,9 @@ class BookingStatusCheckView(APIView):
         if not email:
             raise ValidationError("Email is required")
 
-        user, _ = AppUser.objects.get_or_create(email=email)
-        booking = get_active_booking(user)
+        # Read-only: an unknown address must not create a user
+        user = find_user(email)
+        booking = get_active_booking(user) if user else None
 
         if not booking:
             return Response(
@@ -95,3 +75,26 @@ class BookingStatusCheckView(APIView):
             },
             status=200,
         )
+
+
+class BookingBatchStatusView(APIView):
+    """
+    POST /api/bookings/check-status/batch/
+    {"acknowledgement_ids": ["MS-...", ...]}
+
+    Same payload as check-status/ for each ID, in one request and one
+    query. Unknown IDs are reported per item.
+    """
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def post(self, request):
+        serializer = BookingBatchStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        return Response({
+            "results": get_batch_statuses(
+                serializer.validated_data["acknowledgement_ids"]
+            ),
+        })
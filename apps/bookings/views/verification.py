@@ -5,6 +5,8 @@ from rest_framework.exceptions import ValidationError
 
 from apps.bookings.models import Booking
 from apps.bookings.services import get_active_booking, submit_booking
+from apps.bookings.services.queries import filter_by_token
+from apps.bookings.utils.tokens import HISTORY, VERIFY_EMAIL, make_booking_token
 from apps.bookings.serializers.public import BookingPublicSerializer
 
 
@@ -18,11 +20,13 @@ class VerifyEmailView(APIView):
         if not token:
             raise ValidationError("Verification token is required")
 
-        try:
-            booking = Booking.objects.select_related("user").get(
-                email_verification_token=token
-            )
-        except Booking.DoesNotExist:
+        # Forged / expired signed tokens are rejected without a query
+        bookings = filter_by_token(
+            Booking.objects.select_related("user"), token, VERIFY_EMAIL
+        )
+        booking = bookings.first() if bookings is not None else None
+
+        if booking is None:
             raise ValidationError("Invalid or expired verification link")
 
         # ─────────────────────────
@@ -73,6 +77,8 @@ class VerifyEmailView(APIView):
             {
                 "message": "Email verified successfully",
                 "booking": serializer.data,
+                # For /api/bookings/history/, valid longer than this link
+                "history_token": make_booking_token(booking.id, HISTORY),
             },
             status=200,
         )
\ No newline at end of file
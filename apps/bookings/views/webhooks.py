@@ -0,0 +1,35 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+from rest_framework.exceptions import NotFound, PermissionDenied
+
+from apps.bookings.services.webhooks import (
+    PAYMENT_PROVIDERS,
+    store_payment_events,
+)
+
+
+class PaymentWebhookView(APIView):
+    """
+    Receives payment provider webhooks. Events are stored and
+    acknowledged straight away; process_payment_events applies them
+    to bookings, so a burst of confirmations never waits on booking
+    logic or email.
+    """
+
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def post(self, request, provider):
+        payment_provider = PAYMENT_PROVIDERS.get(provider)
+        if payment_provider is None:
+            raise NotFound("Unknown payment provider")
+
+        # The signature covers the raw bytes, so request.data is not used
+        body = request.body
+        if not payment_provider.verify(body, request.META):
+            raise PermissionDenied("Invalid webhook signature")
+
+        received = store_payment_events(payment_provider, body)
+
+        return Response({"received": received})
@@ -1,3 +1,41 @@
-from django.test import TestCase
+import uuid
 
-# Create your tests here.
+from apps.bookings.tests.base import QueryCountTestCase, make_booking
+
+
+class ChatbotIntentQueryCountTests(QueryCountTestCase):
+
+    def intent(self, email):
+        return self.post_json("/api/chatbot/intent/", {
+            "intent": "book_session",
+            "email": email,
+            "name": "Chat User",
+            "phone": "9999999999",
+            "mode": "ONLINE",
+            "payment_mode": "ONLINE",
+        })
+
+    def test_new_user_intent(self):
+        self.assertQueriesAtEachSize(
+            9,
+            prepare=lambda: f"{uuid.uuid4().hex}@example.com",
+            perform=self.intent,
+            status=201,
+        )
+
+    def test_intent_with_active_booking(self):
+        self.assertQueriesAtEachSize(
+            2,
+            prepare=lambda: make_booking(self.new_user(), status="PENDING"),
+            perform=lambda booking: self.intent(booking.user.email),
+            status=400,
+        )
+
+    def test_unsupported_intent(self):
+        self.assertQueriesAtEachSize(
+            0,
+            perform=lambda _: self.post_json(
+                "/api/chatbot/intent/", {"intent": "smalltalk"}
+            ),
+            status=400,
+        )
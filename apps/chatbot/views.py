@@ -4,7 +4,7 @@ from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny
 
-from apps.users.models import AppUser
+from apps.users.services import get_or_create_user
 from apps.bookings.models import Booking
 from apps.bookings.services import has_active_booking
 from apps.bookings.email import send_booking_verification_email
@@ -32,13 +32,7 @@ class ChatbotIntentView(APIView):
             raise ValidationError("Email is required")
 
         # Create or fetch user
-        user, _ = AppUser.objects.get_or_create(
-            email=email,
-            defaults={
-                "full_name": name,
-                "phone": phone,
-            }
-        )
+        user, _ = get_or_create_user(email, full_name=name, phone=phone)
 
         # Block if user already has an active booking
         if has_active_booking(user):
@@ -52,7 +46,8 @@ class ChatbotIntentView(APIView):
         # Create DRAFT booking (NOT ACTIVE YET)
         booking = Booking.objects.create(
             user=user,
-            session_type=request.data.get("session_type"),
+            full_name=name,
+            phone_number=phone,
             preferred_period=request.data.get("preferred_period"),
             preferred_time_start=request.data.get("preferred_time_start"),
             preferred_time_end=request.data.get("preferred_time_end"),
@@ -1,3 +1,19 @@
-from django.contrib import admin
+from apps.core.search import prefix_search
 
-# Register your models here.
+
+class PrefixAutocompleteMixin:
+    """
+    Admin autocomplete matches `autocomplete_search_fields` by prefix,
+    which the prefix indexes serve; the changelist search box keeps
+    search_fields (Django requires them for autocomplete regardless).
+    """
+
+    autocomplete_search_fields = ()
+
+    def get_search_results(self, request, queryset, search_term):
+        match = request.resolver_match
+        if match and match.view_name == f"{self.admin_site.name}:autocomplete":
+            return prefix_search(
+                queryset, self.autocomplete_search_fields, search_term
+            ), False
+        return super().get_search_results(request, queryset, search_term)
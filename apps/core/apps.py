@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
-    name = "apps.core"
\ No newline at end of file
+    name = "apps.core"
+
+    def ready(self):
+        from . import signals
+
+        post_migrate.connect(signals.ensure_prefix_indexes, sender=self)
@@ -0,0 +1,178 @@
+# apps/core/idempotency.py
+
+import hashlib
+import time
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse, JsonResponse
+from django.utils import timezone
+
+from apps.core.models import IdempotencyRecord
+
+# ─────────────────────────
+# CONFIG
+# ─────────────────────────
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+MAX_KEY_LENGTH = 255
+
+# How long a key is remembered
+IDEMPOTENCY_KEY_TTL = timedelta(hours=24)
+
+# A duplicate arriving while the first request runs waits this long
+# for its response before getting 409
+IN_FLIGHT_WAIT_SECONDS = 2.0
+IN_FLIGHT_POLL_SECONDS = 0.1
+
+# An unfinished record this old belongs to a crashed request
+IN_FLIGHT_TIMEOUT = timedelta(minutes=1)
+
+
+def _error(detail, status):
+    return JsonResponse({"detail": detail}, status=status)
+
+
+def _fingerprint(request):
+    digest = hashlib.sha256(request.method.encode())
+    digest.update(request.path.encode())
+    digest.update(request.body)
+    return digest.hexdigest()
+
+
+def _replay(record):
+    response = HttpResponse(
+        bytes(record.body),
+        status=record.status_code,
+        content_type=record.content_type or None,
+    )
+    response["Idempotent-Replayed"] = "true"
+    return response
+
+
+# ─────────────────────────
+# RECORDS
+# ─────────────────────────
+def _claim(scope, key, fingerprint):
+    """
+    (record, claimed): claimed is True when this request must run the
+    view; otherwise `record` is the earlier request's.
+    """
+    now = timezone.now()
+    try:
+        with transaction.atomic():
+            return IdempotencyRecord.objects.create(
+                scope=scope, key=key, fingerprint=fingerprint, created_at=now
+            ), True
+    except IntegrityError:
+        pass
+
+    record = IdempotencyRecord.objects.filter(scope=scope, key=key).first()
+    if record is None:
+        # Purged in between: start over
+        return _claim(scope, key, fingerprint)
+
+    expired = record.created_at < now - IDEMPOTENCY_KEY_TTL
+    abandoned = (
+        record.completed_at is None
+        and record.created_at < now - IN_FLIGHT_TIMEOUT
+    )
+    if expired or abandoned:
+        # Conditional update: only one retry takes the key over
+        taken = IdempotencyRecord.objects.filter(
+            pk=record.pk, created_at=record.created_at
+        ).update(
+            fingerprint=fingerprint,
+            created_at=now,
+            completed_at=None,
+            status_code=None,
+            content_type="",
+            body=b"",
+        )
+        if taken:
+            record.fingerprint = fingerprint
+            record.created_at = now
+            return record, True
+
+    return record, False
+
+
+def _wait_for(record):
+    deadline = time.monotonic() + IN_FLIGHT_WAIT_SECONDS
+    while record.completed_at is None and time.monotonic() < deadline:
+        time.sleep(IN_FLIGHT_POLL_SECONDS)
+        record = IdempotencyRecord.objects.filter(pk=record.pk).first()
+        if record is None:
+            return None
+    return record
+
+
+# ─────────────────────────
+# VIEW MIXIN
+# ─────────────────────────
+class IdempotentMixin:
+    """
+    Idempotency-Key support for POST views.
+
+    - First request with a key → runs normally; the response is stored
+      (5xx responses are not, so the client can retry)
+    - Same key and body again → stored response, view not run
+    - Same key, different body → 422
+    - Same key while the first is running → waits briefly, then 409
+
+    Requests without the header are untouched.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if request.method != "POST" or not key:
+            return super().dispatch(request, *args, **kwargs)
+
+        if len(key) > MAX_KEY_LENGTH:
+            return _error(
+                f"{IDEMPOTENCY_HEADER} must be at most "
+                f"{MAX_KEY_LENGTH} characters",
+                400,
+            )
+
+        scope = f"{request.method} {request.path}"
+        fingerprint = _fingerprint(request)
+        record, claimed = _claim(scope, key, fingerprint)
+
+        if not claimed:
+            if record.fingerprint != fingerprint:
+                return _error(
+                    f"{IDEMPOTENCY_HEADER} was already used for a "
+                    "different request",
+                    422,
+                )
+
+            record = _wait_for(record)
+            if record is None or record.completed_at is None:
+                response = _error(
+                    "A request with this key is still in progress", 409
+                )
+                response["Retry-After"] = "1"
+                return response
+
+            return _replay(record)
+
+        try:
+            response = super().dispatch(request, *args, **kwargs)
+            if hasattr(response, "render"):
+                response.render()
+        except BaseException:
+            record.delete()
+            raise
+
+        if response.status_code >= 500:
+            record.delete()
+            return response
+
+        record.status_code = response.status_code
+        record.content_type = response.get("Content-Type", "")
+        record.body = response.content
+        record.completed_at = timezone.now()
+        record.save(update_fields=[
+            "status_code", "content_type", "body", "completed_at"
+        ])
+        return response
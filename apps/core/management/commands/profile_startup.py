@@ -0,0 +1,94 @@
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# What a worker does before its first response: set Django up (apps,
+# models, admin autodiscovery) and load the URLconf (every view)
+BOOT_SCRIPT = """
+import time
+started = time.perf_counter()
+import django
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+print(time.perf_counter() - started)
+"""
+
+# import time:  self [us] | cumulative | imported package
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\| ( *)(\S+)$")
+
+
+def _group(module):
+    # Our own apps are reported per app, everything else per package
+    parts = module.split(".")
+    return ".".join(parts[:2]) if parts[0] == "apps" else parts[0]
+
+
+class Command(BaseCommand):
+    help = (
+        "Boot the project in a fresh interpreter under `python -X importtime` "
+        "and report where worker startup time goes"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=15)
+        parser.add_argument(
+            "--runs",
+            type=int,
+            default=3,
+            help="Boot this many times and report the fastest",
+        )
+
+    def boot(self):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", BOOT_SCRIPT],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode:
+            raise CommandError(result.stderr.strip().splitlines()[-1])
+
+        imports = []
+        for line in result.stderr.splitlines():
+            match = IMPORT_LINE.match(line)
+            if match:
+                own, cumulative, indent, module = match.groups()
+                imports.append((module, int(own), int(cumulative), len(indent)))
+
+        return float(result.stdout.strip().splitlines()[-1]), imports
+
+    def handle(self, *args, **options):
+        runs = [self.boot() for _ in range(max(1, options["runs"]))]
+        wall, imports = min(runs, key=lambda run: run[0])
+        top = options["top"]
+
+        by_group = defaultdict(int)
+        for module, own, _, _ in imports:
+            by_group[_group(module)] += own
+        imported = sum(by_group.values())
+
+        self.stdout.write(
+            f"Boot to first request: {wall * 1000:.0f} ms "
+            f"(fastest of {len(runs)}), {len(imports)} modules, "
+            f"{imported / 1000:.0f} ms importing\n"
+        )
+
+        self.stdout.write("Import time by package (self time, all modules):")
+        for group, own in sorted(
+            by_group.items(), key=lambda item: item[1], reverse=True
+        )[:top]:
+            self.stdout.write(
+                f"  {own / 1000:8.1f} ms  {own / imported * 100:5.1f}%  {group}"
+            )
+
+        self.stdout.write("\nSlowest imports (cumulative, outermost only):")
+        outermost = [row for row in imports if row[3] == 0]
+        for module, _, cumulative, _ in sorted(
+            outermost, key=lambda row: row[2], reverse=True
+        )[:top]:
+            self.stdout.write(f"  {cumulative / 1000:8.1f} ms  {module}")
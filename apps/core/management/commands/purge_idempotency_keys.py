@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.core.idempotency import IDEMPOTENCY_KEY_TTL
+from apps.core.models import IdempotencyRecord
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete Idempotency-Key records older than their TTL. "
+        "Safe to run from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=5000)
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - IDEMPOTENCY_KEY_TTL
+        expired = IdempotencyRecord.objects.filter(created_at__lt=cutoff)
+        deleted = 0
+
+        # Small DELETEs (served by idempotency_created_idx), not one
+        # long lock over the table
+        while True:
+            ids = list(
+                expired.values_list("id", flat=True)[:options["batch_size"]]
+            )
+            if not ids:
+                break
+            deleted += IdempotencyRecord.objects.filter(id__in=ids).delete()[0]
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {deleted} expired idempotency keys."
+        ))
@@ -1,39 +1,56 @@
 from django.utils import timezone
 from django.shortcuts import redirect
 from django.contrib.auth import logout
-from datetime import timedelta
+from django.core.cache import cache
+from datetime import datetime, timedelta
 
 
 class AdminActivityMiddleware:
     """
     Force admin logout after inactivity.
     HARD BLOCK — browser independent.
+
+    Last-seen lives in the cache and is written on every admin page
+    view; the session copy (a DB write with the db backend) is refreshed
+    at most once per PERSIST_INTERVAL, and only used when the cache has
+    lost the value.
     """
 
     IDLE_TIMEOUT = timedelta(minutes=10)
+    PERSIST_INTERVAL = timedelta(minutes=1)
+
+    SESSION_KEY = "admin_last_seen"
+    CACHE_PREFIX = "admin-last-seen:"
 
     def __init__(self, get_response):
         self.get_response = get_response
 
     def __call__(self, request):
-
-        if request.path.startswith("/admin/"):
-            user = request.user
-
-            if user.is_authenticated and user.is_staff:
-                now = timezone.now()
-                last_seen = request.session.get("admin_last_seen")
-
-                if last_seen:
-                    last_seen = timezone.datetime.fromisoformat(last_seen)
-
-                    if now - last_seen > self.IDLE_TIMEOUT:
-                        logout(request)
-                        request.session.flush()
-                        return redirect("/admin/login/?timeout=1")
-
-                #  update ONLY on admin HTML pages
-                if request.method == "GET" and "text/html" in request.META.get("HTTP_ACCEPT", ""):
-                    request.session["admin_last_seen"] = now.isoformat()
-
-        return self.get_response(request)
\ No newline at end of file
+        # Fast path: nothing below concerns the API or static files
+        if not request.path.startswith("/admin/"):
+            return self.get_response(request)
+
+        user = request.user
+        if not (user.is_authenticated and user.is_staff):
+            return self.get_response(request)
+
+        now = timezone.now()
+        cache_key = self.CACHE_PREFIX + request.session.session_key
+        stored = request.session.get(self.SESSION_KEY)
+        stored = datetime.fromisoformat(stored) if stored else None
+        last_seen = cache.get(cache_key) or stored
+
+        if last_seen and now - last_seen > self.IDLE_TIMEOUT:
+            cache.delete(cache_key)
+            logout(request)
+            request.session.flush()
+            return redirect("/admin/login/?timeout=1")
+
+        #  update ONLY on admin HTML pages
+        if request.method == "GET" and "text/html" in request.META.get("HTTP_ACCEPT", ""):
+            cache.set(cache_key, now, self.IDLE_TIMEOUT.total_seconds())
+
+            if not stored or now - stored >= self.PERSIST_INTERVAL:
+                request.session[self.SESSION_KEY] = now.isoformat()
+
+        return self.get_response(request)
@@ -0,0 +1,31 @@
+# Generated by Django 6.0 on 2026-10-19 18:05
+
+from django.db import migrations
+
+
+def create_prefix_indexes(apps, schema_editor):
+    from apps.core.search import install_prefix_indexes
+
+    install_prefix_indexes(schema_editor.connection, apps)
+
+
+def drop_prefix_indexes(apps, schema_editor):
+    from apps.core.search import drop_prefix_indexes
+
+    drop_prefix_indexes(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('corporates', '0002_corporate_monthly_usage'),
+        ('psychologists', '0001_initial'),
+        ('users', '0002_appuser_last_admin_activity'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            create_prefix_indexes,
+            drop_prefix_indexes,
+        ),
+    ]
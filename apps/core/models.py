@@ -1,3 +1,35 @@
 from django.db import models
 
-# Create your models here.
+
+class IdempotencyRecord(models.Model):
+    """
+    First response to a POST sent with an Idempotency-Key header,
+    replayed for retries of the same request (apps/core/idempotency.py).
+    `completed_at` is empty while the first request is still running.
+    """
+
+    scope = models.CharField(max_length=200)
+    key = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64)
+
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    content_type = models.CharField(max_length=100, blank=True)
+    body = models.BinaryField(default=b"", blank=True)
+
+    created_at = models.DateTimeField()
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["scope", "key"],
+                name="idempotency_scope_key_unique",
+            ),
+        ]
+        indexes = [
+            # purge_idempotency_keys deletes by age
+            models.Index(fields=["created_at"], name="idempotency_created_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.scope} {self.key}"
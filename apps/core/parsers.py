@@ -0,0 +1,46 @@
+# apps/core/parsers.py
+
+import codecs
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.utils import json
+
+from apps.core.renderers import FastJSONRenderer, orjson
+
+
+class FastJSONParser(JSONParser):
+    """
+    JSONParser on orjson when it is installed, stdlib json otherwise.
+
+    Accepts exactly what DRF accepts: bodies orjson rejects (e.g.
+    integers beyond 64 bits) are retried with stdlib json before
+    failing with the usual ParseError.
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+
+        try:
+            body = stream.read()
+            if codecs.lookup(encoding).name != "utf-8":
+                body = body.decode(encoding)
+
+            try:
+                return orjson.loads(body)
+            except orjson.JSONDecodeError:
+                pass
+
+            if isinstance(body, bytes):
+                body = body.decode("utf-8")
+            parse_constant = json.strict_constant if self.strict else None
+            return json.loads(body, parse_constant=parse_constant)
+        except ValueError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
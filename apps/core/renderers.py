@@ -0,0 +1,62 @@
+# apps/core/renderers.py
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used instead
+    orjson = None
+
+
+# Same text as DRF: UTC as "Z", dict keys coerced to str
+ORJSON_OPTIONS = (
+    orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS if orjson else 0
+)
+
+# DRF escapes these two for JavaScript (JSONP-safe output); orjson
+# writes them raw
+_LINE_SEPARATORS = (
+    ("\u2028".encode(), b"\\u2028"),
+    ("\u2029".encode(), b"\\u2029"),
+)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer on orjson when it is installed, stdlib json otherwise.
+
+    Output matches DRF's default compact rendering: datetimes, dates,
+    times and UUIDs are encoded natively in the same ISO forms; Decimal
+    and anything else orjson does not know goes through DRF's encoder
+    (Decimal → float, as DRF). Large floats may use the shorter "1e20"
+    exponent form. Indented or ASCII-only output and anything orjson
+    refuses are rendered by DRF itself.
+
+    Default for the API (REST_FRAMEWORK settings); a view opts out with
+    `renderer_classes = [JSONRenderer]`.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if (
+            orjson is None
+            or data is None
+            # Only DRF's default compact, unicode output is reproduced
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {})
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=ORJSON_OPTIONS,
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits: stdlib copes
+            return super().render(data, accepted_media_type, renderer_context)
+
+        for raw, escaped in _LINE_SEPARATORS:
+            ret = ret.replace(raw, escaped)
+        return ret
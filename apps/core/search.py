@@ -0,0 +1,86 @@
+# apps/core/search.py
+
+from django.apps import apps as global_apps
+from django.db.models import Q
+
+# ─────────────────────────
+# CONFIG
+# ─────────────────────────
+# (model, column, index) pairs admin autocomplete matches by prefix
+PREFIX_INDEXES = (
+    ("users.AppUser", "email", "appuser_email_prefix_idx"),
+    ("users.AppUser", "full_name", "appuser_name_prefix_idx"),
+    ("users.AppUser", "phone", "appuser_phone_prefix_idx"),
+    ("psychologists.Psychologist", "full_name", "psychologist_name_prefix_idx"),
+    ("psychologists.Psychologist", "email", "psychologist_email_prefix_idx"),
+    ("corporates.Corporate", "name", "corporate_name_prefix_idx"),
+    ("corporates.Corporate", "contact_email", "corporate_email_prefix_idx"),
+)
+
+
+# ─────────────────────────
+# INDEX MAINTENANCE
+# ─────────────────────────
+def _index_sql(connection, table, column, name):
+    """
+    An index `column__istartswith` can range-scan:
+
+    - PostgreSQL → UPPER(col::text) LIKE UPPER('x%') needs the same
+      expression with text_pattern_ops
+    - SQLite     → case-insensitive LIKE 'x%' needs a NOCASE index
+    """
+    quote = connection.ops.quote_name
+
+    if connection.vendor == "postgresql":
+        return (
+            f"CREATE INDEX IF NOT EXISTS {quote(name)} ON {quote(table)} "
+            f"(UPPER({quote(column)}::text) text_pattern_ops)"
+        )
+    if connection.vendor == "sqlite":
+        return (
+            f"CREATE INDEX IF NOT EXISTS {quote(name)} ON {quote(table)} "
+            f"({quote(column)} COLLATE NOCASE)"
+        )
+    return None
+
+
+def install_prefix_indexes(connection, apps=global_apps):
+    """
+    Idempotently creates the prefix search indexes.
+
+    They are raw SQL, so SQLite loses them whenever a migration
+    rebuilds one of the tables; this also runs after every migrate.
+    """
+    tables = set(connection.introspection.table_names())
+
+    with connection.cursor() as cursor:
+        for label, column, name in PREFIX_INDEXES:
+            table = apps.get_model(label)._meta.db_table
+            sql = _index_sql(connection, table, column, name)
+            if sql and table in tables:
+                cursor.execute(sql)
+
+
+def drop_prefix_indexes(connection):
+    quote = connection.ops.quote_name
+
+    with connection.cursor() as cursor:
+        for _, _, name in PREFIX_INDEXES:
+            cursor.execute(f"DROP INDEX IF EXISTS {quote(name)}")
+
+
+# ─────────────────────────
+# SEARCH
+# ─────────────────────────
+def prefix_search(queryset, fields, term):
+    """
+    Rows where any of `fields` starts with `term`, case-insensitively.
+    """
+    term = term.strip()
+    if not term:
+        return queryset
+
+    match = Q()
+    for field in fields:
+        match |= Q(**{f"{field}__istartswith": term})
+    return queryset.filter(match)
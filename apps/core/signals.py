@@ -0,0 +1,12 @@
+# apps/core/signals.py
+
+from django.db import connections
+
+from apps.core.search import install_prefix_indexes
+
+
+def ensure_prefix_indexes(sender, using="default", **kwargs):
+    """
+    post_migrate: re-create prefix indexes dropped by table rebuilds.
+    """
+    install_prefix_indexes(connections[using])
@@ -1,3 +1,216 @@
-from django.test import TestCase
+import io
+import uuid
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import mock
+from zoneinfo import ZoneInfo
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from apps.core.idempotency import IDEMPOTENCY_KEY_TTL
+from apps.core.middleware.admin_activity import AdminActivityMiddleware
+from apps.core.parsers import FastJSONParser
+from apps.core.renderers import FastJSONRenderer
+from apps.core.models import IdempotencyRecord
+from apps.core.search import PREFIX_INDEXES
+from apps.users.models import AppUser
+
+PAYLOAD = {
+    "amount": Decimal("1500.50"),
+    "token": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "utc": datetime(2026, 1, 5, 9, 30, tzinfo=dt_timezone.utc),
+    "micro": datetime(2026, 1, 5, 9, 30, 0, 250, tzinfo=dt_timezone.utc),
+    "local": datetime(2026, 1, 5, 15, 0, tzinfo=ZoneInfo("Asia/Kolkata")),
+    "date": date(2026, 1, 5),
+    "time": time(10, 30),
+    "text": "Surat \u2013 \u20b9 \u2028 line",
+    "nested": [{1: None, "ok": True}],
+}
+
+
+class FastJSONRendererTests(SimpleTestCase):
+
+    def test_matches_drf_output(self):
+        self.assertEqual(
+            FastJSONRenderer().render(PAYLOAD), JSONRenderer().render(PAYLOAD)
+        )
+
+    def test_indented_output_falls_back_to_drf(self):
+        media_type = "application/json; indent=2"
+        self.assertEqual(
+            FastJSONRenderer().render(PAYLOAD, media_type),
+            JSONRenderer().render(PAYLOAD, media_type),
+        )
+
+    def test_values_orjson_refuses_fall_back_to_drf(self):
+        data = {"big": 2 ** 70}
+        self.assertEqual(
+            FastJSONRenderer().render(data), JSONRenderer().render(data)
+        )
+
+    def test_without_orjson(self):
+        with mock.patch("apps.core.renderers.orjson", None):
+            self.assertEqual(
+                FastJSONRenderer().render(PAYLOAD),
+                JSONRenderer().render(PAYLOAD),
+            )
+
+
+class FastJSONParserTests(SimpleTestCase):
+
+    def parse(self, body, parser=None):
+        return (parser or FastJSONParser()).parse(io.BytesIO(body))
+
+    def test_matches_drf_parser(self):
+        body = JSONRenderer().render(PAYLOAD)
+        self.assertEqual(self.parse(body), self.parse(body, JSONParser()))
+
+    def test_big_integers_fall_back_to_stdlib(self):
+        self.assertEqual(self.parse(b'{"n": 1180591620717411303424}'), {
+            "n": 2 ** 70,
+        })
+
+    def test_invalid_json_is_a_parse_error(self):
+        for body in (b"", b"{oops", b'{"n": NaN}'):
+            with self.subTest(body=body):
+                with self.assertRaises(ParseError):
+                    self.parse(body)
+
+    def test_without_orjson(self):
+        with mock.patch("apps.core.parsers.orjson", None):
+            self.assertEqual(self.parse(b'{"a": [1, 2]}'), {"a": [1, 2]})
+
+
+class DefaultRendererTests(TestCase):
+
+    def test_api_uses_fast_renderer(self):
+        response = self.client.get("/api/bookings/check-status/")
+        self.assertIsInstance(response.accepted_renderer, FastJSONRenderer)
+        self.assertEqual(response.json(), ["Acknowledgement ID is required"])
+
+
+class AdminActivityMiddlewareTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = get_user_model().objects.create_superuser(
+            username="admin", password="admin-password", email="a@example.com"
+        )
+
+    def setUp(self):
+        self.client.force_login(self.superuser)
+
+    def get_admin(self):
+        return self.client.get("/admin/", HTTP_ACCEPT="text/html")
+
+    def cache_key(self):
+        return AdminActivityMiddleware.CACHE_PREFIX + self.client.session.session_key
+
+    def test_session_written_at_most_once_a_minute(self):
+        self.get_admin()
+        first = self.client.session[AdminActivityMiddleware.SESSION_KEY]
+
+        with self.assertNumQueries(5):
+            self.get_admin()
+
+        self.assertEqual(
+            self.client.session[AdminActivityMiddleware.SESSION_KEY], first
+        )
+
+        later = timezone.now() + AdminActivityMiddleware.PERSIST_INTERVAL
+        with mock.patch("django.utils.timezone.now", return_value=later):
+            self.get_admin()
+        self.assertEqual(
+            self.client.session[AdminActivityMiddleware.SESSION_KEY],
+            later.isoformat(),
+        )
+
+    def idle_time(self):
+        return (
+            timezone.now()
+            + AdminActivityMiddleware.IDLE_TIMEOUT
+            + timedelta(seconds=30)
+        )
+
+    def test_cached_activity_keeps_session_alive(self):
+        self.get_admin()
+        later = self.idle_time()
+        # Seen a minute ago per the cache; the session copy is stale
+        cache.set(self.cache_key(), later - timedelta(minutes=1))
+
+        with mock.patch("django.utils.timezone.now", return_value=later):
+            response = self.get_admin()
+        self.assertEqual(response.status_code, 200)
+
+    def test_idle_admin_is_logged_out(self):
+        self.get_admin()
+
+        with mock.patch("django.utils.timezone.now", return_value=self.idle_time()):
+            response = self.get_admin()
+        self.assertRedirects(
+            response, "/admin/login/?timeout=1", fetch_redirect_response=False
+        )
+
+    def test_falls_back_to_session_when_cache_is_empty(self):
+        self.get_admin()
+        cache.delete(self.cache_key())
+
+        with mock.patch("django.utils.timezone.now", return_value=self.idle_time()):
+            response = self.get_admin()
+        self.assertRedirects(
+            response, "/admin/login/?timeout=1", fetch_redirect_response=False
+        )
+
+    def test_api_requests_skip_tracking(self):
+        self.client.get("/api/health/", HTTP_ACCEPT="text/html")
+        self.assertNotIn(
+            AdminActivityMiddleware.SESSION_KEY, self.client.session
+        )
+
+
+class PrefixIndexTests(TestCase):
+
+    def test_indexes_serve_prefix_lookups(self):
+        # PostgreSQL would seq-scan a table this small regardless
+        if connection.vendor != "sqlite":
+            self.skipTest("Query plan checked on SQLite only")
+
+        AppUser.objects.bulk_create([
+            AppUser(email=f"user{n}@example.com") for n in range(50)
+        ])
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+
+        plan = AppUser.objects.filter(email__istartswith="user1").explain()
+        self.assertIn(PREFIX_INDEXES[0][2], plan)
+
+
+class PurgeIdempotencyKeysTests(TestCase):
+
+    def test_only_expired_keys_are_removed(self):
+        now = timezone.now()
+        for key, age in (
+            ("old-1", IDEMPOTENCY_KEY_TTL + timedelta(minutes=1)),
+            ("old-2", IDEMPOTENCY_KEY_TTL + timedelta(hours=5)),
+            ("fresh", IDEMPOTENCY_KEY_TTL - timedelta(minutes=1)),
+        ):
+            IdempotencyRecord.objects.create(
+                scope="POST /api/test/", key=key, created_at=now - age
+            )
+
+        out = io.StringIO()
+        call_command("purge_idempotency_keys", batch_size=1, stdout=out)
+
+        self.assertEqual(
+            list(IdempotencyRecord.objects.values_list("key", flat=True)),
+            ["fresh"],
+        )
+        self.assertIn("Deleted 2", out.getvalue())
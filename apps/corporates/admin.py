@@ -1,8 +1,9 @@
 from django.contrib import admin
-from .models import Corporate
+from apps.core.admin import PrefixAutocompleteMixin
+from .models import Corporate, CorporateMonthlyUsage
 
 @admin.register(Corporate)
-class CorporateAdmin(admin.ModelAdmin):
+class CorporateAdmin(PrefixAutocompleteMixin, admin.ModelAdmin):
     list_display = (
         'name',
         'contact_email',
@@ -10,4 +11,39 @@ class CorporateAdmin(admin.ModelAdmin):
         'is_active',
     )
     list_filter = ('is_active',)
-    search_fields = ('name', 'contact_email')
\ No newline at end of file
+    search_fields = ('name', 'contact_email')
+    autocomplete_search_fields = ('name', 'contact_email')
+
+
+@admin.register(CorporateMonthlyUsage)
+class CorporateMonthlyUsageAdmin(admin.ModelAdmin):
+    """
+    Read-only: rows are maintained from booking changes
+    (rebuild with `manage.py rebuild_corporate_usage`).
+    """
+
+    list_display = (
+        'corporate',
+        'month',
+        'confirmed_sessions',
+        'confirmed_amount',
+        'completed_sessions',
+        'completed_amount',
+        'cancelled_sessions',
+        'cancelled_amount',
+    )
+    list_select_related = ('corporate',)
+    list_filter = ('month',)
+    date_hierarchy = 'month'
+    search_fields = ('corporate__name',)
+    # The month filter would otherwise count across the whole table
+    show_facets = admin.ShowFacets.NEVER
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from apps.corporates.services.usage import rebuild_usage
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild monthly corporate usage from the bookings table. "
+        "Needed once after deploying, and after bulk writes that bypass "
+        "model signals."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, **options):
+        months = rebuild_usage(using=options["database"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Rebuilt {months} corporate usage months."
+        ))
@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-19 16:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('corporates', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CorporateMonthlyUsage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('confirmed_sessions', models.IntegerField(default=0)),
+                ('confirmed_amount', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('completed_sessions', models.IntegerField(default=0)),
+                ('completed_amount', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('cancelled_sessions', models.IntegerField(default=0)),
+                ('cancelled_amount', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('corporate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_usage', to='corporates.corporate')),
+            ],
+            options={
+                'ordering': ['-month', 'corporate_id'],
+                'indexes': [models.Index(fields=['month'], name='corporate_usage_month_idx')],
+                'constraints': [models.UniqueConstraint(fields=('corporate', 'month'), name='corporate_monthly_usage_unique')],
+            },
+        ),
+    ]
@@ -12,4 +12,41 @@ class Corporate(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
 
     def __str__(self):
-        return self.name
\ No newline at end of file
+        return self.name
+
+class CorporateMonthlyUsage(models.Model):
+    """
+    Sessions per corporate per calendar month (of the session slot),
+    by where they ended up: confirmed, completed or cancelled.
+    Kept up to date by booking signals (apps/corporates/services/usage.py).
+    """
+
+    corporate = models.ForeignKey(
+        Corporate,
+        on_delete=models.CASCADE,
+        related_name="monthly_usage",
+    )
+    # First day of the month
+    month = models.DateField()
+
+    confirmed_sessions = models.IntegerField(default=0)
+    confirmed_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    completed_sessions = models.IntegerField(default=0)
+    completed_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    cancelled_sessions = models.IntegerField(default=0)
+    cancelled_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+
+    def __str__(self):
+        return f"{self.corporate} {self.month:%Y-%m}"
+
+    class Meta:
+        ordering = ["-month", "corporate_id"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["corporate", "month"],
+                name="corporate_monthly_usage_unique",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["month"], name="corporate_usage_month_idx"),
+        ]
@@ -1,8 +1,51 @@
+from datetime import date
+
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Corporate
+from .models import Corporate, CorporateMonthlyUsage
 
 
 class CorporateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Corporate
-        fields = "__all__"
\ No newline at end of file
+        fields = "__all__"
+
+
+class CorporateUsageQuerySerializer(serializers.Serializer):
+    """
+    ?start=YYYY-MM&end=YYYY-MM, inclusive; defaults to the last 12 months.
+    """
+
+    start = serializers.DateField(input_formats=["%Y-%m"], required=False)
+    end = serializers.DateField(input_formats=["%Y-%m"], required=False)
+
+    def validate(self, data):
+        end = data.get("end") or timezone.localdate().replace(day=1)
+        start = data.get("start")
+        if start is None:
+            year, month = divmod(end.year * 12 + end.month - 12, 12)
+            start = date(year, month + 1, 1)
+
+        if start > end:
+            raise serializers.ValidationError("start must not be after end")
+
+        return {"start": start, "end": end}
+
+
+class CorporateMonthlyUsageSerializer(serializers.ModelSerializer):
+    month = serializers.DateField(format="%Y-%m")
+    corporate_name = serializers.CharField(source="corporate.name")
+
+    class Meta:
+        model = CorporateMonthlyUsage
+        fields = (
+            "corporate",
+            "corporate_name",
+            "month",
+            "confirmed_sessions",
+            "confirmed_amount",
+            "completed_sessions",
+            "completed_amount",
+            "cancelled_sessions",
+            "cancelled_amount",
+        )
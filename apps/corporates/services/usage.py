@@ -0,0 +1,158 @@
+# apps/corporates/services/usage.py
+
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, DateField, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from apps.bookings.models import Booking
+from apps.bookings.utils.counters import add_to_counters
+from apps.corporates.models import CorporateMonthlyUsage
+
+# ─────────────────────────
+# CONFIG
+# ─────────────────────────
+# Booking status → CorporateMonthlyUsage column prefix
+USAGE_STATUSES = {
+    "CONFIRMED": "confirmed",
+    "COMPLETED": "completed",
+    "CANCELLED": "cancelled",
+}
+
+USAGE_COLUMNS = tuple(
+    f"{prefix}_{kind}"
+    for prefix in USAGE_STATUSES.values()
+    for kind in ("sessions", "amount")
+)
+
+
+def month_start(value):
+    """
+    First day of the local month of a datetime or date.
+    """
+    if hasattr(value, "tzinfo"):
+        value = timezone.localdate(value)
+    return value.replace(day=1)
+
+
+# ─────────────────────────
+# INCREMENTAL UPDATES
+# ─────────────────────────
+def _usage_contribution(values):
+    """
+    ((corporate_id, month), column prefix, amount) a booking adds, or
+    None. Only scheduled sessions count: a booking cancelled before it
+    had a slot never used one.
+    """
+    if (
+        not values
+        or values["status"] not in USAGE_STATUSES
+        or not values["corporate_id"]
+        or not values["approved_slot_start"]
+    ):
+        return None
+
+    return (
+        (values["corporate_id"], month_start(values["approved_slot_start"])),
+        USAGE_STATUSES[values["status"]],
+        values["amount"] or Decimal("0"),
+    )
+
+
+def apply_usage_delta(old, new, using="default"):
+    """
+    Moves one booking's usage between tracked value snapshots
+    (Booking.tracked_values()); either side may be None.
+    At most one UPDATE for each side that counts.
+    """
+    old_usage = _usage_contribution(old)
+    new_usage = _usage_contribution(new)
+    if old_usage == new_usage:
+        return
+
+    manager = CorporateMonthlyUsage.objects.using(using)
+    for usage, sign in ((old_usage, -1), (new_usage, 1)):
+        if usage is None:
+            continue
+        (corporate_id, month), prefix, amount = usage
+        add_to_counters(
+            manager,
+            {"corporate_id": corporate_id, "month": month},
+            {
+                f"{prefix}_sessions": sign,
+                f"{prefix}_amount": sign * amount,
+            },
+        )
+
+
+# ─────────────────────────
+# FULL REBUILD
+# ─────────────────────────
+def rebuild_usage(using="default"):
+    """
+    Recomputes every corporate month from the bookings table.
+    Needed once after deploying, and after bulk writes that skip signals.
+    """
+    rows = (
+        Booking.objects.using(using)
+        .filter(
+            corporate__isnull=False,
+            approved_slot_start__isnull=False,
+            status__in=USAGE_STATUSES,
+        )
+        .annotate(
+            month=TruncMonth("approved_slot_start", output_field=DateField())
+        )
+        .order_by()
+        .values("corporate_id", "month", "status")
+        .annotate(sessions=Count("id"), amount=Sum("amount"))
+    )
+
+    months = defaultdict(dict)
+    for row in rows:
+        prefix = USAGE_STATUSES[row["status"]]
+        counts = months[(row["corporate_id"], row["month"])]
+        counts[f"{prefix}_sessions"] = row["sessions"]
+        counts[f"{prefix}_amount"] = row["amount"] or Decimal("0")
+
+    with transaction.atomic(using=using):
+        CorporateMonthlyUsage.objects.using(using).all().delete()
+        CorporateMonthlyUsage.objects.using(using).bulk_create(
+            [
+                CorporateMonthlyUsage(
+                    corporate_id=corporate_id, month=month, **counts
+                )
+                for (corporate_id, month), counts in months.items()
+            ],
+            batch_size=1000,
+        )
+
+    return len(months)
+
+
+# ─────────────────────────
+# READS
+# ─────────────────────────
+def get_usage(start, end, corporate=None):
+    """
+    Usage rows for months start..end (inclusive), with the corporate
+    name joined in, plus column totals. Reads only the rollup table.
+    """
+    queryset = (
+        CorporateMonthlyUsage.objects
+        .filter(month__gte=month_start(start), month__lte=month_start(end))
+        .select_related("corporate")
+        .order_by("month", "corporate__name")
+    )
+    if corporate is not None:
+        queryset = queryset.filter(corporate=corporate)
+
+    rows = list(queryset)
+    totals = {
+        column: sum((getattr(row, column) for row in rows), 0)
+        for column in USAGE_COLUMNS
+    }
+    return rows, totals
@@ -1,3 +1,141 @@
-from django.test import TestCase
+import io
+from datetime import timedelta
+from decimal import Decimal
 
-# Create your tests here.
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.bookings.tests.base import AdminApiTestCase, make_booking
+from apps.corporates.models import CorporateMonthlyUsage
+from apps.corporates.services.usage import USAGE_COLUMNS, month_start
+
+
+class CorporateUsageTests(AdminApiTestCase):
+
+    def usage(self):
+        return {
+            row.month: row
+            for row in CorporateMonthlyUsage.objects.filter(
+                corporate=self.corporate
+            )
+        }
+
+    def confirmed_booking(self, **extra):
+        return make_booking(
+            self.new_user(),
+            status="CONFIRMED",
+            corporate=self.corporate,
+            **extra,
+        )
+
+    def test_transitions_move_sessions_between_columns(self):
+        booking = self.confirmed_booking()
+        month = month_start(booking.approved_slot_start)
+
+        row = self.usage()[month]
+        self.assertEqual(
+            (row.confirmed_sessions, row.confirmed_amount),
+            (1, Decimal("1500.00")),
+        )
+
+        booking.status = "COMPLETED"
+        booking.save(update_fields=["status"])
+
+        row.refresh_from_db()
+        self.assertEqual((row.confirmed_sessions, row.completed_sessions), (0, 1))
+        self.assertEqual(row.completed_amount, Decimal("1500.00"))
+
+    def test_unscheduled_and_private_bookings_are_not_counted(self):
+        make_booking(
+            self.new_user(),
+            status="CANCELLED",
+            corporate=self.corporate,
+            approved_slot_start=None,
+            approved_slot_end=None,
+        )
+        make_booking(self.new_user(), status="CONFIRMED")
+        make_booking(self.new_user(), status="PENDING", corporate=self.corporate)
+
+        self.assertEqual(self.usage(), {})
+
+    def test_reschedule_and_delete(self):
+        booking = self.confirmed_booking()
+        first = month_start(booking.approved_slot_start)
+
+        booking.approved_slot_start += timedelta(days=40)
+        booking.approved_slot_end += timedelta(days=40)
+        booking.save()
+
+        second = month_start(booking.approved_slot_start)
+        usage = self.usage()
+        self.assertEqual(usage[first].confirmed_sessions, 0)
+        self.assertEqual(usage[second].confirmed_sessions, 1)
+
+        booking.delete()
+        self.assertEqual(self.usage()[second].confirmed_sessions, 0)
+
+    def test_rebuild_matches_incremental_usage(self):
+        self.seed_rows(12)
+        self.confirmed_booking(amount=Decimal("900.00"))
+        cancelled = self.confirmed_booking()
+        cancelled.status = "CANCELLED"
+        cancelled.save()
+
+        def snapshot():
+            return sorted(
+                CorporateMonthlyUsage.objects.exclude(
+                    confirmed_sessions=0,
+                    completed_sessions=0,
+                    cancelled_sessions=0,
+                ).values_list("corporate", "month", *USAGE_COLUMNS)
+            )
+
+        incremental = snapshot()
+        self.assertTrue(incremental)
+
+        call_command("rebuild_corporate_usage", stdout=io.StringIO())
+
+        self.assertEqual(snapshot(), incremental)
+
+    def test_usage_api(self):
+        booking = self.confirmed_booking()
+        month = f"{booking.approved_slot_start:%Y-%m}"
+
+        response = self.client.get(
+            f"/api/corporates/{self.corporate.id}/usage/"
+            f"?start={month}&end={month}",
+            **self.auth,
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["months"][0]["month"], month)
+        self.assertEqual(data["months"][0]["confirmed_sessions"], 1)
+        self.assertEqual(data["totals"]["confirmed_amount"], "1500.00")
+
+    def test_usage_report_defaults_and_validation(self):
+        self.confirmed_booking(
+            approved_slot_start=timezone.now(),
+            approved_slot_end=timezone.now() + timedelta(hours=1),
+        )
+
+        response = self.client.get("/api/corporates/usage/", **self.auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["totals"]["confirmed_sessions"], 1)
+
+        response = self.client.get(
+            "/api/corporates/usage/?start=2026-05&end=2026-01", **self.auth
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_usage_report_query_count(self):
+        self.assertQueriesAtEachSize(
+            2,
+            perform=lambda _: self.client.get(
+                "/api/corporates/usage/", **self.auth
+            ),
+        )
+
+    def test_requires_admin(self):
+        response = self.client.get("/api/corporates/usage/")
+        self.assertEqual(response.status_code, 401)
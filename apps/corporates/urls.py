@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import CorporateUsageView, CorporateUsageReportView
+
+urlpatterns = [
+    path("usage/", CorporateUsageReportView.as_view()),
+    path("<int:corporate_id>/usage/", CorporateUsageView.as_view()),
+]
@@ -1,3 +1,59 @@
-from django.shortcuts import render
+from django.shortcuts import get_object_or_404
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAdminUser
 
-# Create your views here.
+from .models import Corporate
+from .serializers import (
+    CorporateMonthlyUsageSerializer,
+    CorporateUsageQuerySerializer,
+)
+from .services.usage import get_usage
+
+
+def _usage_response(params, corporate=None):
+    rows, totals = get_usage(params["start"], params["end"], corporate)
+
+    return Response({
+        "start": f"{params['start']:%Y-%m}",
+        "end": f"{params['end']:%Y-%m}",
+        "months": CorporateMonthlyUsageSerializer(rows, many=True).data,
+        "totals": {
+            column: str(value) if "amount" in column else value
+            for column, value in totals.items()
+        },
+    })
+
+
+class CorporateUsageView(APIView):
+    """
+    GET /api/corporates/<id>/usage/?start=YYYY-MM&end=YYYY-MM
+
+    Monthly confirmed / completed / cancelled sessions for billing.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, corporate_id):
+        corporate = get_object_or_404(Corporate, id=corporate_id)
+
+        serializer = CorporateUsageQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        return _usage_response(serializer.validated_data, corporate)
+
+
+class CorporateUsageReportView(APIView):
+    """
+    GET /api/corporates/usage/?start=YYYY-MM&end=YYYY-MM
+
+    Every corporate's monthly usage, e.g. for the month-end run.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        serializer = CorporateUsageQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        return _usage_response(serializer.validated_data)
@@ -2,10 +2,14 @@
 
 # Register your models here.
 from django.contrib import admin
+from django.urls import reverse
+from django.utils.html import format_html
+from apps.bookings.utils.tokens import make_feed_token
+from apps.core.admin import PrefixAutocompleteMixin
 from .models import Psychologist
 
 @admin.register(Psychologist)
-class PsychologistAdmin(admin.ModelAdmin):
+class PsychologistAdmin(PrefixAutocompleteMixin, admin.ModelAdmin):
     list_display = (
         'full_name',
         'email',
@@ -14,4 +18,18 @@ class PsychologistAdmin(admin.ModelAdmin):
         'is_active',
     )
     list_filter = ('specialization', 'is_active')
-    search_fields = ('full_name', 'email')
\ No newline at end of file
+    search_fields = ('full_name', 'email')
+    autocomplete_search_fields = ('full_name', 'email')
+    readonly_fields = ('calendar_feed',)
+
+    @admin.display(description='Calendar feed')
+    def calendar_feed(self, obj):
+        if not obj.pk:
+            return '-'
+        url = '{}?token={}'.format(
+            reverse('psychologist-calendar-feed', args=[obj.pk]),
+            make_feed_token(obj.pk),
+        )
+        return format_html(
+            '<a href="{}">Subscription link (.ics)</a>', url
+        )
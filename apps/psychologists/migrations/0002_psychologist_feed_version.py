@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-19 17:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('psychologists', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='psychologist',
+            name='feed_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
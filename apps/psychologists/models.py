@@ -27,5 +27,9 @@ class Psychologist(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Raised in the same transaction as any change to the sessions in
+    # the calendar feed; part of the feed cache key
+    feed_version = models.PositiveIntegerField(default=0, editable=False)
+
     def __str__(self):
         return f"{self.full_name} ({self.specialization})"
\ No newline at end of file
@@ -0,0 +1,11 @@
+from django.urls import path
+
+from .views import PsychologistCalendarFeedView
+
+urlpatterns = [
+    path(
+        "<int:psychologist_id>/calendar.ics",
+        PsychologistCalendarFeedView.as_view(),
+        name="psychologist-calendar-feed",
+    ),
+]
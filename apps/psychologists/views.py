@@ -1,3 +1,36 @@
-from django.shortcuts import render
+from django.http import Http404, HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+from django.views import View
 
-# Create your views here.
+from apps.bookings.services.calendar_feeds import get_psychologist_feed
+from apps.bookings.utils.tokens import check_feed_token
+
+# Calendar apps poll every few minutes; let them reuse the feed between
+FEED_MAX_AGE = 5 * 60
+
+
+class PsychologistCalendarFeedView(View):
+    """
+    A psychologist's sessions as an iCalendar subscription feed.
+
+    Plain Django view: calendar apps send Accept: text/calendar, which
+    DRF content negotiation would refuse. The signed token is the only
+    credential and needs no database; a cached feed costs one lookup
+    of the psychologist's feed version.
+    """
+
+    def get(self, request, psychologist_id):
+        if not check_feed_token(psychologist_id, request.GET.get("token", "")):
+            raise Http404
+
+        etag, body = get_psychologist_feed(psychologist_id)
+
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(
+                body, content_type="text/calendar; charset=utf-8"
+            )
+        response["ETag"] = etag
+        response["Cache-Control"] = f"private, max-age={FEED_MAX_AGE}"
+        return response
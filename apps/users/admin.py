@@ -1,9 +1,10 @@
 from django.contrib import admin
+from apps.core.admin import PrefixAutocompleteMixin
 from .models import AppUser
 
 
 @admin.register(AppUser)
-class AppUserAdmin(admin.ModelAdmin):
+class AppUserAdmin(PrefixAutocompleteMixin, admin.ModelAdmin):
     list_display = (
         "full_name",
         "email",
@@ -18,6 +19,13 @@ class AppUserAdmin(admin.ModelAdmin):
         "phone",
     )
 
+    # Booking form autocomplete (apps/core/search.py PREFIX_INDEXES)
+    autocomplete_search_fields = (
+        "email",
+        "full_name",
+        "phone",
+    )
+
     list_filter = (
         "is_verified",
         "created_at",
@@ -0,0 +1,47 @@
+# Generated by Django 6.0 on 2026-10-19 17:10
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_case_duplicates(apps, schema_editor):
+    # Users differing only in email case must be merged by hand first:
+    # their bookings belong to one person
+    AppUser = apps.get_model("users", "AppUser")
+    duplicates = list(
+        AppUser.objects.using(schema_editor.connection.alias)
+        .values(key=Lower("email"))
+        .annotate(total=Count("id"))
+        .filter(total__gt=1)
+        .values_list("key", flat=True)[:20]
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Users share an email in different letter case: "
+            + ", ".join(duplicates)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_appuser_last_admin_activity'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            check_case_duplicates,
+            migrations.RunPython.noop,
+        ),
+        migrations.AlterField(
+            model_name='appuser',
+            name='email',
+            field=models.EmailField(max_length=254),
+        ),
+        migrations.AddConstraint(
+            model_name='appuser',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='appuser_email_ci_unique', violation_error_message='A user with this email already exists.'),
+        ),
+    ]
@@ -1,12 +1,14 @@
 # users/models.py
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
 
 
 class AppUser(models.Model):
 
     full_name = models.CharField(max_length=120)
-    email = models.EmailField(unique=True)
+    # Unique regardless of letter case: see Meta.constraints
+    email = models.EmailField()
     phone = models.CharField(max_length=15)
 
     is_verified = models.BooleanField(default=False)
@@ -15,5 +17,14 @@ class AppUser(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     last_admin_activity = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                Lower("email"),
+                name="appuser_email_ci_unique",
+                violation_error_message="A user with this email already exists.",
+            ),
+        ]
+
     def __str__(self):
         return self.email
\ No newline at end of file
@@ -0,0 +1,112 @@
+# apps/users/services.py
+
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
+
+from apps.users.models import AppUser
+
+# What get_or_create_users keeps up to date on existing users
+USER_PROFILE_FIELDS = ("full_name", "phone")
+
+
+def normalize_email(email):
+    return (email or "").strip().lower()
+
+
+def _with_email_key(queryset=None):
+    # Lower(email) is what the case-insensitive unique index covers
+    queryset = AppUser.objects.all() if queryset is None else queryset
+    return queryset.annotate(email_key=Lower("email"))
+
+
+# ─────────────────────────
+# READS (never write)
+# ─────────────────────────
+def find_user(email):
+    """
+    The user with this email in any letter case, or None.
+    """
+    email = normalize_email(email)
+    if not email:
+        return None
+    return _with_email_key().filter(email_key=email).first()
+
+
+# ─────────────────────────
+# WRITES
+# ─────────────────────────
+def get_or_create_user(email, **defaults):
+    """
+    (user, created) by case-insensitive email. Safe against a
+    concurrent insert of the same address.
+    """
+    email = normalize_email(email)
+
+    user = find_user(email)
+    if user is not None:
+        return user, False
+
+    try:
+        with transaction.atomic():
+            return AppUser.objects.create(email=email, **defaults), True
+    except IntegrityError:
+        return find_user(email), False
+
+
+def get_or_create_users(rows):
+    """
+    Batched upsert: {normalized email: user id} for `rows` (dicts with
+    "email" and optionally "full_name" / "phone").
+
+    One SELECT; one UPDATE when existing users' names or phones
+    changed (blank values never overwrite stored ones); one INSERT and
+    one SELECT when some users are new.
+    """
+    by_email = {}
+    for row in rows:
+        # The first row of an address wins, as with get_or_create
+        by_email.setdefault(normalize_email(row["email"]), row)
+
+    found = {
+        user.email_key: user
+        for user in _with_email_key()
+        .filter(email_key__in=by_email)
+        .only("id", *USER_PROFILE_FIELDS)
+    }
+
+    changed = []
+    for email, user in found.items():
+        row = by_email[email]
+        updates = {
+            field: row[field]
+            for field in USER_PROFILE_FIELDS
+            if row.get(field) and row[field] != getattr(user, field)
+        }
+        if updates:
+            for field, value in updates.items():
+                setattr(user, field, value)
+            changed.append(user)
+    if changed:
+        AppUser.objects.bulk_update(changed, USER_PROFILE_FIELDS)
+
+    users = {email: user.id for email, user in found.items()}
+
+    missing = [
+        AppUser(
+            email=email,
+            full_name=row.get("full_name", ""),
+            phone=row.get("phone", ""),
+        )
+        for email, row in by_email.items()
+        if email not in users
+    ]
+    if missing:
+        # ignore_conflicts: a concurrent request may create the same user
+        AppUser.objects.bulk_create(missing, ignore_conflicts=True)
+        users.update(
+            _with_email_key()
+            .filter(email_key__in=[user.email for user in missing])
+            .values_list("email_key", "id")
+        )
+
+    return users
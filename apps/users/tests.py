@@ -1,3 +1,108 @@
+from unittest import mock
+
+from django.db import IntegrityError
 from django.test import TestCase
 
-# Create your tests here.
+from apps.users.models import AppUser
+from apps.users.services import (
+    find_user,
+    get_or_create_user,
+    get_or_create_users,
+)
+
+
+class CaseInsensitiveEmailTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = AppUser.objects.create(email="Asha.Rao@Example.com")
+
+    def test_email_is_unique_in_any_case(self):
+        with self.assertRaises(IntegrityError):
+            AppUser.objects.create(email="asha.rao@example.COM")
+
+    def test_lookups_ignore_case(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(find_user(" ASHA.rao@example.com "), self.user)
+
+        user, created = get_or_create_user("asha.rao@example.com")
+        self.assertEqual((user, created), (self.user, False))
+
+    def test_get_or_create_user_creates_normalized(self):
+        user, created = get_or_create_user(" New@Example.com", full_name="New")
+        self.assertTrue(created)
+        self.assertEqual(user.email, "new@example.com")
+
+    def test_batched_get_or_create(self):
+        rows = [
+            {"email": "asha.rao@example.com"},
+            {"email": "Ravi@example.com", "full_name": "Ravi"},
+            {"email": "ravi@example.com"},
+        ]
+        with self.assertNumQueries(3):
+            users = get_or_create_users(rows)
+
+        self.assertEqual(
+            users,
+            {
+                "asha.rao@example.com": self.user.id,
+                "ravi@example.com": AppUser.objects.get(full_name="Ravi").id,
+            },
+        )
+        self.assertEqual(AppUser.objects.count(), 2)
+
+    def test_batched_upsert_updates_existing_users(self):
+        AppUser.objects.filter(pk=self.user.pk).update(phone="1111111111")
+        rows = [
+            {"email": "ASHA.RAO@example.com", "full_name": "Asha Rao",
+             "phone": ""},
+            {"email": "new@example.com", "full_name": "New"},
+        ]
+        with self.assertNumQueries(4):
+            get_or_create_users(rows)
+
+        self.user.refresh_from_db()
+        # Blank values keep what is stored
+        self.assertEqual(
+            (self.user.full_name, self.user.phone), ("Asha Rao", "1111111111")
+        )
+
+        with self.assertNumQueries(1):
+            get_or_create_users(rows)
+
+
+class ReadOnlyStatusCheckTests(TestCase):
+
+    def test_unknown_email_does_not_create_a_user(self):
+        with self.assertNumQueries(1):
+            response = self.client.post(
+                "/api/bookings/check-status/",
+                {"email": "nobody@example.com"},
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.json()["has_booking"], False)
+        self.assertFalse(AppUser.objects.exists())
+
+    def test_draft_reuses_user_in_other_case(self):
+        user = AppUser.objects.create(email="Mixed@Example.com")
+
+        with mock.patch("apps.bookings.email._send_email", return_value=True):
+            response = self.client.post(
+                "/api/bookings/draft/",
+                {
+                    "email": "MIXED@example.com",
+                    "consent_given": True,
+                    "full_name": "Mixed Case",
+                    "phone_number": "9999999999",
+                    "city": "Surat",
+                    "mode": "ONLINE",
+                    "payment_mode": "ONLINE",
+                    "preferred_period": "MORNING",
+                },
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertEqual(AppUser.objects.count(), 1)
+        self.assertEqual(user.bookings.count(), 1)
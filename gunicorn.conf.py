@@ -0,0 +1,62 @@
+"""
+Gunicorn settings for MindSettler (picked up automatically when
+gunicorn starts from the project root: `gunicorn mindsettler.wsgi`).
+
+With preload (the default) the master imports and warms the app once
+and workers are forked from it, sharing that memory copy-on-write and
+answering their first request without an import pause. Set
+GUNICORN_PRELOAD=0 to load the app in each worker instead, e.g. to
+pick up code changes with a graceful reload (HUP).
+
+The booking lookup filter is opt-in (BOOKING_LOOKUP_FILTER and a
+BOOKING_LOOKUP_FILTER_PATH set in the environment, so cron commands on
+the host use the same file); when on, the master fills it once.
+"""
+
+import gc
+import os
+
+# ─────────────────────────────
+# WORKERS
+# ─────────────────────────────
+
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+
+preload_app = os.environ.get("GUNICORN_PRELOAD", "1") != "0"
+
+
+# ─────────────────────────────
+# HOOKS
+# ─────────────────────────────
+
+def when_ready(server):
+    if not server.cfg.preload_app:
+        return
+
+    # Import every view in the master too: the URLconf otherwise loads
+    # lazily in each worker on its first request
+    from django.urls import get_resolver
+
+    get_resolver().url_patterns
+
+    # Fill the lookup filter once, before any worker needs it (a no-op
+    # when it is not in use)
+    from apps.bookings.services.lookup_filter import rebuild_lookup_filter
+
+    rebuild_lookup_filter()
+
+    # Keep the garbage collector from touching (and so copying) the
+    # shared objects in every worker
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    if not server.cfg.preload_app:
+        return
+
+    # Connections opened while loading in the master must not be shared
+    from django.db import connections
+
+    connections.close_all()
+
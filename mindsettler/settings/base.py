@@ -39,6 +39,38 @@ if DEBUG:
 
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
 
+# Email links are signed tokens; raw UUID tokens from links sent
+# earlier keep working until this is switched off
+ACCEPT_LEGACY_BOOKING_TOKENS = (
+    os.getenv("ACCEPT_LEGACY_BOOKING_TOKENS", "true").lower() == "true"
+)
+
+# Bloom filter of issued acknowledgement IDs and payment references:
+# unknown ones are answered without a query. Off by default. Only
+# switch it on when every process that creates bookings (all web
+# workers and management commands) runs on one host with the same
+# BOOKING_LOOKUP_FILTER_PATH; without a path it stays off, and with
+# several hosts sharing the database it must stay off.
+BOOKING_LOOKUP_FILTER = (
+    os.getenv("BOOKING_LOOKUP_FILTER", "false").lower() == "true"
+)
+BOOKING_LOOKUP_FILTER_PATH = os.getenv("BOOKING_LOOKUP_FILTER_PATH", "")
+
+# Webhook signing secret per payment provider; a provider with no
+# secret rejects every webhook
+PAYMENT_WEBHOOK_SECRETS = {
+    "mock": os.getenv("MOCK_PAYMENT_WEBHOOK_SECRET", ""),
+}
+# Provider that issued payment references, for nightly reconciliation
+PAYMENT_PROVIDER = os.getenv("PAYMENT_PROVIDER", "mock")
+
+# How long before a confirmed session each reminder email goes out
+SESSION_REMINDER_OFFSETS = [
+    timedelta(hours=float(hours))
+    for hours in os.getenv("SESSION_REMINDER_HOURS", "24,1").split(",")
+    if hours.strip()
+]
+
 # ───────────────────────────────
 # CORS (Frontend ↔ Backend)
 # ───────────────────────────────
@@ -172,6 +204,16 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    # orjson when installed, stdlib json otherwise (apps/core/renderers.py)
+    "DEFAULT_RENDERER_CLASSES": (
+        "apps.core.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "apps.core.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
 
 SIMPLE_JWT = {
@@ -186,10 +228,50 @@ SIMPLE_JWT = {
 
 SESSION_COOKIE_HTTPONLY = True
 SESSION_COOKIE_SAMESITE = "Lax"
-SESSION_COOKIE_AGE = 60 * 10
+# Admin idle logout (10 min) is enforced by AdminActivityMiddleware;
+# the extra minute covers its coalesced last-seen writes
+SESSION_COOKIE_AGE = 60 * 11
 SESSION_EXPIRE_AT_BROWSER_CLOSE = True
 SESSION_SAVE_EVERY_REQUEST = False
 
+# Shared cache for every process and host: redis://, rediss:// (needs
+# the redis package) or memcache://host:port (needs pymemcache).
+# Unset means per-process memory, fine for a single process.
+CACHE_URL = os.getenv("CACHE_URL", "")
+
+CACHE_BACKENDS = {
+    "redis": "django.core.cache.backends.redis.RedisCache",
+    "rediss": "django.core.cache.backends.redis.RedisCache",
+    "memcache": "django.core.cache.backends.memcached.PyMemcacheCache",
+}
+
+if CACHE_URL:
+    scheme, _, address = CACHE_URL.partition("://")
+    if scheme not in CACHE_BACKENDS:
+        raise RuntimeError(f"Unsupported CACHE_URL scheme: {scheme}")
+    CACHES = {
+        "default": {
+            "BACKEND": CACHE_BACKENDS[scheme],
+            "LOCATION": address if scheme == "memcache" else CACHE_URL,
+        }
+    }
+else:
+    # Admin last-seen tracking and cached feeds: a lost entry falls
+    # back to the session copy / a rebuild
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# "db" (default), "cached_db" (reads served from the cache; needs
+# CACHE_URL, since a per-process cache would serve other workers'
+# stale or logged-out sessions) or "signed_cookies" (no session table)
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "db")
+if SESSION_BACKEND == "cached_db" and not CACHE_URL:
+    raise RuntimeError("SESSION_BACKEND=cached_db requires CACHE_URL")
+SESSION_ENGINE = "django.contrib.sessions.backends." + SESSION_BACKEND
+
 CSRF_COOKIE_HTTPONLY = False
 # ─────────────────────────────
 # JAZZMIN ADMIN THEME
@@ -233,6 +315,11 @@ JAZZMIN_SETTINGS = {
                 "url": "/admin/bookings/booking/calendar/list/",
                 "icon": "fas fa-list",
             },
+            {
+                "name": "Operations Dashboard",
+                "url": "/admin/bookings/booking/dashboard/",
+                "icon": "fas fa-chart-line",
+            },
         ]
     }
 }
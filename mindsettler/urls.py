@@ -29,5 +29,7 @@ urlpatterns = [
     path("api/health/", include("apps.core.urls")),
     path("api/users/", include("apps.users.urls")),
     path("api/bookings/", include("apps.bookings.urls")),
+    path("api/corporates/", include("apps.corporates.urls")),
+    path("api/psychologists/", include("apps.psychologists.urls")),
     path("api/chatbot/", include("apps.chatbot.urls")),
 ]